@@ -0,0 +1,69 @@
+import os
+import sys
+import argparse
+import tempfile
+# > Local Imports
+from .generator import Size, DEFAULT_SIZES, DEFAULT_SEED
+from .runner import Result, dump_results, load_results, merge_results, compare, format_table
+from .suite import BENCHMARKS, run_suite
+
+# ! Constants
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+# ! Methods
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description='Changelogger performance benchmarks.')
+    parser.add_argument('-s', '--size', dest='sizes', action='append', type=Size.parse, help='Workload as VERSIONSxCHANGES, can be repeated.')
+    parser.add_argument('-k', '--filter', dest='patterns', action='append', default=[], help='Run only benchmarks matching the glob.')
+    parser.add_argument('-r', '--repeat', type=int, default=5, help='Timed runs per benchmark.')
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED, help='Seed of the workload generator.')
+    parser.add_argument('--no-memory', dest='memory', action='store_false', help='Skip the peak memory runs.')
+    parser.add_argument('-o', '--output', default=None, help='Write the results as JSON.')
+    parser.add_argument('-b', '--baseline', default=DEFAULT_BASELINE, help='Baseline results to compare against.')
+    parser.add_argument('--save-baseline', action='store_true', help='Store the results as the new baseline.')
+    parser.add_argument('-t', '--tolerance', type=float, default=0.25, help='Allowed slowdown before a result counts as regressed.')
+    parser.add_argument('-l', '--list', action='store_true', help='List the benchmarks and exit.')
+    return parser.parse_args(argv)
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    if args.list:
+        for name, _ in BENCHMARKS:
+            print(name)
+        return 0
+    sizes = args.sizes or DEFAULT_SIZES
+    # * A missing baseline would compare against nothing and let every regression pass
+    if not (args.save_baseline or os.path.isfile(args.baseline)):
+        print(f'No baseline at {args.baseline}, run with --save-baseline to store one.', file=sys.stderr)
+        return 2
+    
+    def on_result(result: Result) -> None:
+        print(f'{result.name} [{result.size}]: {result.seconds * 1000:.2f} ms', file=sys.stderr)
+    
+    with tempfile.TemporaryDirectory(prefix='changelogger-bench-') as root:
+        results = run_suite(sizes, root, args.patterns, args.repeat, args.seed, args.memory, on_result)
+    meta = {'sizes': [str(size) for size in sizes], 'seed': args.seed, 'repeat': args.repeat}
+    if args.output is not None:
+        dump_results(args.output, results, meta)
+    baseline = load_results(args.baseline) if os.path.isfile(args.baseline) else []
+    comparisons = compare(results, baseline, args.tolerance)
+    print(format_table(comparisons))
+    over_budget = [
+        result for result in results
+        if result.extra.get('within_budget') is False
+    ]
+    for result in over_budget:
+        print(f"{result.name}: took {result.extra['measured_seconds'] * 1000:.1f} ms, budget is {result.extra['budget_seconds'] * 1000:.0f} ms")
+    if args.save_baseline:
+        dump_results(args.baseline, merge_results(baseline, results), meta)
+        return 1 if (len(over_budget) > 0) else 0
+    # * A benchmark without a baseline entry would pass whatever it measures
+    unmatched = [comparison.result for comparison in comparisons if comparison.baseline is None]
+    for result in unmatched:
+        print(f"{result.name} [{result.size}]: not in the baseline, run it with --save-baseline to add it")
+    failed = any(comparison.regressed for comparison in comparisons) or (len(over_budget) > 0) or (len(unmatched) > 0)
+    return 1 if failed else 0
+
+# ! Start
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,99 @@
+import random
+# > PyYAML
+import yaml
+try:
+    from yaml import CDumper as Dumper
+except:
+    from yaml import Dumper
+# > Typing
+from typing import NamedTuple, Optional, Dict, List, Any
+# > Local Imports
+from changelogger.units import DEFAULT_CHANGE_TYPES, DEFAULT_EXPORTER, DEFAULT_MARKDOWN_EXTRA
+
+# ! Constants
+BASE_DATE = 1262304000.0
+DEFAULT_SEED = 440
+WORDS = (
+    'parser', 'exporter', 'cache', 'journal', 'version', 'change', 'index', 'template',
+    'markdown', 'table', 'date', 'url', 'tag', 'release', 'loader', 'writer', 'option',
+    'command', 'output', 'input', 'record', 'memory', 'speed', 'error', 'warning', 'format'
+)
+VERBS = ('Added', 'Removed', 'Fixed', 'Updated', 'Deprecated', 'Refactored', 'Improved', 'Reworked')
+
+# ! Size
+class Size(NamedTuple):
+    versions: int
+    changes: int
+    
+    def __str__(self) -> str:
+        return f'{self.versions}x{self.changes}'
+    
+    @classmethod
+    def parse(cls, value: str) -> 'Size':
+        versions, _, changes = value.lower().partition('x')
+        return cls(int(versions), int(changes or 10))
+
+DEFAULT_SIZES = [Size(10, 100), Size(1000, 20), Size(10000, 10)]
+
+# ! Methods
+def version_name(idx: int) -> str:
+    return f'{idx // 100}.{(idx // 10) % 10}.{idx % 10}'
+
+def description(rng: random.Random) -> str:
+    return ' '.join([rng.choice(VERBS)] + rng.sample(WORDS, rng.randint(2, 6)))
+
+def generate_version(rng: random.Random, idx: int, changes: int) -> Dict[str, Any]:
+    change_types = list(DEFAULT_CHANGE_TYPES)
+    version = version_name(idx)
+    return {
+        'version': version,
+        'date': BASE_DATE + idx * 86400.0 + rng.randint(0, 3600),
+        'url': f'https://example.com/releases/v{version}',
+        'tag': 'release' if rng.random() < 0.9 else 'beta',
+        'changes': sorted(
+            (
+                {'type': rng.choice(change_types), 'description': description(rng)}
+                for _ in range(rng.randint(1, changes))
+            ),
+            key=lambda change: change['type']
+        )
+    }
+
+def generate(size: Size, seed: int=DEFAULT_SEED) -> Dict[str, Any]:
+    rng = random.Random(f'{seed}:{size}')
+    versions = {}
+    for idx in range(size.versions):
+        version = generate_version(rng, idx, size.changes)
+        versions[version['version']] = version
+    return {
+        'exporters_extra': {DEFAULT_EXPORTER: dict(DEFAULT_MARKDOWN_EXTRA)},
+        'change_types': dict(DEFAULT_CHANGE_TYPES),
+        'change_order': 'type-text',
+        'versions': versions
+    }
+
+def generate_records(size: Size, count: int, seed: int=DEFAULT_SEED) -> List[Dict[str, Any]]:
+    rng = random.Random(f'{seed}:{size}:records')
+    change_types = list(DEFAULT_CHANGE_TYPES)
+    return [
+        {
+            'kind': 'change',
+            'version': version_name(rng.randrange(size.versions)),
+            'type': rng.choice(change_types),
+            'description': description(rng)
+        }
+        for _ in range(count)
+    ]
+
+def count_changes(data: Dict[str, Any]) -> int:
+    return sum(len(version['changes']) for version in data['versions'].values())
+
+def write_changelog(filepath: str, data: Dict[str, Any]) -> None:
+    content = yaml.dump(data, Dumper=Dumper, sort_keys=False)
+    with open(filepath, 'w') as file:
+        file.write(content)
+
+def generate_changelog(filepath: str, size: Size, seed: int=DEFAULT_SEED, data: Optional[Dict[str, Any]]=None) -> Dict[str, Any]:
+    data = data or generate(size, seed)
+    write_changelog(filepath, data)
+    return data
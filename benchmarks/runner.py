@@ -0,0 +1,220 @@
+import os
+import sys
+import json
+import time
+import platform
+import statistics
+import subprocess
+import tempfile
+import tracemalloc
+# > Typing
+from typing import NamedTuple, Callable, Optional, Sequence, Tuple, Dict, List, Any
+
+# ! Type Alias
+ResultKey = Tuple[str, str]
+
+# ! Constants
+PEAK_ENV = 'CHANGELOGGER_BENCH_PEAK'
+# * Runs "-m module ..." or "-c code ..." and reports the peak RSS of the process on exit.
+# * The rusage of a waited child is not used, since on Linux it inherits the parent's high-water mark.
+PEAK_PROBE = '''
+import os, sys, atexit, runpy
+
+def report():
+    peak = ''
+    try:
+        with open('/proc/self/status') as file:
+            for line in file:
+                if line.startswith('VmHWM:'):
+                    peak = str(int(line.split()[1]) * 1024)
+    except OSError:
+        try:
+            import resource
+            peak = str(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * (1 if sys.platform == 'darwin' else 1024))
+        except ImportError:
+            pass
+    with open(os.environ[%r], 'w') as file:
+        file.write(peak)
+
+atexit.register(report)
+mode, target, *args = sys.argv[1:]
+if mode == '-m':
+    sys.argv = [target, *args]
+    runpy.run_module(target, run_name='__main__', alter_sys=True)
+else:
+    sys.argv = ['-c', *args]
+    exec(compile(target, '<string>', 'exec'), {'__name__': '__main__'})
+''' % PEAK_ENV
+
+# ! Result
+class Result(NamedTuple):
+    name: str
+    size: str
+    seconds: float
+    min_seconds: float
+    ops: int
+    peak_bytes: Optional[int]
+    extra: Dict[str, Any]={}
+    
+    @property
+    def key(self) -> ResultKey:
+        return self.name, self.size
+    
+    @property
+    def ops_per_second(self) -> float:
+        return (self.ops / self.seconds) if self.seconds > 0 else 0.0
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'name': self.name,
+            'size': self.size,
+            'seconds': self.seconds,
+            'min_seconds': self.min_seconds,
+            'ops': self.ops,
+            'ops_per_second': self.ops_per_second,
+            'peak_bytes': self.peak_bytes,
+            'extra': self.extra
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Result':
+        return cls(
+            data['name'], data['size'], data['seconds'], data.get('min_seconds', data['seconds']),
+            data.get('ops', 1), data.get('peak_bytes'), data.get('extra') or {}
+        )
+
+# ! Comparison
+class Comparison(NamedTuple):
+    result: Result
+    baseline: Optional[Result]
+    time_ratio: Optional[float]
+    memory_ratio: Optional[float]
+    regressed: bool
+
+# ! Measurement Methods
+def measure(
+    run: Callable[[Any], Any],
+    setup: Callable[[], Any]=lambda: None,
+    repeat: int=5,
+    memory: bool=True
+) -> Tuple[List[float], Optional[int]]:
+    timings = []
+    for _ in range(repeat):
+        state = setup()
+        start = time.perf_counter()
+        run(state)
+        timings.append(time.perf_counter() - start)
+    peak = None
+    if memory:
+        state = setup()
+        tracemalloc.start()
+        try:
+            run(state)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return timings, peak
+
+def measure_process(args: Sequence[str], repeat: int=5, env: Optional[Dict[str, str]]=None) -> Tuple[List[float], Optional[int]]:
+    timings, peak = [], None
+    env = dict(os.environ if env is None else env)
+    fd, peakpath = tempfile.mkstemp(prefix='changelogger-peak-')
+    os.close(fd)
+    env[PEAK_ENV] = peakpath
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            subprocess.run(
+                [sys.executable, '-c', PEAK_PROBE, *args],
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, env=env, check=True
+            )
+            timings.append(time.perf_counter() - start)
+            with open(peakpath, 'r') as file:
+                value = file.read().strip()
+            if len(value) > 0:
+                peak = max(peak or 0, int(value))
+    finally:
+        os.remove(peakpath)
+    return timings, peak
+
+def make_result(
+    name: str,
+    size: str,
+    timings: List[float],
+    peak: Optional[int],
+    ops: int=1,
+    **extra: Any
+) -> Result:
+    return Result(name, size, statistics.median(timings), min(timings), ops, peak, extra)
+
+# ! Report Methods
+def environment() -> Dict[str, Any]:
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'time': time.time()
+    }
+
+def dump_results(filepath: str, results: List[Result], meta: Dict[str, Any]={}) -> None:
+    temppath = filepath + '.tmp'
+    with open(temppath, 'w', encoding='utf-8') as file:
+        json.dump(
+            {'environment': environment(), 'meta': meta, 'results': [result.to_dict() for result in results]},
+            file, indent=2
+        )
+    os.replace(temppath, filepath)
+
+def load_results(filepath: str) -> List[Result]:
+    with open(filepath, 'r', encoding='utf-8') as file:
+        return [Result.from_dict(result) for result in json.load(file)['results']]
+
+def merge_results(baseline: List[Result], results: List[Result]) -> List[Result]:
+    # * A filtered run only replaces its own entries, the rest of the baseline stays
+    merged = {result.key: result for result in baseline}
+    merged.update((result.key, result) for result in results)
+    return list(merged.values())
+
+def compare(results: List[Result], baseline: List[Result], tolerance: float=0.25) -> List[Comparison]:
+    baselines = {result.key: result for result in baseline}
+    comparisons = []
+    for result in results:
+        base = baselines.get(result.key)
+        time_ratio = memory_ratio = None
+        if (base is not None) and (base.seconds > 0):
+            time_ratio = result.seconds / base.seconds
+        if (base is not None) and base.peak_bytes and (result.peak_bytes is not None):
+            memory_ratio = result.peak_bytes / base.peak_bytes
+        regressed = any((ratio is not None) and (ratio > 1 + tolerance) for ratio in (time_ratio, memory_ratio))
+        comparisons.append(Comparison(result, base, time_ratio, memory_ratio, regressed))
+    return comparisons
+
+def format_bytes(value: Optional[int]) -> str:
+    if value is None:
+        return '-'
+    for unit in ('B', 'KiB', 'MiB'):
+        if value < 1024:
+            return f'{value:.0f} {unit}'
+        value /= 1024
+    return f'{value:.1f} GiB'
+
+def format_ratio(value: Optional[float]) -> str:
+    return '-' if value is None else f'{value:.2f}x'
+
+def format_table(comparisons: List[Comparison]) -> str:
+    rows = [('benchmark', 'size', 'median', 'ops/s', 'peak', 'time', 'memory', '')]
+    for comparison in comparisons:
+        result = comparison.result
+        rows.append((
+            result.name, result.size,
+            f'{result.seconds * 1000:.2f} ms', f'{result.ops_per_second:.1f}',
+            format_bytes(result.peak_bytes),
+            format_ratio(comparison.time_ratio), format_ratio(comparison.memory_ratio),
+            'REGRESSED' if comparison.regressed else ''
+        ))
+    widths = [max(len(row[idx]) for row in rows) for idx in range(len(rows[0]))]
+    return '\n'.join(
+        '  '.join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip()
+        for row in rows
+    )
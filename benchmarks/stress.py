@@ -0,0 +1,83 @@
+import os
+import sys
+import time
+import argparse
+import tempfile
+import subprocess
+import multiprocessing
+# > Typing
+from typing import Tuple, List
+# > Local Imports
+from changelogger import ChangelogFile
+from .suite import cli_env
+
+# ! Constants
+MODES = ('optimistic', 'lock', 'journal', 'cli', 'cli-lock', 'unsafe')
+VERSION = '1.0.0'
+
+# ! Methods
+def description(worker: int, idx: int) -> str:
+    return f'worker {worker} change {idx}'
+
+def worker(filepath: str, mode: str, worker_idx: int, count: int, barrier) -> None:
+    barrier.wait()
+    if mode in ('cli', 'cli-lock'):
+        env = cli_env()
+        options = ['--lock'] if mode == 'cli-lock' else []
+        for idx in range(count):
+            subprocess.run(
+                [sys.executable, '-m', 'changelogger.cli', '-f', filepath, *options, 'change', 'add', VERSION, 'add', description(worker_idx, idx)],
+                env=env, check=True, stdout=subprocess.DEVNULL
+            )
+        return
+    # * One long-lived instance per worker, so that most writes start from a stale state
+    changelog = ChangelogFile(filepath, merge=(mode != 'unsafe'), journal=(mode == 'journal'))
+    for idx in range(count):
+        if mode == 'lock':
+            with changelog.locked():
+                changelog.add_change(VERSION, 'add', description(worker_idx, idx))
+        else:
+            changelog.add_change(VERSION, 'add', description(worker_idx, idx))
+
+def run(mode: str, workers: int, count: int, sharded: bool=False) -> Tuple[int, int, float]:
+    with tempfile.TemporaryDirectory(prefix='changelogger-stress-') as root:
+        filepath = os.path.join(root, 'changelog.d' if sharded else 'changelog.yaml')
+        ChangelogFile(filepath).add_version(VERSION, time.time(), '', 'release')
+        barrier = multiprocessing.Barrier(workers)
+        processes = [
+            multiprocessing.Process(target=worker, args=(filepath, mode, idx, count, barrier))
+            for idx in range(workers)
+        ]
+        start = time.perf_counter()
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+        elapsed = time.perf_counter() - start
+        failed = [process for process in processes if process.exitcode != 0]
+        if len(failed) > 0:
+            raise RuntimeError(f'{len(failed)} workers failed.')
+        changes = ChangelogFile(filepath, cache=False, strict=True, journal=(mode == 'journal')).data.versions[VERSION].changes
+        expected = {description(worker_idx, idx) for worker_idx in range(workers) for idx in range(count)}
+        found = {change.description for change in changes}
+        return len(expected & found), len(expected), elapsed
+
+def main(argv: List[str]=None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.stress', description='Concurrent writers stress check.')
+    parser.add_argument('-m', '--mode', dest='modes', action='append', choices=MODES, help='Writer mode, can be repeated.')
+    parser.add_argument('-w', '--workers', type=int, default=8, help='Number of writer processes.')
+    parser.add_argument('-n', '--count', type=int, default=25, help='Changes added by each writer.')
+    parser.add_argument('-s', '--sharded', action='store_true', help='Use a directory with one file per version.')
+    args = parser.parse_args(argv)
+    ok = True
+    for mode in args.modes or ['optimistic', 'lock']:
+        found, expected, elapsed = run(mode, args.workers, args.count, args.sharded)
+        lost = expected - found
+        print(f'{mode}: {found}/{expected} changes kept, {lost} lost, {elapsed:.2f} s')
+        # * The unsafe mode shows what is lost without merging, so it never fails the check
+        ok = ok and ((lost == 0) or (mode == 'unsafe'))
+    return 0 if ok else 1
+
+# ! Start
+if __name__ == '__main__':
+    sys.exit(main())
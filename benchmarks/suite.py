@@ -0,0 +1,425 @@
+import os
+import sys
+import time
+import shutil
+import subprocess
+from contextlib import contextmanager
+from fnmatch import fnmatch
+# > Typing
+from typing import Callable, Iterator, Optional, Sequence, Tuple, Dict, List, Any
+# > Local Imports
+from changelogger import ChangelogFile, VersionFilter
+from changelogger.models import Version
+from changelogger.exporter import MarkdownTableExporter
+from changelogger.cli.client import SOCKET_ENV, DAEMON_DISABLE_ENV
+from .generator import Size, generate, generate_records, count_changes, write_changelog, DEFAULT_SEED
+from .runner import Result, measure, measure_process, make_result
+
+# ! Type Alias
+BenchmarkMethod = Callable[['Workload', int], List[Result]]
+
+# ! Constants
+ROOT_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MUTATION_OPS = 10
+BULK_RECORDS = 1000
+DEFAULT_IMPORT_BUDGET = 0.15
+# * Time a forwarded command may add on top of the interpreter startup
+DEFAULT_DAEMON_BUDGET = 0.05
+DAEMON_START_TIMEOUT = 30.0
+
+# ! Vars
+BENCHMARKS: List[Tuple[str, BenchmarkMethod]] = []
+
+# ! Workload
+class Workload:
+    def __init__(self, size: Size, root: str, seed: int=DEFAULT_SEED, memory: bool=True) -> None:
+        self.size = size
+        self.root = os.path.join(root, str(size))
+        self.memory = memory
+        self.data = generate(size, seed)
+        self.changes = count_changes(self.data)
+        self.records = generate_records(size, BULK_RECORDS, seed)
+        self.source = os.path.join(self.root, 'source.yaml')
+        os.makedirs(self.root, exist_ok=True)
+        write_changelog(self.source, self.data)
+        self.__counter = 0
+        self.__current: Optional[str] = None
+        self.__sharded: Optional[str] = None
+    
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self.size}, {self.changes} changes)'
+    
+    def fresh(self) -> str:
+        if self.__current is not None:
+            shutil.rmtree(self.__current, ignore_errors=True)
+        self.__counter += 1
+        self.__current = os.path.join(self.root, f'run-{self.__counter}')
+        os.makedirs(self.__current)
+        filepath = os.path.join(self.__current, 'changelog.yaml')
+        shutil.copyfile(self.source, filepath)
+        return filepath
+    
+    def fresh_sharded(self) -> str:
+        if self.__sharded is None:
+            self.__sharded = os.path.join(self.root, 'source.d')
+            ChangelogFile(self.source, cache=False).save_as(self.__sharded)
+        dirpath = os.path.join(os.path.dirname(self.fresh()), 'changelog.d')
+        shutil.copytree(self.__sharded, dirpath)
+        return dirpath
+    
+    def output(self, filepath: str) -> str:
+        return os.path.join(os.path.dirname(filepath), 'CHANGELOG.md')
+    
+    def measure(self, run: Callable[[Any], Any], setup: Callable[[], Any]=lambda: None, repeat: int=5):
+        return measure(run, setup, repeat, self.memory)
+
+# ! Methods
+def benchmark(name: str) -> Callable[[BenchmarkMethod], BenchmarkMethod]:
+    def wrapper(method: BenchmarkMethod) -> BenchmarkMethod:
+        BENCHMARKS.append((name, method))
+        return method
+    return wrapper
+
+def selected(patterns: Sequence[str]=()) -> List[Tuple[str, BenchmarkMethod]]:
+    if len(patterns) == 0:
+        return list(BENCHMARKS)
+    return [(name, method) for name, method in BENCHMARKS if any(fnmatch(name, pattern) for pattern in patterns)]
+
+def cli_env(socket_path: Optional[str]=None) -> Dict[str, str]:
+    # * Commands run in-process unless a socket of a benchmark daemon is given
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [ROOT_PATH, env.get('PYTHONPATH')]))
+    if socket_path is None:
+        env[DAEMON_DISABLE_ENV] = '1'
+    else:
+        env.pop(DAEMON_DISABLE_ENV, None)
+        env[SOCKET_ENV] = socket_path
+    return env
+
+@contextmanager
+def running_daemon(env: Dict[str, str]) -> Iterator[subprocess.Popen]:
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'changelogger.cli', 'serve'],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, env=env
+    )
+    try:
+        deadline = time.monotonic() + DAEMON_START_TIMEOUT
+        while not os.path.exists(env[SOCKET_ENV]):
+            if (process.poll() is not None) or (time.monotonic() >= deadline):
+                raise RuntimeError('The daemon did not start.')
+            time.sleep(0.05)
+        yield process
+    finally:
+        process.terminate()
+        process.wait()
+
+def cli_args(filepath: str, *args: str) -> List[str]:
+    return ['-m', 'changelogger.cli', '-f', filepath, *args]
+
+def run_suite(
+    sizes: Sequence[Size],
+    root: str,
+    patterns: Sequence[str]=(),
+    repeat: int=5,
+    seed: int=DEFAULT_SEED,
+    memory: bool=True,
+    on_result: Callable[[Result], None]=lambda result: None
+) -> List[Result]:
+    results = []
+    benchmarks = selected(patterns)
+    for size in sizes:
+        workload = Workload(size, root, seed, memory)
+        for _, method in benchmarks:
+            for result in method(workload, repeat):
+                results.append(result)
+                on_result(result)
+    return results
+
+# ! Benchmarks > Load
+@benchmark('load.strict')
+def load_strict(workload: Workload, repeat: int) -> List[Result]:
+    timings, peak = workload.measure(
+        lambda filepath: ChangelogFile(filepath, cache=False, strict=True),
+        workload.fresh, repeat
+    )
+    return [make_result('load.strict', str(workload.size), timings, peak, changes=workload.changes)]
+
+@benchmark('load.lazy')
+def load_lazy(workload: Workload, repeat: int) -> List[Result]:
+    timings, peak = workload.measure(
+        lambda filepath: ChangelogFile(filepath, cache=False, lazy=True),
+        workload.fresh, repeat
+    )
+    return [make_result('load.lazy', str(workload.size), timings, peak, changes=workload.changes)]
+
+@benchmark('load.cached')
+def load_cached(workload: Workload, repeat: int) -> List[Result]:
+    def setup() -> str:
+        filepath = workload.fresh()
+        ChangelogFile(filepath, cache=True)
+        return filepath
+    
+    timings, peak = workload.measure(lambda filepath: ChangelogFile(filepath, cache=True), setup, repeat)
+    return [make_result('load.cached', str(workload.size), timings, peak, changes=workload.changes)]
+
+@benchmark('load.sharded')
+def load_sharded(workload: Workload, repeat: int) -> List[Result]:
+    timings, peak = workload.measure(ChangelogFile, workload.fresh_sharded, repeat)
+    return [make_result('load.sharded', str(workload.size), timings, peak, changes=workload.changes)]
+
+# ! Benchmarks > Mutations
+@benchmark('mutate.add_change')
+def mutate_add_change(workload: Workload, repeat: int) -> List[Result]:
+    version = next(iter(workload.data['versions']))
+    
+    def run(changelog: ChangelogFile) -> None:
+        for idx in range(MUTATION_OPS):
+            changelog.add_change(version, 'add', f'Benchmark change {idx}')
+    
+    timings, peak = workload.measure(run, lambda: ChangelogFile(workload.fresh(), cache=False), repeat)
+    return [make_result('mutate.add_change', str(workload.size), timings, peak, MUTATION_OPS)]
+
+@benchmark('mutate.add_version')
+def mutate_add_version(workload: Workload, repeat: int) -> List[Result]:
+    def run(changelog: ChangelogFile) -> None:
+        for idx in range(MUTATION_OPS):
+            changelog.add_version(f'{workload.size.versions}.0.{idx}', 0.0, '', 'release')
+    
+    timings, peak = workload.measure(run, lambda: ChangelogFile(workload.fresh(), cache=False), repeat)
+    return [make_result('mutate.add_version', str(workload.size), timings, peak, MUTATION_OPS)]
+
+@benchmark('mutate.add_change.sharded')
+def mutate_add_change_sharded(workload: Workload, repeat: int) -> List[Result]:
+    version = next(iter(workload.data['versions']))
+    
+    def run(changelog: ChangelogFile) -> None:
+        for idx in range(MUTATION_OPS):
+            changelog.add_change(version, 'add', f'Benchmark change {idx}')
+    
+    timings, peak = workload.measure(run, lambda: ChangelogFile(workload.fresh_sharded()), repeat)
+    return [make_result('mutate.add_change.sharded', str(workload.size), timings, peak, MUTATION_OPS)]
+
+@benchmark('mutate.bulk_add')
+def mutate_bulk_add(workload: Workload, repeat: int) -> List[Result]:
+    timings, peak = workload.measure(
+        lambda changelog: changelog.bulk_add(workload.records, atomic=True),
+        lambda: ChangelogFile(workload.fresh(), cache=False), repeat
+    )
+    return [make_result('mutate.bulk_add', str(workload.size), timings, peak, len(workload.records))]
+
+# ! Benchmarks > Export
+@benchmark('export.render')
+def export_render(workload: Workload, repeat: int) -> List[Result]:
+    def run(changelog: ChangelogFile) -> None:
+        exporter = MarkdownTableExporter()
+        for version in changelog.data.versions.values():
+            exporter.render_row(version, changelog.data.change_types)
+    
+    filepath = workload.fresh()
+    changelog = ChangelogFile(filepath, cache=False)
+    timings, peak = workload.measure(run, lambda: changelog, repeat)
+    return [make_result('export.render', str(workload.size), timings, peak, workload.size.versions)]
+
+@benchmark('export.cold')
+def export_cold(workload: Workload, repeat: int) -> List[Result]:
+    def setup() -> Tuple[ChangelogFile, str]:
+        filepath = workload.fresh()
+        return ChangelogFile(filepath, cache=False), workload.output(filepath)
+    
+    def run(state: Tuple[ChangelogFile, str]) -> None:
+        changelog, output = state
+        MarkdownTableExporter().export(output, changelog.data)
+    
+    timings, peak = workload.measure(run, setup, repeat)
+    return [make_result('export.cold', str(workload.size), timings, peak, workload.size.versions)]
+
+@benchmark('export.warm')
+def export_warm(workload: Workload, repeat: int) -> List[Result]:
+    def setup() -> Tuple[ChangelogFile, str]:
+        filepath = workload.fresh()
+        changelog = ChangelogFile(filepath, cache=False)
+        MarkdownTableExporter().export(workload.output(filepath), changelog.data)
+        return changelog, workload.output(filepath)
+    
+    def run(state: Tuple[ChangelogFile, str]) -> None:
+        changelog, output = state
+        MarkdownTableExporter().export(output, changelog.data)
+    
+    timings, peak = workload.measure(run, setup, repeat)
+    return [make_result('export.warm', str(workload.size), timings, peak, workload.size.versions)]
+
+@benchmark('export.last')
+def export_last(workload: Workload, repeat: int) -> List[Result]:
+    selection = VersionFilter(last=1)
+    
+    def setup() -> Tuple[ChangelogFile, str]:
+        filepath = workload.fresh()
+        changelog = ChangelogFile(filepath, cache=False)
+        changelog.versions_index
+        return changelog, workload.output(filepath)
+    
+    def run(state: Tuple[ChangelogFile, str]) -> None:
+        changelog, output = state
+        changelog.export(output, selection=selection)
+    
+    timings, peak = workload.measure(run, setup, repeat)
+    results = [make_result('export.last', str(workload.size), timings, peak)]
+    # * Including the load, where only the exported version is ever materialized
+    for name, fresh, options in (
+        ('export.last.lazy', workload.fresh, {'cache': False, 'lazy': True}),
+        ('export.last.sharded', workload.fresh_sharded, {})
+    ):
+        def run_loaded(filepath: str) -> None:
+            ChangelogFile(filepath, **options).export(workload.output(filepath), selection=selection)
+    
+        timings, peak = workload.measure(run_loaded, fresh, repeat)
+        results.append(make_result(name, str(workload.size), timings, peak))
+    return results
+
+# ! Benchmarks > Search
+@benchmark('search')
+def search(workload: Workload, repeat: int) -> List[Result]:
+    oldest = next(iter(workload.data['versions']))
+    common = VersionFilter()
+    
+    def loaded() -> ChangelogFile:
+        changelog = ChangelogFile(workload.fresh(), cache=False)
+        changelog.versions_index
+        return changelog
+    
+    def indexed() -> ChangelogFile:
+        changelog = loaded()
+        changelog.search('')
+        changelog.add_change(oldest, 'fix', 'Fixed benchmark needle')
+        changelog.search('needle')
+        return changelog
+    
+    def reopened() -> ChangelogFile:
+        filepath = indexed().filepath
+        changelog = ChangelogFile(filepath, cache=False)
+        changelog.versions_index
+        return changelog
+    
+    def updated() -> ChangelogFile:
+        changelog = indexed()
+        changelog.add_change(oldest, 'add', 'Added benchmark haystack')
+        return changelog
+    
+    def written() -> ChangelogFile:
+        # * Another process wrote since the index was saved, as every CLI write does
+        filepath = indexed().filepath
+        ChangelogFile(filepath, cache=False).add_change(oldest, 'add', 'Added benchmark haystack')
+        changelog = ChangelogFile(filepath, cache=False)
+        changelog.versions_index
+        return changelog
+    
+    results = []
+    # * Building from scratch, loading the saved index, reindexing one changed version, following a write of another process, then the queries alone
+    for name, setup, query, limit in (
+        ('search.build', loaded, 'needle', None),
+        ('search.load', reopened, 'needle', None),
+        ('search.update', updated, 'haystack', None),
+        ('search.written', written, 'haystack', None),
+        ('search.query', indexed, 'benchmark needle', None),
+        ('search.query.common', indexed, 'memory cache', 20)
+    ):
+        timings, peak = workload.measure(lambda changelog: changelog.search(query, common, limit), setup, repeat)
+        results.append(make_result(name, str(workload.size), timings, peak, changes=workload.changes))
+    return results
+
+# ! Benchmarks > Memory
+@benchmark('memory.models')
+def memory_models(workload: Workload, repeat: int) -> List[Result]:
+    results = []
+    versions = workload.data['versions']
+    for name, factory in (('memory.pydantic', Version.model_validate), ):
+        timings, peak = measure(
+            lambda _: {key: factory(version) for key, version in versions.items()},
+            repeat=repeat
+        )
+        per_change = (peak / workload.changes) if workload.changes > 0 else None
+        results.append(make_result(name, str(workload.size), timings, peak, workload.changes, bytes_per_change=per_change))
+    return results
+
+@benchmark('watch.round')
+def watch_round(workload: Workload, repeat: int) -> List[Result]:
+    # * One round of export --watch after another writer added a change: detect, reload and export again
+    version = next(iter(workload.data['versions']))
+    results = []
+    for name, fresh in (('watch.round', workload.fresh), ('watch.round.sharded', workload.fresh_sharded)):
+        def setup() -> Tuple[ChangelogFile, str]:
+            filepath = fresh()
+            changelog = ChangelogFile(filepath, cache=False)
+            changelog.export(workload.output(filepath))
+            ChangelogFile(filepath, cache=False).add_change(version, 'add', 'Benchmark change')
+            return changelog, workload.output(filepath)
+    
+        def run(state: Tuple[ChangelogFile, str]) -> None:
+            changelog, output = state
+            if changelog.changed():
+                changelog.reload()
+                changelog.export(output)
+    
+        timings, peak = workload.measure(run, setup, repeat)
+        results.append(make_result(name, str(workload.size), timings, peak))
+    return results
+
+# ! Benchmarks > CLI
+@benchmark('cli.import')
+def cli_import(workload: Workload, repeat: int) -> List[Result]:
+    env = cli_env()
+    startup, _ = measure_process(['-c', 'pass'], repeat, env)
+    timings, peak = measure_process(['-c', 'import changelogger.cli.cli'], repeat, env)
+    cost = max(min(timings) - min(startup), 0.0)
+    return [make_result(
+        'cli.import', str(workload.size), timings, peak,
+        measured_seconds=cost, budget_seconds=DEFAULT_IMPORT_BUDGET, within_budget=cost <= DEFAULT_IMPORT_BUDGET
+    )]
+
+@benchmark('cli.tree')
+def cli_tree(workload: Workload, repeat: int) -> List[Result]:
+    filepath = workload.fresh()
+    results = []
+    for name, args in (
+        ('cli.tree', ()),
+        ('cli.tree.plain', ('--plain', )),
+        ('cli.tree.page', ('--limit', '20'))
+    ):
+        timings, peak = measure_process(cli_args(filepath, 'tree', *args), repeat, cli_env())
+        results.append(make_result(name, str(workload.size), timings, peak))
+    return results
+
+@benchmark('cli.export')
+def cli_export(workload: Workload, repeat: int) -> List[Result]:
+    filepath = workload.fresh()
+    timings, peak = measure_process(cli_args(filepath, 'export', '-o', workload.output(filepath)), repeat, cli_env())
+    return [make_result('cli.export', str(workload.size), timings, peak)]
+
+@benchmark('cli.add_change')
+def cli_add_change(workload: Workload, repeat: int) -> List[Result]:
+    filepath = workload.fresh()
+    version = next(iter(workload.data['versions']))
+    timings, peak = measure_process(cli_args(filepath, 'change', 'add', version, 'add', 'Benchmark change'), repeat, cli_env())
+    return [make_result('cli.add_change', str(workload.size), timings, peak)]
+
+def measure_daemon(name: str, workload: Workload, filepath: str, repeat: int, budget: Optional[float]=None) -> Result:
+    version = next(iter(workload.data['versions']))
+    env = cli_env(os.path.join(os.path.dirname(filepath), 'daemon.sock'))
+    args = cli_args(filepath, 'change', 'add', version, 'add', 'Benchmark change')
+    with running_daemon(env):
+        # * The first forwarded command loads the changelog into the daemon
+        measure_process(args, 1, env)
+        startup, _ = measure_process(['-c', 'pass'], repeat, env)
+        timings, peak = measure_process(args, repeat, env)
+    cost = max(min(timings) - min(startup), 0.0)
+    extra = {} if budget is None else {'budget_seconds': budget, 'within_budget': cost <= budget}
+    return make_result(name, str(workload.size), timings, peak, measured_seconds=cost, **extra)
+
+@benchmark('cli.daemon.add_change')
+def cli_daemon_add_change(workload: Workload, repeat: int) -> List[Result]:
+    # * Still rewrites the whole file, so large changelogs are bound by the write
+    return [measure_daemon('cli.daemon.add_change', workload, workload.fresh(), repeat)]
+
+@benchmark('cli.daemon.add_change.sharded')
+def cli_daemon_add_change_sharded(workload: Workload, repeat: int) -> List[Result]:
+    return [measure_daemon('cli.daemon.add_change.sharded', workload, workload.fresh_sharded(), repeat, DEFAULT_DAEMON_BUDGET)]
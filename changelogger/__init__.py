@@ -1,13 +1,37 @@
-from .changelog import ChangelogFile
-from .exceptions import (
-    VersionExistError,
-    VersionNotExistError,
-    ChangeTypeEmojiNotCorrectError,
-    ChangeTypeKeyError
-)
-from .units import (
-    DEFAULT_CHANGE_TYPES,
-    DEFAULT_EXPORTER,
-    DEFAULT_EXPORTERS,
-    DEFAULT_MARKDOWN_EXTRA
-)
\ No newline at end of file
+from importlib import import_module
+# > Typing
+from typing import Any
+
+# ! Lazy Exports
+__exports__ = {
+    'ChangelogFile': '.changelog',
+    'AsyncChangelogFile': '.aio',
+    'VersionFilter': '.selection',
+    'SearchHit': '.search',
+    'VersionExistError': '.exceptions',
+    'VersionNotExistError': '.exceptions',
+    'ChangeTypeEmojiNotCorrectError': '.exceptions',
+    'ChangeTypeKeyError': '.exceptions',
+    'TransactionNotStartedError': '.exceptions',
+    'MergeConflictError': '.exceptions',
+    'TemplateError': '.exceptions',
+    'LockTimeoutError': '.exceptions',
+    'JournalCorruptedError': '.exceptions',
+    'Profiler': '.profiling',
+    'PhaseEvent': '.profiling',
+    'DEFAULT_CHANGE_TYPES': '.units',
+    'DEFAULT_EXPORTER': '.units',
+    'DEFAULT_EXPORTERS': '.units',
+    'DEFAULT_MARKDOWN_EXTRA': '.units'
+}
+__all__ = list(__exports__)
+
+def __getattr__(name: str) -> Any:
+    if name not in __exports__:
+        raise AttributeError(f"module {repr(__name__)} has no attribute {repr(name)}")
+    value = getattr(import_module(__exports__[name], __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
\ No newline at end of file
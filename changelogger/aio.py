@@ -0,0 +1,166 @@
+import os
+import asyncio
+from weakref import WeakKeyDictionary
+from functools import partial
+from pathlib import Path
+from datetime import datetime
+from concurrent.futures import Executor
+# > Typing
+from typing import Callable, Optional, Union, Iterable, Tuple, Dict, List, Any
+# > Local Imports
+from .changelog import ChangelogFile
+from .exporter import ExportTarget, ExportResult
+from .models import ChangeLog
+from .selection import VersionFilter
+from .search import SearchHit
+from .units import DEFAULT_EXPORTER
+
+# ! Async Changelog File
+class AsyncChangelogFile:
+    # * One lock per file and event loop, shared by every instance opened on that file
+    __locks: 'WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Lock]]' = WeakKeyDictionary()
+    
+    def __init__(
+        self,
+        filepath: Union[str, Path],
+        executor: Optional[Executor]=None,
+        **options: Any
+    ) -> None:
+        self.filepath = os.path.abspath(Path(filepath))
+        self.executor = executor
+        self.options = options
+        self.changelog: Optional[ChangelogFile] = None
+        self.__pending: Optional[asyncio.Future] = None
+        self.__flusher: Optional[asyncio.Future] = None
+    
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({repr(self.filepath)})'
+    
+    async def __aenter__(self) -> 'AsyncChangelogFile':
+        if self.changelog is None:
+            await self.load()
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.flush()
+    
+    @classmethod
+    async def open(cls, filepath: Union[str, Path], executor: Optional[Executor]=None, **options: Any) -> 'AsyncChangelogFile':
+        changelog = cls(filepath, executor, **options)
+        await changelog.load()
+        return changelog
+    
+    @property
+    def data(self) -> ChangeLog:
+        return self.__loaded().data
+    
+    @property
+    def lock(self) -> asyncio.Lock:
+        locks = self.__locks.setdefault(asyncio.get_running_loop(), {})
+        lock = locks.get(self.filepath)
+        if lock is None:
+            lock = locks[self.filepath] = asyncio.Lock()
+        return lock
+    
+    # ! Main Methods
+    async def load(self) -> None:
+        async with self.lock:
+            self.changelog = await self.__run(ChangelogFile, self.filepath, **self.options)
+    
+    async def refresh(self) -> None:
+        await self.flush()
+        async with self.lock:
+            await self.__run(self.__loaded().refresh)
+    
+    async def flush(self) -> None:
+        if self.__pending is not None:
+            await asyncio.shield(self.__pending)
+        elif self.__flusher is not None:
+            await asyncio.shield(self.__flusher)
+    
+    async def add_version(
+        self,
+        __version: str,
+        __date: Union[int, float, datetime],
+        __url: str,
+        __tag: str,
+        wait: bool=True
+    ) -> None:
+        await self.__mutate(self.__loaded().add_version, wait, __version, __date, __url, __tag)
+    
+    async def remove_version(self, __version: str, wait: bool=True) -> None:
+        await self.__mutate(self.__loaded().remove_version, wait, __version)
+    
+    async def add_change(self, __version: str, __type: str, __description: str, wait: bool=True) -> None:
+        await self.__mutate(self.__loaded().add_change, wait, __version, __type, __description)
+    
+    async def remove_change(self, __version: str, __index: int, wait: bool=True) -> None:
+        await self.__mutate(self.__loaded().remove_change, wait, __version, __index)
+    
+    async def edit_change(
+        self,
+        __version: str,
+        __index: int,
+        __type: Optional[str]=None,
+        __description: Optional[str]=None,
+        wait: bool=True
+    ) -> None:
+        await self.__mutate(self.__loaded().edit_change, wait, __version, __index, __type, __description)
+    
+    async def export(self, __target: ExportTarget, __format: str=DEFAULT_EXPORTER, selection: Optional[VersionFilter]=None) -> None:
+        async with self.lock:
+            await self.__run(self.__loaded().export, __target, __format, selection)
+    
+    async def search(
+        self,
+        __query: str,
+        selection: Optional[VersionFilter]=None,
+        limit: Optional[int]=None
+    ) -> List[SearchHit]:
+        async with self.lock:
+            return await self.__run(self.__loaded().search, __query, selection, limit)
+    
+    async def export_many(
+        self,
+        __targets: Iterable[Tuple[ExportTarget, str]],
+        workers: Optional[int]=None,
+        selection: Optional[VersionFilter]=None
+    ) -> List[ExportResult]:
+        async with self.lock:
+            return await self.__run(self.__loaded().export_many, list(__targets), False, workers, selection)
+    
+    # ! Private Methods
+    def __loaded(self) -> ChangelogFile:
+        if self.changelog is None:
+            raise RuntimeError('The changelog is not loaded, await load() first.')
+        return self.changelog
+    
+    async def __run(self, __method: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, partial(__method, *args, **kwargs))
+    
+    async def __mutate(self, __method: Callable[..., Any], wait: bool, *args: Any) -> None:
+        # * In-memory changes are cheap and run on the loop, writing them out is left to the flusher
+        async with self.lock:
+            __method(*args, refresh=False)
+            if self.__pending is None:
+                self.__pending = asyncio.get_running_loop().create_future()
+            pending = self.__pending
+            if (self.__flusher is None) or self.__flusher.done():
+                self.__flusher = asyncio.ensure_future(self.__flush())
+        if wait:
+            await asyncio.shield(pending)
+    
+    async def __flush(self) -> None:
+        # * Changes made while a write is running are collected into the next single write
+        while self.__pending is not None:
+            async with self.lock:
+                pending, self.__pending = self.__pending, None
+                try:
+                    await self.__run(self.__loaded().flush)
+                except Exception as e:
+                    pending.set_exception(e)
+                    # * Retrieved here, so that an unawaited write does not warn
+                    pending.exception()
+                else:
+                    pending.set_result(None)
@@ -0,0 +1,79 @@
+import csv
+import json
+from datetime import datetime
+# > Typing
+from typing import NamedTuple, Callable, Union, Iterator, TextIO, Tuple, Mapping, Any
+# > Local Imports
+from .exceptions import RecordFormatError
+
+# ! Type Alias
+BulkRecord = Mapping[str, Any]
+BulkItem = Union[BulkRecord, RecordFormatError]
+NumberedBulkItem = Tuple[int, BulkItem]
+BulkErrorCallback = Callable[[int, Exception], None]
+
+# ! Constants
+RECORD_FORMATS = ('jsonl', 'csv')
+
+# ! Bulk Result
+class BulkResult(NamedTuple):
+    applied: int
+    failed: int
+    
+    @property
+    def ok(self) -> bool:
+        return self.failed == 0
+
+# ! Methods
+def parse_date(value: Any) -> Union[float, datetime]:
+    if isinstance(value, (int, float, datetime)):
+        return value
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return datetime.fromisoformat(str(value))
+
+def record_kind(record: BulkRecord) -> str:
+    kind = record.get('kind')
+    if kind is None:
+        kind = 'change' if (('type' in record) or ('description' in record)) else 'version'
+    if kind not in ('version', 'change'):
+        raise RecordFormatError(f"Unknown record kind: {repr(kind)}.")
+    return kind
+
+def read_jsonl(stream: TextIO) -> Iterator[NumberedBulkItem]:
+    for lineno, line in enumerate(stream, 1):
+        if len(line.strip()) == 0:
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            yield lineno, RecordFormatError(str(e))
+            continue
+        if not isinstance(record, dict):
+            yield lineno, RecordFormatError("The record is not an object.")
+        else:
+            yield lineno, record
+
+def read_csv(stream: TextIO) -> Iterator[NumberedBulkItem]:
+    reader = csv.DictReader(stream)
+    for record in reader:
+        yield reader.line_num, {
+            key: value for key, value in record.items()
+            if (key is not None) and (value not in (None, ''))
+        }
+
+def read_records(stream: TextIO, format: str) -> Iterator[NumberedBulkItem]:
+    if format == 'jsonl':
+        return read_jsonl(stream)
+    elif format == 'csv':
+        return read_csv(stream)
+    raise ValueError(format)
+
+def record_format(filepath: str, default: str='jsonl') -> str:
+    extension = filepath.rsplit('.', 1)[-1].lower() if ('.' in filepath) else ''
+    if extension in ('jsonl', 'ndjson', 'json'):
+        return 'jsonl'
+    elif extension in ('csv', ):
+        return 'csv'
+    return default
\ No newline at end of file
@@ -0,0 +1,80 @@
+import os
+import json
+import hashlib
+# > Typing
+from typing import Optional, Tuple, Any
+
+# ! Type Alias
+CacheSignature = Tuple[str, int, int, str]
+
+# ! Constants
+CACHE_FORMAT_VERSION = 4
+CACHE_DISABLE_ENV = 'CHANGELOGGER_NO_CACHE'
+
+# ! Methods
+def cache_path(filepath: str) -> str:
+    dirpath, filename = os.path.split(filepath)
+    return os.path.join(dirpath, f'.{filename}.cache')
+
+def cache_disabled() -> bool:
+    return len(os.environ.get(CACHE_DISABLE_ENV, '')) > 0
+
+# ! Snapshot Cache Class
+class SnapshotCache:
+    def __init__(self, filepath: str) -> None:
+        self.filepath = filepath
+        self.cachepath = cache_path(filepath)
+    
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({repr(self.filepath)})'
+    
+    # ! Main Methods
+    def signature(self, digest: Optional[str]=None, stat: Optional[Tuple[int, int]]=None) -> Optional[CacheSignature]:
+        if (digest is not None) and (stat is not None):
+            return self.filepath, stat[0], stat[1], digest
+        try:
+            if digest is None:
+                with open(self.filepath, 'rb') as file:
+                    digest = hashlib.sha256(file.read()).hexdigest()
+                    stat_result = os.fstat(file.fileno())
+            else:
+                stat_result = os.stat(self.filepath)
+        except OSError:
+            return None
+        return self.filepath, stat_result.st_size, stat_result.st_mtime_ns, digest
+    
+    def load(self) -> Optional[Tuple[CacheSignature, Any]]:
+        # * Plain JSON only, so a cache file that came with a clone cannot run anything when it is read
+        try:
+            with open(self.cachepath, 'rb') as file:
+                version, signature = json.loads(file.readline())
+                if version != CACHE_FORMAT_VERSION:
+                    return None
+                signature = tuple(signature)
+                try:
+                    stat = os.stat(self.filepath)
+                except OSError:
+                    return None
+                if signature[:3] != (self.filepath, stat.st_size, stat.st_mtime_ns):
+                    return None
+                if signature != self.signature():
+                    return None
+                return signature, json.loads(file.read())
+        except Exception:
+            return None
+    
+    def save(self, signature: CacheSignature, payload: Any) -> None:
+        temppath = self.cachepath + '.tmp'
+        try:
+            with open(temppath, 'w', encoding='utf-8') as file:
+                file.write(json.dumps([CACHE_FORMAT_VERSION, list(signature)]) + '\n')
+                json.dump(payload, file, ensure_ascii=False, separators=(',', ':'))
+            os.replace(temppath, self.cachepath)
+        except (OSError, TypeError, ValueError):
+            pass
+    
+    def clear(self) -> None:
+        try:
+            os.remove(self.cachepath)
+        except FileNotFoundError:
+            pass
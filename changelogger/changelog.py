@@ -1,5 +1,10 @@
 import os
+import hashlib
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from itertools import islice
 from pathlib import Path
+from contextlib import contextmanager
 from datetime import datetime
 # > PyYAML
 import yaml
@@ -8,18 +13,39 @@ try:
 except:
     from yaml import Loader, Dumper
 # > Typing
-from typing import Type, Callable, TypeVar, Union, Mapping, Sequence, Iterable, Tuple, Dict, List, Any
+from typing import Type, Callable, TypeVar, Optional, Union, Mapping, Sequence, Iterable, Iterator, Tuple, Set, Dict, List, Any
 # > Local Imports
-from .models import ChangeLog, Version, Change, DEFAULT_CHANGELOG_DATA
-from .exporter import ExporterBase
+from .models import (
+    ChangeLog, Version, Change, ChangeOrder,
+    LazyVersions,
+    DEFAULT_CHANGELOG_DATA
+)
+from .index import ChangeIndex, VersionIndex, version_key, CHANGE_ORDERS
+from .selection import VersionFilter, select, select_versions, change_selected
+from .exporter import ExporterBase, ExportTarget, ExportResult, render_export
+from .cache import SnapshotCache, cache_disabled
+from .bulk import BulkResult, BulkRecord, NumberedBulkItem, BulkErrorCallback, parse_date, record_kind
+from .git import GitIngest, GitState, iter_commits, DEFAULT_COMMIT_TYPES
+from .profiling import Instrumented, PhaseCallback, Phase
+from .locking import FileLock
+from .storage import ShardedStorage, is_sharded, affected_versions, write_atomic, file_stat
+from .journal import Journal, JournalRecord, journal_path, snapshot_seq, JOURNAL_SEQ_COMMENT
+from .search import (
+    SearchIndex, SearchHit,
+    search_path, search_log_path, append_search_log,
+    tokenize, changes_tokens, changes_signature, pairs_signature, matches,
+    PROBE_RATIO, SEARCH_LOG_LIMIT
+)
 from .exceptions import (
     VersionExistError, VersionNotExistError,
-    ChangeTypeKeyError, ChangeTypeEmojiNotCorrectError
+    ChangeTypeKeyError, ChangeTypeEmojiNotCorrectError,
+    TransactionNotStartedError, RecordFormatError, MergeConflictError
 )
 from .units import (
     DEFAULT_EXPORTER,
     DEFAULT_EXPORTERS,
-    DEFAULT_CHANGE_TYPES
+    DEFAULT_CHANGE_TYPES,
+    DEFAULT_JOURNAL_LIMIT
 )
 
 # ! Type Alias
@@ -28,6 +54,7 @@ ChangelogData = Dict[str, Any]
 ExporterNameType = str
 ExporterType = Type[ExporterBase]
 ExporterExtraType = Dict[str, Any]
+UndoEntry = Callable[[], None]
 
 # ! Methods
 def notwrap(data: ChangelogData) -> ChangelogData:
@@ -40,33 +67,116 @@ def defwrap(data: ChangelogData) -> ChangeLog:
     return ChangeLog.model_validate(data)
 
 def defunwrap(data: ChangeLog) -> ChangelogData:
-    return data.model_dump(warnings=False)
+    dumped = data.model_dump(exclude={'versions'}, warnings=False)
+    if isinstance(data.versions, LazyVersions):
+        dumped['versions'] = data.versions.dump()
+    else:
+        dumped['versions'] = {key: version.model_dump(warnings=False) for key, version in data.versions.items()}
+    return dumped
+
+def lazywrap(data: ChangelogData) -> ChangeLog:
+    changelog = ChangeLog.model_validate({**data, 'versions': {}})
+    changelog.versions = LazyVersions(data.get('versions') or {})
+    return changelog
 
 # ! Main Class
-class ChangelogFile:
+class ChangelogFile(Instrumented):
     # ! Private Initialization Methods
     def __dump(
         self,
         filepath: str,
         data: T,
-        unwraping: Callable[[T], ChangelogData]=notunwrap
+        unwraping: Callable[[T], ChangelogData]=notunwrap,
+        seq: Optional[int]=None
     ) -> None:
-        with open(filepath, 'w') as file:
-            yaml.dump(unwraping(data), file, Dumper=Dumper, sort_keys=False)
+        with self.phase('dump.unwrap') as phase:
+            dumped = unwraping(data)
+            phase.count = len(dumped.get('versions') or {})
+        with self.phase('dump.serialize') as phase:
+            content = yaml.dump(dumped, Dumper=Dumper, sort_keys=False)
+            if seq is not None:
+                content += JOURNAL_SEQ_COMMENT.format(seq=seq)
+            encoded = content.encode('utf-8')
+            digest = hashlib.sha256(encoded).hexdigest()
+            phase.bytes = len(encoded)
+            phase.count = len(dumped.get('versions') or {})
+        if digest == self.__disk_digest(filepath):
+            # * The file already holds this content, so it now matches the data
+            if (self.__disk is not None) and (self.__disk[0] == digest):
+                self.__digest = self.__disk
+            return
+        with self.phase('dump.write') as phase, self.__file_lock:
+            stat = write_atomic(filepath, content, fsync=seq is not None)
+            phase.bytes = len(encoded)
+            self.__remember_digest(filepath, digest, stat)
+        if (self.__cache is not None) and isinstance(data, ChangeLog):
+            with self.phase('cache.save'):
+                signature = self.__cache.signature(*self.__digest)
+                if signature is not None:
+                    self.__cache.save(signature, [seq or 0, dumped])
+    
+    def __disk_digest(self, filepath: str) -> Optional[str]:
+        try:
+            stat = os.stat(filepath)
+        except FileNotFoundError:
+            return None
+        # * Kept apart from the digest of the data, a file this instance has not loaded must still look stale
+        for known in (self.__digest, self.__disk):
+            if (known is not None) and (known[1] == (stat.st_size, stat.st_mtime_ns)):
+                return known[0]
+        with open(filepath, 'rb') as file:
+            digest = hashlib.sha256(file.read()).hexdigest()
+            stat = os.fstat(file.fileno())
+        self.__disk = (digest, (stat.st_size, stat.st_mtime_ns))
+        return digest
+    
+    def __remember_digest(self, filepath: str, digest: str, stat: Optional[os.stat_result]=None) -> None:
+        # * The stat must describe the same file the digest was taken from, another writer may replace it meanwhile
+        stat = stat or os.stat(filepath)
+        self.__digest = (digest, (stat.st_size, stat.st_mtime_ns))
     
     def __load(
         self,
         filepath: str,
         wraping: Callable[[ChangelogData], T]=notwrap
     ) -> T:
-        with open(filepath, 'r', encoding='utf-8', errors='ignore') as file:
-            return wraping(yaml.load(file, Loader=Loader))
+        with self.phase('load.read') as phase:
+            with open(filepath, 'rb') as file:
+                content = file.read()
+                stat = os.fstat(file.fileno())
+            phase.bytes = len(content)
+        self.__remember_digest(filepath, hashlib.sha256(content).hexdigest(), stat)
+        self.__snapshot_seq = snapshot_seq(content)
+        with self.phase('load.parse') as phase:
+            loaded = yaml.load(content.decode('utf-8', errors='ignore'), Loader=Loader)
+            phase.bytes = len(content)
+            phase.count = len(loaded.get('versions') or {}) if isinstance(loaded, dict) else 0
+        return wraping(loaded)
     
     def __loadump(
         self,
         filepath: str,
-        default: ChangelogData
+        default: ChangelogData,
+        previous: Optional[ChangeLog]=None
     ) -> ChangeLog:
+        if self.__storage is not None:
+            with self.phase('load.index') as phase:
+                data = self.__storage.load(previous)
+                phase.count = len(data.versions)
+            return data
+        # * Strict mode validates the file itself, a cached snapshot would skip exactly that
+        if (self.__cache is not None) and not self.strict:
+            with self.phase('cache.load') as phase:
+                cached = self.__cache.load()
+                phase.count = len(cached[1][1].get('versions') or {}) if cached is not None else 0
+            if cached is not None:
+                signature, (self.__snapshot_seq, raw) = cached
+                self.__digest = (signature[3], (signature[1], signature[2]))
+                # * Validated like the file itself, the snapshot only saves parsing the YAML
+                with self.phase('load.validate') as phase:
+                    data = lazywrap(raw) if self.lazy else defwrap(raw)
+                    phase.count = len(data.versions)
+                return data
         data = default.copy()
         if os.path.exists(filepath):
             try:
@@ -75,40 +185,538 @@ class ChangelogFile:
                 raise e
             except:
                 self.__dump(filepath, data)
+        elif self.__deferred > 0:
+            # * Written once when the deferred block exits, with everything set up on the new data until then
+            self.__pending = self.__snapshot_required = True
         else:
             self.__dump(filepath, data)
-        return defwrap(data)
+        raw = data
+        with self.phase('load.validate') as phase:
+            data = lazywrap(raw) if self.lazy else defwrap(raw)
+            phase.count = len(data.versions)
+        if self.__cache is not None:
+            with self.phase('cache.save'):
+                signature = self.__cache.signature(*(self.__digest or ()))
+                if signature is not None:
+                    self.__cache.save(signature, [self.__snapshot_seq, raw])
+        return data
+    
+    def __replay(self) -> None:
+        self.__replaying = True
+        try:
+            with self.phase('journal.replay') as phase:
+                for record in self.__journal.read(self.__snapshot_seq):
+                    getattr(self, record['method'])(*record['args'], refresh=False)
+                    self.__journal.seq = max(self.__journal.seq, record['seq'])
+                    phase.count += 1
+        finally:
+            self.__replaying = False
+    
+    def __record(self, __method: str, *args: Any, target: Optional[Tuple[str, str]]=None) -> None:
+        self.__dirty = True
+        if (self.journal or self.merge or (self.__storage is not None)) and not self.__replaying:
+            record: JournalRecord = {'method': __method, 'args': list(args)}
+            if target is not None:
+                # * The type and description of the change an index points to, so a merge can find it again
+                record['change'] = list(target)
+            self.__records.append(record)
+    
+    def __rebase(self, __record: JournalRecord) -> List[Any]:
+        # * Another writer may have shifted the changes, the index is only kept while it still points to the same change
+        args, target = __record['args'], __record.get('change')
+        if target is None:
+            return args
+        version, index = args[0], args[1]
+        if not self.exist_version(version):
+            raise MergeConflictError(self.filepath, version, target[1])
+        changes = self.data.versions[version].changes
+        found = [idx for idx, change in enumerate(changes) if [change.type, change.description] == target]
+        if len(found) == 0:
+            raise MergeConflictError(self.filepath, version, target[1])
+        if index in found:
+            return args
+        return [version, min(found, key=lambda idx: abs(idx - index)), *args[2:]]
+    
+    def __stale(self) -> bool:
+        if self.__storage is not None:
+            return self.__storage.stale(affected_versions(self.__records)[0])
+        known = self.__digest[0] if self.__digest is not None else None
+        current = self.__disk_digest(self.filepath)
+        return (current is not None) and (current != known)
+    
+    def __outdated(self) -> bool:
+        # * In journal mode another writer may also have appended records this instance has not replayed
+        return (self.journal and (self.__journal.trim() > self.__journal.seq)) or self.__stale()
+    
+    def __merge(self) -> None:
+        # * Reloads the file changed by another writer and applies the pending mutations on top of it
+        with self.phase('merge') as phase:
+            records, self.__records = self.__records, []
+            self.data = self.__loadump(self.filepath, DEFAULT_CHANGELOG_DATA)
+            if self.journal:
+                self.__journal.seq = self.__snapshot_seq
+                self.__replay()
+            rebased: List[JournalRecord] = []
+            self.__replaying = True
+            self.begin()
+            try:
+                for record in records:
+                    record = {**record, 'args': self.__rebase(record)}
+                    getattr(self, record['method'])(*record['args'], refresh=False)
+                    rebased.append(record)
+                    phase.count += 1
+            except BaseException:
+                # * Back to the state on disk, the pending mutations could not be applied to it
+                self.rollback()
+                self.__dirty = False
+                raise
+            finally:
+                self.__replaying = False
+            self.commit()
+            self.__records = rebased
+    
+    def __write(self, full: bool=False) -> None:
+        with self.__file_lock:
+            if self.merge and self.__stale():
+                self.__merge()
+            if self.__storage is not None:
+                self.__write_shards(full)
+            else:
+                before = self.digest
+                self.__dump(self.filepath, self.data, defunwrap)
+                self.__log_search(before)
+            self.__records.clear()
+            self.__search_unlogged.clear()
+    
+    def __write_shards(self, full: bool=False) -> None:
+        versions, index, every = affected_versions(self.__records)
+        if full or every:
+            versions = list(dict.fromkeys(versions + self.__storage.materialized(self.data)))
+        with self.phase('dump.shards') as phase:
+            phase.count = self.__storage.save_versions(self.data, versions)
+            if full or index:
+                self.__storage.save_index(self.data)
+    
+    def __compact(self, data: ChangeLog, seq: int) -> None:
+        with self.__file_lock:
+            # * Only a copy that covers the whole journal may replace the file, otherwise the next compaction does it
+            if self.journal and (self.__outdated() or (self.__snapshot_seq > seq)):
+                return
+            self.__dump(self.filepath, data, defunwrap, seq)
+            self.__snapshot_seq = seq
+            with self.__journal_lock:
+                self.__journal.discard(seq)
+    
+    def __append(self) -> None:
+        with self.phase('journal.append') as phase, self.__file_lock, self.__journal_lock:
+            if self.merge and self.__outdated():
+                self.__merge()
+            self.__journal.append(self.__records)
+            phase.count = len(self.__records)
+        self.__records = []
+        self.__search_unlogged.clear()
+    
+    def __change_index(self, __version: str) -> ChangeIndex:
+        return ChangeIndex.of(self.data.versions[__version], self.data.change_order, self.data.change_types)
+    
+    def __undoable(self, __undo: UndoEntry) -> None:
+        # * Only a transaction can be rolled back, so nothing is kept outside of one
+        if len(self.__transactions) > 0:
+            self.__undo.append(__undo)
+    
+    def __reorder_versions(self, __keys: List[str]) -> None:
+        if isinstance(self.data.versions, LazyVersions):
+            self.data.versions.reorder(__keys)
+        else:
+            index_current = self.__version_index_source is self.data.versions
+            search_current = self.__search_source is self.data.versions
+            self.data.versions = {key: self.data.versions[key] for key in __keys}
+            if index_current:
+                self.__version_index_source = self.data.versions
+            if search_current:
+                self.__search_source = self.data.versions
+    
+    def __drop_version(self, __version: str) -> None:
+        del self.data.versions[__version]
+        if (self.__version_index is not None) and (self.__version_index_source is self.data.versions):
+            self.__version_index.remove(__version)
+        self.__touch(__version)
+    
+    def __restore_version(self, __version: str, __value: Version, __keys: List[str]) -> None:
+        self.data.versions[__version] = __value
+        if (self.__version_index is not None) and (self.__version_index_source is self.data.versions):
+            self.__version_index.add(__version)
+        self.__reorder_versions(__keys)
+        self.__touch(__version)
+    
+    def __restore_changes(self, __version: str, __changes: List[Change]) -> None:
+        value = self.data.versions[__version]
+        value.changes[:] = __changes
+        value._index = None
+        self.__touch(__version)
+    
+    def __drop_change(self, __version: str, __index: int) -> None:
+        value = self.data.versions[__version]
+        value.changes.pop(__index)
+        value._index = None
+        self.__touch(__version)
+    
+    def __insert_change(self, __version: str, __index: int, __change: Change) -> None:
+        value = self.data.versions[__version]
+        value.changes.insert(__index, __change)
+        value._index = None
+        self.__touch(__version)
+    
+    def __revert_change(self, __version: str, __new_index: int, __index: int, __type: str, __description: str) -> None:
+        value = self.data.versions[__version]
+        change = value.changes.pop(__new_index)
+        change.type, change.description = __type, __description
+        value.changes.insert(__index, change)
+        value._index = None
+        self.__touch(__version)
     
-    def __refresh(self) -> None:
-        self.__dump(self.filepath, self.data, defunwrap)
+    def __restore_change_order(self, __order: ChangeOrder, __changes: Dict[str, List[Change]]) -> None:
+        self.data.change_order = __order
+        for version, changes in __changes.items():
+            self.__restore_changes(version, changes)
+    
+    def __restore_change_types(self, __change_types: Dict[str, str]) -> None:
+        # * Restored in place and in the old order, which the type-index order ranks by
+        self.data.change_types.clear()
+        self.data.change_types.update(__change_types)
+    
+    def __restore_exporter_extra(self, __format: str, __extra: Optional[Dict[str, Any]]) -> None:
+        if __extra is None:
+            self.data.exporters_extra.pop(__format, None)
+        else:
+            self.data.exporters_extra[__format] = __extra
+    
+    def __touch(self, __version: str) -> None:
+        # * Remembers the versions whose changes the search index has to pick up on the next search and write
+        self.__search_dirty[__version] = None
+        self.__search_unlogged[__version] = None
+    
+    def __log_search(self, __before: Optional[str]) -> None:
+        # * Readers in other processes follow the written versions from the log instead of checking every version
+        after = self.digest
+        if (__before is None) or (after is None) or (after == __before):
+            return
+        if not os.path.isfile(search_path(self.filepath)):
+            return
+        versions = self.data.versions
+        append_search_log(search_log_path(self.filepath), __before, after, {
+            version: (
+                (changes_signature(versions[version].changes), changes_tokens(versions[version].changes))
+                if version in versions else None
+            )
+            for version in self.__search_unlogged
+        })
+    
+    def __search_signature(self, __version: str) -> Any:
+        if self.__storage is not None:
+            # * A list, as the signatures of a saved index come back from JSON
+            stat = file_stat(self.__storage.shard_path(__version))
+            return None if stat is None else list(stat)
+        if isinstance(self.data.versions, LazyVersions):
+            return pairs_signature(self.data.versions.change_pairs(__version))
+        return changes_signature(self.data.versions[__version].changes)
+    
+    def __search_digest(self) -> Optional[str]:
+        # * Only a changelog that matches its file can vouch for the saved index by its digest
+        if self.__dirty or (len(self.__records) > 0) or self.__journal.exists():
+            return None
+        return self.digest
+    
+    def __reconcile_search(self, index: SearchIndex, phase: Phase) -> bool:
+        versions = self.data.versions
+        removed = [version for version in index.ids if version not in versions]
+        for version in removed:
+            index.remove_version(version)
+        for version in versions:
+            signature = self.__search_signature(version)
+            if (version not in index) or (index.signatures[version] != signature):
+                if isinstance(versions, LazyVersions):
+                    # * From the raw data, so that the first search in lazy mode does not materialize every version
+                    pairs = versions.change_pairs(version)
+                    index.index_tokens(version, (token for _, description in pairs for token in tokenize(description)), signature)
+                else:
+                    index.index_version(version, versions[version].changes, signature)
+                phase.count += 1
+        return (len(removed) > 0) or (phase.count > 0)
+    
+    def __search_index(self) -> SearchIndex:
+        with self.phase('search.index') as phase:
+            filepath = search_path(self.filepath)
+            if self.__search is None:
+                self.__search = SearchIndex.load(filepath) or SearchIndex()
+            index = self.__search
+            digest = self.__search_digest()
+            changed = False
+            # * Another writer or a reload replaced the versions, so only the versions that differ are reindexed
+            if self.__search_source is not self.data.versions:
+                if (digest is not None) and (index.digest != digest):
+                    changed = index.follow(search_log_path(self.filepath)) > 0
+                if (digest is None) or (index.digest != digest):
+                    changed = self.__reconcile_search(index, phase) or changed
+                self.__search_source = self.data.versions
+            dirty, self.__search_dirty = self.__search_dirty, {}
+            for version in dirty:
+                if version in self.data.versions:
+                    index.index_version(version, self.data.versions[version].changes, self.__search_signature(version))
+                else:
+                    index.remove_version(version)
+                phase.count += 1
+                changed = True
+            if changed or (index.digest != digest):
+                index.digest = digest
+                index.save(filepath)
+            if digest is not None:
+                self.__trim_search_log(digest)
+        return index
+    
+    def __trim_search_log(self, __digest: str) -> None:
+        # * The saved index already covers the whole log once no writer came after it
+        logpath = search_log_path(self.filepath)
+        try:
+            if os.path.getsize(logpath) <= SEARCH_LOG_LIMIT:
+                return
+            with self.__file_lock:
+                if self.__disk_digest(self.filepath) == __digest:
+                    os.remove(logpath)
+        except OSError:
+            pass
+    
+    def __search_hits(self, versions: Iterable[str], candidates: Set[str], tokens: Set[str], selection: Optional[VersionFilter]) -> Iterator[SearchHit]:
+        types = set() if selection is None else set(selection.types)
+        exclude_types = set() if selection is None else set(selection.exclude_types)
+        for version in versions:
+            if version not in candidates:
+                continue
+            for idx, change in enumerate(self.data.versions[version].changes):
+                if change_selected(change, types, exclude_types) and matches(change, tokens):
+                    yield SearchHit(version, idx, change)
+    
+    def __refresh(self, snapshot: bool=False) -> None:
+        if (len(self.__transactions) > 0) or (self.__deferred > 0):
+            self.__pending = True
+            self.__snapshot_required = self.__snapshot_required or snapshot
+            return
+        snapshot = snapshot or self.__snapshot_required
+        self.__snapshot_required = False
+        if not (self.__dirty or snapshot):
+            return
+        self.__dirty = False
+        if not self.journal:
+            self.__write(snapshot)
+        elif snapshot:
+            self.compact()
+        elif len(self.__records) > 0:
+            self.__append()
+            if self.__journal.size() > self.journal_limit:
+                self.compact(wait=False)
     
     # ! Initialization
     def __init__(
         self,
         filepath: Union[str, Path],
         change_types: List[Tuple[str, str]]=DEFAULT_CHANGE_TYPES,
-        exporters: List[Tuple[ExporterNameType, ExporterType, ExporterExtraType]]=DEFAULT_EXPORTERS
+        exporters: List[Tuple[ExporterNameType, ExporterType, ExporterExtraType]]=DEFAULT_EXPORTERS,
+        journal: bool=False,
+        journal_limit: int=DEFAULT_JOURNAL_LIMIT,
+        cache: bool=True,
+        lazy: bool=False,
+        strict: bool=False,
+        listeners: Iterable[PhaseCallback]=(),
+        merge: bool=True,
+        lock_timeout: Optional[float]=None
     ) -> None:
+        self.listeners = tuple(listeners)
         self.filepath = os.path.abspath(Path(filepath))
-        self.data = self.__loadump(self.filepath, DEFAULT_CHANGELOG_DATA)
+        self.merge = merge
+        self.__file_lock = FileLock.of(self.filepath, lock_timeout)
+        self.lazy = lazy
+        self.strict = strict
+        self.__storage = ShardedStorage(self.filepath) if is_sharded(self.filepath) else None
+        if (self.__storage is not None) and journal:
+            raise ValueError('Journal mode needs a single-file changelog.')
+        self.__cache = SnapshotCache(self.filepath) if (cache and not cache_disabled() and (self.__storage is None)) else None
+        self.journal = journal
+        self.journal_limit = journal_limit
+        self.__journal = Journal(journal_path(self.filepath))
+        self.__journal_lock = threading.Lock()
+        self.__compactor: Optional[threading.Thread] = None
+        self.__records: List[JournalRecord] = []
+        self.__replaying = False
+        self.__snapshot_seq = 0
+        self.__snapshot_required = False
+        self.__dirty = False
+        self.__digest: Optional[Tuple[str, Tuple[int, int]]] = None
+        self.__disk: Optional[Tuple[str, Tuple[int, int]]] = None
+        self.__transactions: List[Tuple[int, int]] = []
+        self.__undo: List[UndoEntry] = []
+        self.__version_index: Optional[VersionIndex] = None
+        self.__version_index_source: Optional[Mapping[str, Version]] = None
+        self.__pending = False
+        self.__deferred = 0
+        self.__search: Optional[SearchIndex] = None
+        self.__search_source: Optional[Mapping[str, Version]] = None
+        self.__search_dirty: Dict[str, None] = {}
+        self.__search_unlogged: Dict[str, None] = {}
         self.exporters: Dict[str, ExporterBase] = {}
-        self.set_change_types(change_types)
-        for format, exporter, extorter_extra in exporters:
-            self.set_exporter_extra(format, extorter_extra)
-            self.set_exporter(format, exporter)
+        with self.deferred():
+            self.data = self.__loadump(self.filepath, DEFAULT_CHANGELOG_DATA)
+            if self.__journal.exists():
+                # * A torn tail may still be another writer's append in progress, so it is only cut off under the lock
+                with self.__file_lock:
+                    if self.__stale():
+                        self.data = self.__loadump(self.filepath, DEFAULT_CHANGELOG_DATA)
+                    self.__journal.recover()
+                    self.__replay()
+                    if not self.journal:
+                        self.__dump(self.filepath, self.data, defunwrap, self.__journal.seq)
+                        self.__journal.discard(self.__journal.seq)
+            self.__journal.seq = max(self.__journal.seq, self.__snapshot_seq)
+            self.set_change_types(change_types)
+            for format, exporter, extorter_extra in exporters:
+                self.set_exporter_extra(format, extorter_extra)
+                self.set_exporter(format, exporter)
+            if self.__snapshot_required:
+                # * The setup runs again on every load, so a new file needs no journal or merge records of it
+                self.__records.clear()
     
     # ! Magic Methods
     def __enter__(self):
+        self.begin()
         return self
     
-    def __exit__(*exc_info) -> None:
-        pass
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
     
     # ! Main Methods
     def refresh(self) -> None:
+        self.__refresh(snapshot=True)
+    
+    def flush(self) -> None:
         self.__refresh()
     
+    def compact(self, wait: bool=True) -> None:
+        if len(self.__transactions) > 0:
+            self.__pending = True
+            self.__snapshot_required = True
+            return
+        if self.journal and (len(self.__records) > 0):
+            # * Appended first, the compaction is skipped when another writer got there before it
+            self.__append()
+        self.__records.clear()
+        if (self.__compactor is not None) and self.__compactor.is_alive():
+            self.__compactor.join()
+        self.__compactor = threading.Thread(
+            target=self.__compact,
+            args=(self.data.model_copy(deep=True), self.__journal.seq)
+        )
+        self.__compactor.start()
+        if wait:
+            self.__compactor.join()
+    
+    def changed(self) -> bool:
+        # * Compares sizes and modification times only, so it is cheap enough to call before every command
+        if self.__storage is not None:
+            return self.__storage.stale(self.__storage.materialized(self.data))
+        return file_stat(self.filepath) != (self.__digest[1] if self.__digest is not None else None)
+    
+    def reload(self) -> None:
+        if len(self.__transactions) > 0:
+            raise RuntimeError('Cannot reload during a transaction.')
+        # * Unchanged shards are kept, unless they may hold changes that were never written
+        previous = self.data if not (self.__dirty or (len(self.__records) > 0)) else None
+        self.__records.clear()
+        self.__dirty = False
+        self.data = self.__loadump(self.filepath, DEFAULT_CHANGELOG_DATA, previous)
+        if self.__journal.exists():
+            self.__replay()
+    
+    @contextmanager
+    def deferred(self):
+        # * Mutations inside are kept in memory and written once on exit, without the undo log a transaction keeps
+        self.__deferred += 1
+        try:
+            yield self
+        finally:
+            self.__deferred -= 1
+            if (self.__deferred == 0) and (len(self.__transactions) == 0) and self.__pending:
+                self.__pending = False
+                self.__refresh()
+    
+    @property
+    def digest(self) -> Optional[str]:
+        return self.__digest[0] if (self.__storage is None) and (self.__digest is not None) else None
+    
+    @property
+    def sharded(self) -> bool:
+        return self.__storage is not None
+    
+    def save_as(self, __target: Union[str, Path]) -> None:
+        target = os.path.abspath(Path(__target))
+        if is_sharded(target):
+            ShardedStorage(target).save(self.data)
+        else:
+            write_atomic(target, yaml.dump(defunwrap(self.data), Dumper=Dumper, sort_keys=False))
+    
+    @contextmanager
+    def locked(self, timeout: Optional[float]=None):
+        self.__file_lock.acquire(timeout)
+        try:
+            if self.__outdated():
+                self.__merge()
+            yield self
+        finally:
+            self.__file_lock.release()
+    
+    # ! Transaction Methods
+    @property
+    def in_transaction(self) -> bool:
+        return len(self.__transactions) > 0
+    
+    def begin(self) -> None:
+        # * Every mutation inside keeps its inverse, so a rollback never needs a copy of the whole changelog
+        self.__transactions.append((len(self.__undo), len(self.__records)))
+    
+    def commit(self) -> None:
+        if len(self.__transactions) == 0:
+            raise TransactionNotStartedError()
+        self.__transactions.pop()
+        if len(self.__transactions) == 0:
+            self.__undo.clear()
+        if (len(self.__transactions) == 0) and (self.__deferred == 0) and self.__pending:
+            self.__pending = False
+            self.__refresh()
+    
+    def rollback(self) -> None:
+        if len(self.__transactions) == 0:
+            raise TransactionNotStartedError()
+        undo_count, records_count = self.__transactions.pop()
+        while len(self.__undo) > undo_count:
+            self.__undo.pop()()
+        del self.__records[records_count:]
+        if (len(self.__transactions) == 0) and (self.__deferred == 0):
+            self.__pending = False
+            self.__snapshot_required = False
+    
     # ! Version Methods
+    @property
+    def versions_index(self) -> VersionIndex:
+        if (
+            (self.__version_index is None) or \
+            (self.__version_index_source is not self.data.versions) or \
+            (len(self.__version_index) != len(self.data.versions))
+        ):
+            self.__version_index = VersionIndex(self.data.versions.keys())
+            self.__version_index_source = self.data.versions
+        return self.__version_index
+    
     def exist_version(self, __version: str) -> bool:
         return __version in self.data.versions.keys()
     
@@ -127,12 +735,37 @@ class ChangelogFile:
         else:
             __date = float(__date)
         self.data.versions[__version] = Version(version=__version, date=__date, url=__url, tag=__tag)
+        if (self.__version_index is not None) and (self.__version_index_source is self.data.versions):
+            self.__version_index.add(__version)
+        self.__touch(__version)
+        self.__undoable(lambda: self.__drop_version(__version))
+        self.__record('add_version', __version, __date, __url, __tag)
         if refresh:
             self.__refresh()
     
     def remove_version(self, __version: str, refresh: bool=True) -> None:
         if not self.exist_version(__version):
             raise VersionNotExistError(__version)
+        if len(self.__transactions) > 0:
+            keys, value = list(self.data.versions.keys()), self.data.versions[__version]
+            self.__undoable(lambda: self.__restore_version(__version, value, keys))
+        self.__drop_version(__version)
+        self.__record('remove_version', __version)
+        if refresh:
+            self.__refresh()
+    
+    def sort_versions(self, reverse: bool=False, refresh: bool=True) -> None:
+        keys = list(self.versions_index)
+        if reverse:
+            keys.reverse()
+        previous = list(self.data.versions.keys())
+        if previous == keys:
+            return
+        self.__reorder_versions(keys)
+        self.__undoable(lambda: self.__reorder_versions(previous))
+        self.__record('sort_versions', reverse)
+        if refresh:
+            self.__refresh()
     
     # ! Change Methods
     def add_change(self, __version: str, __type: str, __description: str, refresh: bool=True) -> None:
@@ -140,12 +773,11 @@ class ChangelogFile:
             raise VersionNotExistError(__version)
         if not self.exist_change_type(__type):
             raise ChangeTypeKeyError(__type)
-        self.data.versions[__version].changes.append(
-            Change(
-                type=__type, description=__description
-            )
-        )
-        self.data.versions[__version].changes.sort(key=lambda change: change.type)
+        change = Change(type=__type, description=__description)
+        idx = self.__change_index(__version).insert(change)
+        self.__touch(__version)
+        self.__undoable(lambda: self.__drop_change(__version, idx))
+        self.__record('add_change', __version, __type, __description)
         if refresh:
             self.__refresh()
     
@@ -154,7 +786,74 @@ class ChangelogFile:
             raise VersionNotExistError(__version)
         if not (len(self.data.versions[__version].changes) > __index >= 0):
             raise IndexError(__index)
-        self.data.versions[__version].changes.pop(__index)
+        change = self.__change_index(__version).pop(__index)
+        self.__touch(__version)
+        self.__undoable(lambda: self.__insert_change(__version, __index, change))
+        self.__record('remove_change', __version, __index, target=(change.type, change.description))
+        if refresh:
+            self.__refresh()
+    
+    def edit_change(
+        self,
+        __version: str,
+        __index: int,
+        __type: Optional[str]=None,
+        __description: Optional[str]=None,
+        refresh: bool=True
+    ) -> int:
+        if not self.exist_version(__version):
+            raise VersionNotExistError(__version)
+        if not (len(self.data.versions[__version].changes) > __index >= 0):
+            raise IndexError(__index)
+        if (__type is not None) and not self.exist_change_type(__type):
+            raise ChangeTypeKeyError(__type)
+        index = self.__change_index(__version)
+        change = index.pop(__index)
+        previous_type, previous_description = change.type, change.description
+        if __type is not None:
+            change.type = __type
+        if __description is not None:
+            change.description = __description
+        new_index = index.insert(change)
+        self.__touch(__version)
+        self.__undoable(lambda: self.__revert_change(__version, new_index, __index, previous_type, previous_description))
+        self.__record('edit_change', __version, __index, __type, __description, target=(previous_type, previous_description))
+        if refresh:
+            self.__refresh()
+        return new_index
+    
+    def sort_changes(self, __version: str, __by: ChangeOrder, refresh: bool=True) -> None:
+        if not self.exist_version(__version):
+            raise VersionNotExistError(__version)
+        version = self.data.versions[__version]
+        if len(self.__transactions) > 0:
+            previous = list(version.changes)
+            self.__undoable(lambda: self.__restore_changes(__version, previous))
+        ChangeIndex(version.changes, __by, self.data.change_types)
+        version._index = None
+        self.__record('sort_changes', __version, __by)
+        if refresh:
+            self.__refresh()
+    
+    def changes_of_type(self, __version: str, __type: str) -> List[Change]:
+        if not self.exist_version(__version):
+            raise VersionNotExistError(__version)
+        return self.__change_index(__version).of_type(__type)
+    
+    def set_change_order(self, __order: ChangeOrder, refresh: bool=True) -> None:
+        if __order not in CHANGE_ORDERS:
+            raise ValueError(__order)
+        if __order == self.data.change_order:
+            return
+        if len(self.__transactions) > 0:
+            previous, changes = self.data.change_order, {
+                version: list(value.changes) for version, value in self.data.versions.items()
+            }
+            self.__undoable(lambda: self.__restore_change_order(previous, changes))
+        self.data.change_order = __order
+        for version in self.data.versions:
+            self.__change_index(version)
+        self.__record('set_change_order', __order)
         if refresh:
             self.__refresh()
     
@@ -168,13 +867,18 @@ class ChangelogFile:
         if len(__emoji) != 1:
             raise ChangeTypeEmojiNotCorrectError(__emoji)
         self.data.change_types[__key] = __emoji
+        self.__undoable(lambda: self.data.change_types.pop(__key))
+        self.__record('add_change_type', __key, __emoji)
         if refresh:
             self.__refresh()
     
     def remove_change_type(self, __key: str, refresh: bool=True) -> None:
         if not self.exist_change_type(__key):
             raise ChangeTypeKeyError(__key)
+        previous = dict(self.data.change_types)
         self.data.change_types.pop(__key)
+        self.__undoable(lambda: self.__restore_change_types(previous))
+        self.__record('remove_change_type', __key)
         if refresh:
             self.__refresh()
     
@@ -190,19 +894,197 @@ class ChangelogFile:
     ) -> None:
         if not isinstance(__change_types, (dict, Mapping, Iterable, Sequence)):
             raise TypeError(type(__change_types))
-        self.data.change_types = dict(__change_types)
+        __change_types = dict(__change_types)
+        if __change_types == self.data.change_types:
+            return
+        previous = self.data.change_types
+        self.data.change_types = __change_types
+        self.__undoable(lambda: setattr(self.data, 'change_types', previous))
+        self.__record('set_change_types', dict(self.data.change_types))
         if refresh:
             self.__refresh()
     
+    # ! Bulk Methods
+    def bulk_add(
+        self,
+        __records: Iterable[Union[BulkRecord, NumberedBulkItem]],
+        atomic: bool=False,
+        on_error: Optional[BulkErrorCallback]=None
+    ) -> BulkResult:
+        applied, failed = 0, 0
+        self.begin()
+        try:
+            for lineno, record in enumerate(__records, 1):
+                if isinstance(record, tuple):
+                    lineno, record = record
+                try:
+                    if isinstance(record, Exception):
+                        raise record
+                    try:
+                        if record_kind(record) == 'version':
+                            self.add_version(
+                                record['version'], parse_date(record['date']), record['url'], record['tag'],
+                                refresh=False
+                            )
+                        else:
+                            self.add_change(record['version'], record['type'], record['description'], refresh=False)
+                    except KeyError as e:
+                        raise RecordFormatError(f"Missing field: {e}.")
+                except Exception as e:
+                    failed += 1
+                    if on_error is not None:
+                        on_error(lineno, e)
+                else:
+                    applied += 1
+        except BaseException:
+            self.rollback()
+            raise
+        if atomic and (failed > 0):
+            self.rollback()
+            return BulkResult(0, failed)
+        if applied > 0:
+            self.__refresh()
+        self.commit()
+        return BulkResult(applied, failed)
+    
+    def ingest_git(
+        self,
+        __rev_range: Union[str, List[str]]='HEAD',
+        repo: str='.',
+        unreleased: Optional[str]=None,
+        url: str='',
+        tag: str='release',
+        commit_types: Dict[str, str]=DEFAULT_COMMIT_TYPES,
+        incremental: bool=True,
+        on_error: Optional[BulkErrorCallback]=None
+    ) -> BulkResult:
+        state = GitState(self.filepath)
+        revisions = [__rev_range] if isinstance(__rev_range, str) else list(__rev_range)
+        last_commit = state.last_commit(repo) if incremental else None
+        if last_commit is not None:
+            revisions.append(f'^{last_commit}')
+        ingest = GitIngest(
+            iter_commits(revisions, repo),
+            self.exist_version,
+            self.data.change_types,
+            commit_types,
+            unreleased, url, tag
+        )
+        result = self.bulk_add(ingest, on_error=on_error)
+        if incremental and (ingest.head is not None):
+            state.save(repo, ingest.head)
+        return result
+    
+    # ! Listener Methods
+    def add_listener(self, __listener: PhaseCallback) -> None:
+        super().add_listener(__listener)
+        for exporter in self.exporters.values():
+            exporter.listeners = self.listeners
+    
+    def remove_listener(self, __listener: PhaseCallback) -> None:
+        super().remove_listener(__listener)
+        for exporter in self.exporters.values():
+            exporter.listeners = self.listeners
+    
     # ! Exporter Methods
-    def set_exporter_extra(self, __format: str, __extra: Dict[str, Any]={}, reinit: bool=False) -> None:
-        self.data.exporters_extra[__format] = __extra
-        self.__refresh()
+    def set_exporter_extra(
+        self,
+        __format: str,
+        __extra: Dict[str, Any]={},
+        reinit: bool=False,
+        refresh: bool=True
+    ) -> None:
+        if self.data.exporters_extra.get(__format) != __extra:
+            if len(self.__transactions) > 0:
+                previous = self.data.exporters_extra.get(__format)
+                self.__undoable(lambda: self.__restore_exporter_extra(__format, previous))
+            self.data.exporters_extra[__format] = __extra
+            self.__record('set_exporter_extra', __format, dict(__extra))
+            if refresh:
+                self.__refresh()
         if reinit:
             self.exporters[__format].__init__(**__extra)
     
     def set_exporter(self, __format: str, __exporter: Type[ExporterBase]) -> None:
         self.exporters[__format] = __exporter(**self.data.exporters_extra[__format])
+        self.exporters[__format].listeners = self.listeners
     
-    def export(self, __filepath: str, __format: str=DEFAULT_EXPORTER) -> None:
-        self.exporters[__format].export(__filepath, self.data)
\ No newline at end of file
+    def select(self, __selection: VersionFilter) -> ChangeLog:
+        return select(self.data, self.versions_index, __selection)
+    
+    def export(self, __target: ExportTarget, __format: str=DEFAULT_EXPORTER, selection: Optional[VersionFilter]=None) -> None:
+        self.exporters[__format].export(__target, self.data if selection is None else self.select(selection))
+    
+    def search(
+        self,
+        __query: str,
+        selection: Optional[VersionFilter]=None,
+        limit: Optional[int]=None
+    ) -> List[SearchHit]:
+        tokens = set(tokenize(__query))
+        candidates = self.__search_index().candidates(tokens)
+        with self.phase('search.query') as phase:
+            # * Newest versions first, so a limited search stops as soon as it has enough hits
+            if (selection is not None) and selection.filters_versions:
+                versions = reversed(select_versions(self.data.versions, self.versions_index, selection))
+            elif len(candidates) * PROBE_RATIO < len(self.data.versions):
+                versions = sorted(candidates, key=version_key, reverse=True)
+            else:
+                versions = reversed(self.versions_index.versions)
+            hits = list(islice(self.__search_hits(versions, candidates, tokens, selection), limit))
+            phase.count = len(hits)
+        return hits
+    
+    def watch(self, __targets: Iterable[Tuple[ExportTarget, str]], selection: Optional[VersionFilter]=None, **options: Any) -> None:
+        from .watch import watch_export
+        watch_export(self, __targets, selection, **options)
+    
+    def export_many(
+        self,
+        __targets: Iterable[Tuple[ExportTarget, str]],
+        processes: bool=True,
+        workers: Optional[int]=None,
+        selection: Optional[VersionFilter]=None
+    ) -> List[ExportResult]:
+        targets = list(__targets)
+        data = self.data if selection is None else self.select(selection)
+        results: List[ExportResult] = [ExportResult(target, format) for target, format in targets]
+        # * Paths that resolve to one file are written once, two writers of one file would race in the pools
+        written: Dict[str, int] = {}
+        duplicates: Dict[int, int] = {}
+        for idx, (target, format) in enumerate(targets):
+            if isinstance(target, (str, os.PathLike)):
+                duplicates[idx] = written.setdefault(os.path.realpath(target), idx)
+        render_pool: Executor = ProcessPoolExecutor(workers) if processes else ThreadPoolExecutor(workers)
+        with render_pool, ThreadPoolExecutor(workers) as write_pool:
+            renders: Dict[Future, int] = {}
+            for idx, (target, format) in enumerate(targets):
+                if duplicates.get(idx, idx) != idx:
+                    continue
+                if format not in self.exporters:
+                    results[idx] = results[idx]._replace(error=KeyError(format))
+                else:
+                    # * Only a path goes to the render pool, where it locates the render cache
+                    cached = target if isinstance(target, (str, os.PathLike)) else None
+                    renders[render_pool.submit(render_export, self.exporters[format], data, cached)] = idx
+            writes: Dict[Future, int] = {}
+            for render in as_completed(renders):
+                idx = renders[render]
+                target, format = targets[idx]
+                try:
+                    writes[write_pool.submit(self.exporters[format].save, target, render.result())] = idx
+                except Exception as e:
+                    results[idx] = results[idx]._replace(error=e)
+            for write in as_completed(writes):
+                try:
+                    write.result()
+                except Exception as e:
+                    results[writes[write]] = results[writes[write]]._replace(error=e)
+        for idx, first in duplicates.items():
+            if first == idx:
+                continue
+            if targets[idx][1] != targets[first][1]:
+                results[idx] = results[idx]._replace(error=ValueError(f'{repr(targets[idx][0])} is already exported as {repr(targets[first][1])}.'))
+            else:
+                results[idx] = results[idx]._replace(error=results[first].error)
+        return results
\ No newline at end of file
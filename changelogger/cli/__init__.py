@@ -1,3 +1,16 @@
-from .cli import main
+import sys
+# > Typing
+from typing import Optional, Sequence
+# > Local Imports
+from .client import forward
+
+# ! Main
+def main(args: Optional[Sequence[str]]=None) -> None:
+    # * Runs the command in a running daemon if there is one, before importing the command line interface itself
+    code = forward(sys.argv[1:] if args is None else args)
+    if code is not None:
+        sys.exit(code)
+    from .cli import main as run
+    run(args=args)
 
 __all__ = ['main']
\ No newline at end of file
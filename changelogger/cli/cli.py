@@ -1,25 +1,63 @@
 import os
+import sys
 import rich_click as click
 from datetime import datetime
-from rich.tree import Tree
-from rich.console import Console
-from changelogger import ChangelogFile, DEFAULT_EXPORTER
+from changelogger.units import DEFAULT_EXPORTER
 # > Typing
-from typing import Callable, Literal, Optional, Any
+from typing import TYPE_CHECKING, Callable, Literal, Optional, TextIO, Tuple, Dict, List, Any
 # > Local Imports
 from . import params
 
+if TYPE_CHECKING:
+    from rich.console import Console
+    from changelogger import ChangelogFile
+    from changelogger.profiling import Profiler
+    from changelogger.selection import VersionFilter
+
 # ! Constants
-DEFAULT_FILEPATH = os.path.abspath('changelog.yaml')
-DEFAULT_OUTPUT_FILEPATH = os.path.abspath('changelog')
+# * Relative, so that they resolve against the directory of each command run by the daemon
+DEFAULT_FILEPATH = 'changelog.yaml'
+DEFAULT_OUTPUT_FILEPATH = 'changelog'
+TREE_BRANCH = '├── '
+TREE_LAST = '└── '
+TREE_PIPE = '│   '
+TREE_SPACE = '    '
+
+# ! Deferred Class
+class Deferred:
+    def __init__(self, factory: Callable[[], Any]) -> None:
+        self.__factory = factory
+        self.__value = None
+    
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.get(), name)
+    
+    def get(self) -> Any:
+        if self.__value is None:
+            self.__value = self.__factory()
+        return self.__value
+
+# ! Factories
+def load_console() -> 'Console':
+    from rich.console import Console
+    return Console()
+
+def load_changelog() -> 'ChangelogFile':
+    if opener is not None:
+        return opener(filepath, options)
+    from changelogger import ChangelogFile
+    return ChangelogFile(filepath, **options)
 
 # ! Vars
-console = Console()
+console = Deferred(load_console)
 
 # ! Runtime variables
 debug = False
+options = {}
 filepath = None
-changelog = None
+changelog = Deferred(load_changelog)
+# * Set by the daemon to reuse its loaded changelogs
+opener: Optional[Callable[[str, Dict[str, Any]], 'ChangelogFile']] = None
 
 # ! Runtime Methods
 def exceptor():
@@ -27,6 +65,9 @@ def exceptor():
         def wrapped(*args, **kwargs):
             try:
                 return method(*args, **kwargs)
+            except click.ClickException:
+                # * Already meant for the user, and click exits with its code instead of going on
+                raise
             except Exception as e:
                 if debug:
                     console.print_exception(show_locals=True, word_wrap=True, width=console.width)
@@ -35,12 +76,133 @@ def exceptor():
         return wrapped
     return wrapper
 
+def print_profile(profiler: 'Profiler') -> None:
+    from rich.console import Console
+    from rich.table import Table
+    elapsed = profiler.elapsed
+    table = Table('Phase', 'Calls', 'Time', 'Share', 'Bytes', 'Count', title='Profile')
+    for phase in sorted(profiler.summary(), key=lambda phase: phase.duration, reverse=True):
+        table.add_row(
+            phase.name, str(phase.calls),
+            f'{phase.duration * 1000:.2f} ms', f'{phase.duration / elapsed:.1%}',
+            str(phase.bytes), str(phase.count)
+        )
+    table.add_row('[bold]total[/bold]', '', f'{elapsed * 1000:.2f} ms', '100.0%', '', '')
+    Console(stderr=True).print(table)
+
+def parse_targets(targets: Tuple[str, ...]) -> List[Tuple[str, str]]:
+    pairs = []
+    for target in targets:
+        target_format, sep, target_output = target.partition('=')
+        if len(sep) == 0:
+            raise click.BadParameter(f'{repr(target)} is not FORMAT=PATH.', param_hint='--target')
+        pairs.append((os.path.abspath(target_output), target_format))
+    return pairs
+
+def watch_export(targets: List[Tuple[str, str]], selection: Optional['VersionFilter'], debounce: float, interval: float, poll: bool) -> None:
+    def on_export(exported: List[Tuple[str, str]], elapsed: float) -> None:
+        console.print(f"[{datetime.now():%H:%M:%S}] Exported {', '.join(target for target, _ in exported)} in {elapsed * 1000:.1f} ms")
+    
+    def on_error(error: Exception) -> None:
+        console.print(f"[{datetime.now():%H:%M:%S}] [red]{error.__class__.__name__}[/red]: {error.__str__()}")
+    
+    try:
+        changelog.watch(
+            targets, selection,
+            debounce=debounce, interval=interval, polling=poll,
+            on_export=on_export, on_error=on_error
+        )
+    except KeyboardInterrupt:
+        pass
+
+def tree_versions(versions: Tuple[str, ...], start: Optional[str], end: Optional[str], after: Optional[str]) -> List[str]:
+    # * Only keys are walked here, so lazily loaded and sharded changelogs materialize just the printed versions
+    keys = list(changelog.data.versions)
+    if any([start, end, after]):
+        from changelogger.selection import VersionFilter, select_versions
+        selected = set(select_versions(changelog.data.versions, changelog.versions_index, VersionFilter(start, end, after)))
+        keys = [key for key in keys if key in selected]
+    if len(versions) > 0:
+        for version in versions:
+            if not changelog.exist_version(version):
+                from changelogger.exceptions import VersionNotExistError
+                raise VersionNotExistError(version)
+        wanted = set(versions)
+        keys = [key for key in keys if key in wanted]
+    return keys
+
+def tree_lines(prefix: str, items: List[str], last: bool=True) -> List[str]:
+    return [
+        prefix + (TREE_LAST if last and (idx == len(items) - 1) else TREE_BRANCH) + item
+        for idx, item in enumerate(items)
+    ]
+
+def print_tree(keys: List[str], remaining: int, next_offset: int) -> None:
+    # * Printed one version at a time with hand-drawn guides, so output starts at once and no tree of the whole changelog is built.
+    # * Long lines are left to the terminal to wrap and the markup is not highlighted again, which cost more than the rest of the rendering.
+    format_date = changelog.exporters[DEFAULT_EXPORTER].format_date
+    change_types = changelog.data.change_types
+    console.print(f'\\[[yellow]{os.path.basename(changelog.filepath)}[/yellow]]')
+    console.print('\n'.join(
+        [TREE_BRANCH + '\\[[magenta]change_types[/magenta]]'] +
+        tree_lines(TREE_PIPE, [f'{idx}: {repr(change_type)}' for idx, change_type in enumerate(change_types.items())]) +
+        [TREE_LAST + '\\[[magenta]versions[/magenta]]']
+    ))
+    for idx, key in enumerate(keys):
+        version = changelog.data.versions[key]
+        last = (idx == len(keys) - 1) and (remaining == 0)
+        lines = tree_lines(TREE_SPACE, [
+            f'[yellow]v{version.version}[/yellow] ([bold not italic cyan]{format_date(version.date)}[/bold not italic cyan]) \\[[green]{version.tag.upper()}[/green]]'
+        ], last)
+        lines.extend(tree_lines(TREE_SPACE + (TREE_SPACE if last else TREE_PIPE), [
+            f'{change_idx}: {change_types[change.type]} [green]{change.description}[/green]'
+            for change_idx, change in enumerate(version.changes)
+        ]))
+        console.print('\n'.join(lines), soft_wrap=True, highlight=False)
+    if remaining > 0:
+        console.print(TREE_SPACE + TREE_LAST + f'[dim]{remaining} more, continue with --offset {next_offset}[/dim]')
+
+def print_plain_tree(keys: List[str]) -> None:
+    format_date = changelog.exporters[DEFAULT_EXPORTER].format_date
+    change_types = changelog.data.change_types
+    write = sys.stdout.write
+    for key in keys:
+        version = changelog.data.versions[key]
+        lines = [f'v{version.version} ({format_date(version.date)}) [{version.tag.upper()}]']
+        lines.extend(
+            f'  {idx}: {change_types[change.type]} {change.description}'
+            for idx, change in enumerate(version.changes)
+        )
+        write('\n'.join(lines) + '\n')
+    sys.stdout.flush()
+
+def start_profiling(summary: bool, output: Optional[str]) -> None:
+    from changelogger.profiling import Profiler
+    profiler = Profiler()
+    options['listeners'] = [profiler]
+    stats = None
+    if (output is not None) and not output.endswith('.json'):
+        import cProfile
+        stats = cProfile.Profile()
+        stats.enable()
+    
+    def finish() -> None:
+        if stats is not None:
+            stats.disable()
+            stats.dump_stats(output)
+        elif output is not None:
+            profiler.dump_chrome_trace(output)
+        if summary:
+            print_profile(profiler)
+    
+    click.get_current_context().call_on_close(finish)
+
 # ! Main (Group)
 @click.group()
 @click.option(
     '--filepath', '-f', 'fp',
-    help='Path to changelog file.',
-    type=click.Path(dir_okay=False, resolve_path=True, path_type=str),
+    help='Path to changelog file, or to a directory ending with ".d" for one file per version.',
+    type=click.Path(resolve_path=True, path_type=str),
     default=DEFAULT_FILEPATH, show_default=True
 )
 @click.option(
@@ -48,13 +210,70 @@ def exceptor():
     help='Enable debug mode.',
     is_flag=True, default=False
 )
+@click.option(
+    '--no-cache', 'no_cache',
+    help='Do not use the snapshot cache.',
+    is_flag=True, default=False
+)
+@click.option(
+    '--lazy', 'lazy',
+    help='Load versions on demand.',
+    is_flag=True, default=False
+)
+@click.option(
+    '--strict', 'strict',
+    help='Always parse the changelog itself instead of its cached snapshot.',
+    is_flag=True, default=False
+)
+@click.option(
+    '--lock', 'lock',
+    help='Hold the changelog lock for the whole command instead of merging concurrent changes.',
+    is_flag=True, default=False
+)
+@click.option(
+    '--lock-timeout', 'lock_timeout',
+    help='Seconds to wait for the changelog lock.',
+    type=click.FLOAT, default=None
+)
+@click.option(
+    '--profile', 'profile',
+    help='Print a per-phase timing breakdown after the command.',
+    is_flag=True, default=False
+)
+@click.option(
+    '--profile-output', 'profile_output',
+    help='Write a Chrome trace (*.json) or cProfile stats (any other name) of the command.',
+    type=click.Path(dir_okay=False, resolve_path=True, path_type=str), default=None
+)
 @click.version_option(package_name='changelogger')
 @exceptor()
-def main(fp: str, _debug: bool):
-    global filepath, changelog, debug
+def main(
+    fp: str,
+    _debug: bool,
+    no_cache: bool,
+    lazy: bool,
+    strict: bool,
+    lock: bool,
+    lock_timeout: Optional[float],
+    profile: bool,
+    profile_output: Optional[str]
+):
+    global filepath, changelog, debug, options
     debug = _debug
     filepath = fp
-    changelog = ChangelogFile(filepath)
+    options = {'cache': not no_cache, 'lazy': lazy, 'strict': strict, 'lock_timeout': lock_timeout}
+    if lock:
+        from changelogger.locking import FileLock
+        from changelogger.exceptions import LockTimeoutError
+        file_lock = FileLock.of(filepath, lock_timeout)
+        try:
+            file_lock.acquire()
+        except LockTimeoutError as e:
+            raise click.ClickException(str(e))
+        click.get_current_context().call_on_close(file_lock.release)
+    if profile or (profile_output is not None):
+        start_profiling(profile, profile_output)
+    changelog = Deferred(load_changelog)
 
 # ! Main (Group) > Commands
 @main.command('create', help='Creating an empty changelog.')
@@ -63,27 +282,69 @@ def create():
     global changelog
     if os.path.exists(filepath):
         try:
-            os.remove(filepath)
+            if os.path.isdir(filepath):
+                import shutil
+                shutil.rmtree(filepath)
+            else:
+                os.remove(filepath)
         except:
             pass
-    changelog = ChangelogFile(filepath)
-
-@main.command('tree', help='Displaying the changelog as a tree.')
-@exceptor()
-def tree():
-    main_tree = Tree(f'\\[[yellow]{os.path.basename(changelog.filepath)}[/yellow]]', highlight=True)
-    change_types_tree = main_tree.add('\\[[magenta]change_types[/magenta]]')
-    for idx, change_type in enumerate(changelog.data.change_types.items()):
-        change_types_tree.add(f'{idx}: {repr(change_type)}')
-    versions_tree = main_tree.add('\\[[magenta]versions[/magenta]]')
-    for version in changelog.data.versions.values():
-        version_datetime = datetime.fromtimestamp(version.date)
-        version_tree = versions_tree.add(
-            f'[yellow]v{version.version}[/yellow] ([bold not italic cyan]{version_datetime.day:02d}.{version_datetime.month:02d}.{version_datetime.year:04d}[/bold not italic cyan]) \\[[green]{version.tag.upper()}[/green]]'
-        )
-        for idx, change in enumerate(version.changes):
-            version_tree.add(f'{idx}: {changelog.data.change_types[change.type]} [green]{change.description}[/green]')
-    console.print(main_tree)
+    changelog = Deferred(load_changelog)
+    changelog.get()
+
+@main.command('tree', help='Displaying the changelog as a tree, version by version.')
+@click.option(
+    '-n', '--limit', 'limit',
+    help='Show at most N of the selected versions.',
+    type=click.IntRange(min=0), default=None
+)
+@click.option(
+    '--offset', 'offset',
+    help='Skip the first N of the selected versions.',
+    type=click.IntRange(min=0), default=0, show_default=True
+)
+@click.option(
+    '--version', 'versions',
+    help='Show only this version, can be repeated.',
+    type=params.Version(), multiple=True
+)
+@click.option(
+    '--from', 'start',
+    help='Oldest version to show.',
+    type=params.Version(), default=None
+)
+@click.option(
+    '--to', 'end',
+    help='Newest version to show.',
+    type=params.Version(), default=None
+)
+@click.option(
+    '--since', 'after',
+    help='Show only versions newer than this one.',
+    type=params.Version(), default=None
+)
+@click.option(
+    '--plain', 'plain',
+    help='Print plain text without colors and tree guides, for piping into other tools.',
+    is_flag=True, default=False
+)
+@exceptor()
+def tree(
+    limit: Optional[int],
+    offset: int,
+    versions: Tuple[str, ...],
+    start: Optional[str],
+    end: Optional[str],
+    after: Optional[str],
+    plain: bool
+):
+    keys = tree_versions(versions, start, end, after)
+    page = keys[offset:] if limit is None else keys[offset:offset + limit]
+    remaining = len(keys) - offset - len(page)
+    if plain:
+        print_plain_tree(page)
+    else:
+        print_tree(page, max(remaining, 0), offset + len(page))
 
 @main.command('export', help='Export changelog.')
 @click.option(
@@ -93,12 +354,284 @@ def tree():
 )
 @click.option(
     '-o', '--output', 'output',
-    type=click.Path(exists=False, file_okay=True, dir_okay=False),
+    help='Path to output file, or "-" for stdout.',
+    type=click.Path(exists=False, file_okay=True, dir_okay=False, allow_dash=True),
     default=DEFAULT_OUTPUT_FILEPATH, show_default=True
 )
+@click.option(
+    '-t', '--target', 'targets',
+    help='Export target as FORMAT=PATH, can be repeated. Targets are rendered in parallel instead of --format/--output.',
+    type=click.STRING, multiple=True
+)
+@click.option(
+    '-j', '--jobs', 'jobs',
+    help='Number of parallel export workers.',
+    type=click.INT, default=None
+)
+@click.option(
+    '--from', 'start',
+    help='Oldest version to export.',
+    type=params.Version(), default=None
+)
+@click.option(
+    '--to', 'end',
+    help='Newest version to export.',
+    type=params.Version(), default=None
+)
+@click.option(
+    '--since', 'after',
+    help='Export only versions newer than this one.',
+    type=params.Version(), default=None
+)
+@click.option(
+    '--since-date', 'since_date',
+    help='Export only versions released on or after this date.',
+    type=click.DateTime(['%d.%m.%Y', '%d.%m.%Y-%H:%M:%S', '%d.%m.%Y %H:%M:%S', '%Y-%m-%d']), default=None
+)
+@click.option(
+    '--tag', 'tags',
+    help='Export only versions with this tag, can be repeated.',
+    type=click.STRING, multiple=True
+)
+@click.option(
+    '-n', '--last', 'last',
+    help='Export only the newest N of the selected versions.',
+    type=click.IntRange(min=0), default=None
+)
+@click.option(
+    '--type', 'types',
+    help='Export only changes of this type, can be repeated.',
+    type=click.STRING, multiple=True
+)
+@click.option(
+    '--exclude-type', 'exclude_types',
+    help='Leave out changes of this type, can be repeated.',
+    type=click.STRING, multiple=True
+)
+@click.option(
+    '-w', '--watch', 'watch',
+    help='Keep running and export again whenever the changelog changes.',
+    is_flag=True, default=False
+)
+@click.option(
+    '--debounce', 'debounce',
+    help='Seconds without further writes before exporting again.',
+    type=click.FLOAT, default=0.2, show_default=True
+)
+@click.option(
+    '--interval', 'interval',
+    help='Seconds between checks when the changelog is polled.',
+    type=click.FLOAT, default=0.5, show_default=True
+)
+@click.option(
+    '--poll', 'poll',
+    help='Poll the changelog instead of using inotify.',
+    is_flag=True, default=False
+)
 @exceptor()
-def export(format: str, output: str):
-    changelog.export(output, format)
+def export(
+    format: str,
+    output: str,
+    targets: Tuple[str, ...],
+    jobs: Optional[int],
+    start: Optional[str],
+    end: Optional[str],
+    after: Optional[str],
+    since_date: Optional[datetime],
+    tags: Tuple[str, ...],
+    last: Optional[int],
+    types: Tuple[str, ...],
+    exclude_types: Tuple[str, ...],
+    watch: bool,
+    debounce: float,
+    interval: float,
+    poll: bool
+):
+    selection = None
+    if any([start, end, after, since_date, tags, last is not None, types, exclude_types]):
+        from changelogger import VersionFilter
+        selection = VersionFilter(start, end, after, since_date, tags, last, types, exclude_types)
+    if watch:
+        if output == '-':
+            raise click.BadParameter('Watching needs an output file.', param_hint='--output')
+        watch_export(parse_targets(targets) or [(os.path.abspath(output), format)], selection, debounce, interval, poll)
+        return
+    if len(targets) > 0:
+        for result in changelog.export_many(parse_targets(targets), workers=jobs, selection=selection):
+            if result.ok:
+                console.print(f"[green]{result.format}[/green]: {result.target}")
+            else:
+                console.print(f"[red]{result.format}[/red]: {result.target}: [red]{result.error.__class__.__name__}[/red]: {result.error}")
+        return
+    if output == '-':
+        changelog.export(sys.stdout, format, selection)
+        sys.stdout.write('\n')
+    else:
+        changelog.export(output, format, selection)
+
+@main.command('search', help='Searching change descriptions for all words of a query, newest versions first.')
+@click.argument('query', type=click.STRING)
+@click.option(
+    '-l', '--limit', 'limit',
+    help='Maximum number of changes to show, 0 for all.',
+    type=click.IntRange(min=0), default=20, show_default=True
+)
+@click.option(
+    '--from', 'start',
+    help='Oldest version to search.',
+    type=params.Version(), default=None
+)
+@click.option(
+    '--to', 'end',
+    help='Newest version to search.',
+    type=params.Version(), default=None
+)
+@click.option(
+    '--since', 'after',
+    help='Search only versions newer than this one.',
+    type=params.Version(), default=None
+)
+@click.option(
+    '--since-date', 'since_date',
+    help='Search only versions released on or after this date.',
+    type=click.DateTime(['%d.%m.%Y', '%d.%m.%Y-%H:%M:%S', '%d.%m.%Y %H:%M:%S', '%Y-%m-%d']), default=None
+)
+@click.option(
+    '--tag', 'tags',
+    help='Search only versions with this tag, can be repeated.',
+    type=click.STRING, multiple=True
+)
+@click.option(
+    '--last', 'last',
+    help='Search only the newest N of the selected versions.',
+    type=click.IntRange(min=0), default=None
+)
+@click.option(
+    '--type', 'types',
+    help='Search only changes of this type, can be repeated.',
+    type=click.STRING, multiple=True
+)
+@click.option(
+    '--exclude-type', 'exclude_types',
+    help='Leave out changes of this type, can be repeated.',
+    type=click.STRING, multiple=True
+)
+@exceptor()
+def search(
+    query: str,
+    limit: int,
+    start: Optional[str],
+    end: Optional[str],
+    after: Optional[str],
+    since_date: Optional[datetime],
+    tags: Tuple[str, ...],
+    last: Optional[int],
+    types: Tuple[str, ...],
+    exclude_types: Tuple[str, ...]
+):
+    selection = None
+    if any([start, end, after, since_date, tags, last is not None, types, exclude_types]):
+        from changelogger import VersionFilter
+        selection = VersionFilter(start, end, after, since_date, tags, last, types, exclude_types)
+    hits = changelog.search(query, selection, limit or None)
+    for hit in hits:
+        console.print(f'[yellow]v{hit.version}[/yellow] {hit.index}: {changelog.data.change_types.get(hit.change.type, hit.change.type)} [green]{hit.change.description}[/green]')
+    console.print(f"{len(hits)} {'change' if len(hits) == 1 else 'changes'} found")
+
+@main.command('serve', help='Keeping changelogs loaded and running the commands of other changelogger calls over a Unix socket.')
+@click.option(
+    '-s', '--socket', 'socket_path',
+    help='Path to the socket, $CHANGELOGGER_SOCKET or a per-user path by default.',
+    type=click.Path(dir_okay=False, resolve_path=True, path_type=str), default=None
+)
+@click.option(
+    '--delay', 'delay',
+    help='Seconds to wait for more commands before writing, so that they share a single write.',
+    type=click.FLOAT, default=0.0, show_default=True
+)
+@exceptor()
+def serve(socket_path: Optional[str], delay: float):
+    from .client import socket_path as default_socket_path
+    from .daemon import Daemon
+    daemon = Daemon(socket_path or default_socket_path(), delay)
+    console.print(f"Listening on {daemon.socket_path}")
+    try:
+        daemon.serve()
+    except KeyboardInterrupt:
+        pass
+
+@main.command('convert', help='Saving the changelog as a single file or as a directory with one file per version.')
+@click.argument('target', type=click.Path(resolve_path=True, path_type=str))
+@exceptor()
+def convert(target: str):
+    changelog.save_as(target)
+    console.print(f"Saved to {target}")
+
+@main.command('import', help='Importing versions and changes from a JSONL or CSV file.')
+@click.argument('source', type=click.File('r', encoding='utf-8', lazy=False), default='-')
+@click.option(
+    '--format', 'format',
+    help='Format of the records, guessed from the file extension by default.',
+    type=click.Choice(['jsonl', 'csv']), default=None
+)
+@click.option(
+    '--atomic', 'atomic',
+    help='Apply nothing if any record fails.',
+    is_flag=True, default=False
+)
+@exceptor()
+def import_records(source: TextIO, format: Optional[str], atomic: bool):
+    from changelogger.bulk import read_records, record_format
+    
+    def on_error(lineno: int, error: Exception) -> None:
+        console.print(f"line {lineno}: [red]{error.__class__.__name__}[/red]: {error.__str__()}")
+    
+    records = read_records(source, format or record_format(source.name))
+    result = changelog.bulk_add(records, atomic=atomic, on_error=on_error)
+    if atomic and not result.ok:
+        console.print(f"Nothing was imported: {result.failed} records failed.")
+    else:
+        console.print(f"Imported {result.applied} records, {result.failed} failed.")
+
+@main.command('ingest-git', help='Adding changes from conventional commit messages of a git repository.')
+@click.argument('rev_range', type=click.STRING, default='HEAD')
+@click.option(
+    '-r', '--repo', 'repo',
+    help='Path to the git repository.',
+    type=click.Path(exists=True, file_okay=False, dir_okay=True),
+    default='.', show_default=True
+)
+@click.option(
+    '-u', '--unreleased', 'unreleased',
+    help='Version for commits newer than the latest version tag.',
+    type=params.Version(), default=None
+)
+@click.option(
+    '--url', 'url',
+    help='URL of versions created from tags, may use {version} and {tag}.',
+    type=click.STRING, default='', show_default=True
+)
+@click.option(
+    '--tag', 'tag',
+    help='Tag of versions created from git tags.',
+    type=click.STRING, default='release', show_default=True
+)
+@click.option(
+    '--full', 'full',
+    help='Ignore the last ingested commit and process the whole range.',
+    is_flag=True, default=False
+)
+@exceptor()
+def ingest_git(rev_range: str, repo: str, unreleased: Optional[str], url: str, tag: str, full: bool):
+    def on_error(lineno: int, error: Exception) -> None:
+        console.print(f"record {lineno}: [red]{error.__class__.__name__}[/red]: {error.__str__()}")
+    
+    result = changelog.ingest_git(
+        rev_range, repo,
+        unreleased=unreleased, url=url, tag=tag,
+        incremental=not full, on_error=on_error
+    )
+    console.print(f"Ingested {result.applied} records, {result.failed} failed.")
 
 @main.group('change', help='Managing change logs.')
 @exceptor()
@@ -144,29 +677,20 @@ def edit_change(
     tp: Optional[str]=None,
     description: Optional[str]=None
 ):
-    if tp is not None:
-        changelog.data.versions[version].changes[index].type = tp
-    if description is not None:
-        changelog.data.versions[version].changes[index].description = description
-    changelog.refresh()
+    changelog.edit_change(version, index, tp, description)
 
 @change.command('sort', help='Sorting a changes.')
 @click.argument('version', type=params.Version())
 @click.argument('by', type=click.Choice(['type-text', 'type-index']))
 @exceptor()
 def sort_change(version: str, by: Literal['type-text', 'type-index']):
-    if by == 'type-text':
-        changelog.data.versions[version].changes.sort(
-            key=lambda change: change.type
-        )
-    elif by == 'type-index':
-        ctsi = {change_type: idx for idx, change_type in enumerate(changelog.data.change_types)}
-        changelog.data.versions[version].changes.sort(
-            key=lambda change: ctsi[change.type]
-        )
-    else:
-        raise ValueError(by)
-    changelog.refresh()
+    changelog.sort_changes(version, by)
+
+@change.command('order', help='Setting the order in which changes are kept.')
+@click.argument('order', type=click.Choice(['type-text', 'type-index', 'insertion']))
+@exceptor()
+def order_change(order: Literal['type-text', 'type-index', 'insertion']):
+    changelog.set_change_order(order)
 
 # ! Main (Group) > Version (Group) > Commands
 @version.command('add', help='Adding a version.')
@@ -186,10 +710,12 @@ def remove_version(version: str):
 
 @version.command('sort', help='Sorting a versions.')
 @click.argument('by', type=click.Choice(['version']))
+@click.option(
+    '-r', '--reverse', 'reverse',
+    help='Newest versions first.',
+    is_flag=True, default=False
+)
 @exceptor()
-def sort_version(by: Literal['version']):
+def sort_version(by: Literal['version'], reverse: bool):
     if by == 'version':
-        changelog.data.versions = {
-            key: value for key, value in sorted(list(changelog.data.versions.items()), key=lambda x: x[0])
-        }
-    changelog.refresh()
\ No newline at end of file
+        changelog.sort_versions(reverse)
\ No newline at end of file
@@ -0,0 +1,133 @@
+import os
+import sys
+import json
+import time
+import socket
+# > Typing
+from typing import BinaryIO, Optional, Sequence, Dict, Any
+
+# ! Constants
+SOCKET_ENV = 'CHANGELOGGER_SOCKET'
+DAEMON_DISABLE_ENV = 'CHANGELOGGER_NO_DAEMON'
+CONNECT_TIMEOUT = 1.0
+CONNECT_RETRY_INTERVAL = 0.005
+# * Options of the main group that take a value
+VALUE_OPTIONS = ('-f', '--filepath', '--lock-timeout', '--profile-output')
+# * Profiling measures the in-process run, creating removes the file the daemon keeps loaded
+LOCAL_OPTIONS = ('--profile', '--profile-output')
+LOCAL_COMMANDS = ('serve', 'create')
+
+# ! Methods
+def daemon_disabled() -> bool:
+    return len(os.environ.get(DAEMON_DISABLE_ENV, '')) > 0
+
+def socket_path() -> Optional[str]:
+    if not hasattr(socket, 'AF_UNIX'):
+        return None
+    path = os.environ.get(SOCKET_ENV)
+    if path:
+        return os.path.abspath(path)
+    dirpath = os.environ.get('XDG_RUNTIME_DIR')
+    if not dirpath:
+        import tempfile
+        dirpath = tempfile.gettempdir()
+    return os.path.join(dirpath, f'changelogger-{os.getuid()}.sock')
+
+def connect(path: str, timeout: Optional[float]=CONNECT_TIMEOUT) -> Optional[socket.socket]:
+    deadline = None if timeout is None else time.monotonic() + timeout
+    while True:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(timeout)
+        try:
+            sock.connect(path)
+        except BlockingIOError:
+            # * The daemon is busy and its backlog is full
+            sock.close()
+            if (deadline is not None) and (time.monotonic() >= deadline):
+                return None
+            time.sleep(CONNECT_RETRY_INTERVAL)
+            continue
+        except OSError:
+            sock.close()
+            return None
+        sock.settimeout(None)
+        return sock
+
+def read_message(file: BinaryIO) -> Optional[Dict[str, Any]]:
+    line = file.readline()
+    if len(line) == 0:
+        return None
+    return json.loads(line)
+
+def write_message(file: BinaryIO, message: Dict[str, Any]) -> None:
+    file.write(json.dumps(message).encode('utf-8') + b'\n')
+    file.flush()
+
+def command_of(argv: Sequence[str]) -> Optional[Sequence[str]]:
+    # * Returns the arguments starting with the command name, or None for local-only invocations
+    idx = 0
+    while idx < len(argv):
+        arg = argv[idx]
+        if arg.split('=', 1)[0] in LOCAL_OPTIONS:
+            return None
+        if arg in VALUE_OPTIONS:
+            idx += 2
+        elif arg.startswith('-'):
+            idx += 1
+        else:
+            return argv[idx:]
+    return None
+
+def reads_stdin(args: Sequence[str]) -> bool:
+    # * "import" reads stdin unless a source file is given
+    idx = 1
+    while idx < len(args):
+        if args[idx] == '--format':
+            idx += 2
+        elif args[idx].startswith('-') and (args[idx] != '-'):
+            idx += 1
+        else:
+            return args[idx] == '-'
+    return True
+
+def forwardable(argv: Sequence[str]) -> bool:
+    args = command_of(argv)
+    if (args is None) or (args[0] in LOCAL_COMMANDS):
+        return False
+    if (args[0] == 'export') and any(arg in ('-w', '--watch') for arg in args):
+        return False
+    return not ((args[0] == 'import') and reads_stdin(args))
+
+def terminal_width() -> Optional[int]:
+    try:
+        return os.get_terminal_size(sys.stdout.fileno()).columns
+    except (OSError, ValueError):
+        return None
+
+def forward(argv: Sequence[str]) -> Optional[int]:
+    # * Returns the exit code of the forwarded command, or None to run it in this process
+    if daemon_disabled() or not forwardable(argv):
+        return None
+    path = socket_path()
+    if (path is None) or not os.path.exists(path):
+        return None
+    if os.stat(path).st_uid != os.getuid():
+        return None
+    sock = connect(path)
+    if sock is None:
+        return None
+    with sock, sock.makefile('rwb') as file:
+        write_message(file, {
+            'argv': list(argv),
+            'cwd': os.getcwd(),
+            'terminal': sys.stdout.isatty(),
+            'width': terminal_width()
+        })
+        response = read_message(file)
+    # * The command may have run already, so a lost response is reported instead of running it again
+    if response is None:
+        sys.stderr.write('The changelogger daemon closed the connection.\n')
+        return 1
+    sys.stdout.write(response['stdout'])
+    sys.stderr.write(response['stderr'])
+    return response['code']
@@ -0,0 +1,180 @@
+import os
+import io
+import time
+import queue
+import signal
+import socket
+import threading
+import socketserver
+from functools import partial
+from contextlib import ExitStack, redirect_stdout, redirect_stderr
+from rich.console import Console
+# > Typing
+from typing import Optional, Tuple, Dict, List, Set, Any
+# > Local Imports
+from . import cli
+from .client import connect, read_message, write_message
+from changelogger import ChangelogFile
+from changelogger.exceptions import DaemonRunningError
+
+# ! Type Alias
+ChangelogKey = Tuple[str, Tuple[Tuple[str, Any], ...]]
+
+# ! Constants
+DEFAULT_MAX_BATCH = 64
+
+# ! Command
+class Command:
+    __slots__ = ('request', 'response', 'keys', 'done')
+    
+    def __init__(self, request: Dict[str, Any]) -> None:
+        self.request = request
+        self.response: Dict[str, Any] = {'code': 0, 'stdout': '', 'stderr': ''}
+        self.keys: Set[ChangelogKey] = set()
+        self.done = threading.Event()
+
+# ! Server
+class CommandHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        request = read_message(self.rfile)
+        if request is None:
+            return
+        command = Command(request)
+        self.server.owner.submit(command)
+        command.done.wait()
+        write_message(self.wfile, command.response)
+
+class CommandServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+    request_queue_size = socket.SOMAXCONN
+    
+    def __init__(self, socket_path: str, owner: 'Daemon') -> None:
+        self.owner = owner
+        super().__init__(socket_path, CommandHandler)
+
+# ! Daemon Class
+class Daemon:
+    def __init__(self, socket_path: str, delay: float=0.0, max_batch: int=DEFAULT_MAX_BATCH) -> None:
+        self.socket_path = socket_path
+        self.delay = delay
+        self.max_batch = max_batch
+        self.changelogs: Dict[ChangelogKey, ChangelogFile] = {}
+        self.__queue: 'queue.Queue[Optional[Command]]' = queue.Queue()
+        self.__batch: Dict[ChangelogKey, ExitStack] = {}
+        self.__current: Optional[Command] = None
+        self.__server: Optional[CommandServer] = None
+        self.__cwd = os.getcwd()
+    
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({repr(self.socket_path)}, {len(self.changelogs)} changelogs)'
+    
+    # ! Main Methods
+    def submit(self, __command: Command) -> None:
+        self.__queue.put(__command)
+    
+    def open(self, __filepath: str, __options: Dict[str, Any]) -> ChangelogFile:
+        key = (__filepath, tuple(sorted((name, value) for name, value in __options.items() if name != 'listeners')))
+        self.__current.keys.add(key)
+        changelog = self.changelogs.get(key)
+        if key in self.__batch:
+            return changelog
+        if changelog is None:
+            changelog = self.changelogs[key] = ChangelogFile(__filepath, **dict(key[1]))
+        elif changelog.changed():
+            changelog.reload()
+        stack = self.__batch[key] = ExitStack()
+        stack.enter_context(changelog.deferred())
+        return changelog
+    
+    def serve(self) -> None:
+        self.__server = self.__bind()
+        cli.opener = self.open
+        worker = threading.Thread(target=self.__work, daemon=True)
+        worker.start()
+        handle_signals = threading.current_thread() is threading.main_thread()
+        if handle_signals:
+            previous = signal.signal(signal.SIGTERM, self.__terminate)
+        try:
+            self.__server.serve_forever()
+        finally:
+            if handle_signals:
+                signal.signal(signal.SIGTERM, previous)
+            cli.opener = None
+            self.__queue.put(None)
+            worker.join()
+            self.__server.server_close()
+            self.__server = None
+            os.remove(self.socket_path)
+    
+    # ! Private Methods
+    def __bind(self) -> CommandServer:
+        if os.path.exists(self.socket_path):
+            sock = connect(self.socket_path)
+            if sock is not None:
+                sock.close()
+                raise DaemonRunningError(self.socket_path)
+            # * Left over by a daemon that did not shut down cleanly
+            os.remove(self.socket_path)
+        server = CommandServer(self.socket_path, self)
+        os.chmod(self.socket_path, 0o600)
+        return server
+    
+    def __terminate(self, signum: int, frame: Any) -> None:
+        raise KeyboardInterrupt()
+    
+    def __work(self) -> None:
+        running = True
+        while running:
+            batch = [self.__queue.get()]
+            if (batch[0] is not None) and (self.delay > 0):
+                time.sleep(self.delay)
+            # * Commands that queued up while the previous batch was running share a single write per changelog
+            while len(batch) < self.max_batch:
+                try:
+                    batch.append(self.__queue.get_nowait())
+                except queue.Empty:
+                    break
+            running = None not in batch
+            self.__run([command for command in batch if command is not None])
+    
+    def __run(self, batch: List[Command]) -> None:
+        try:
+            for command in batch:
+                self.__current = command
+                self.__execute(command)
+        finally:
+            self.__current = None
+            batch_stacks, self.__batch = self.__batch, {}
+            for key, stack in batch_stacks.items():
+                try:
+                    stack.close()
+                except Exception as e:
+                    # * The unwritten changes are dropped together with the instance
+                    self.changelogs.pop(key, None)
+                    for command in batch:
+                        if key in command.keys:
+                            command.response['code'] = 1
+                            command.response['stderr'] += f'{e.__class__.__name__}: {e}\n'
+            os.chdir(self.__cwd)
+            for command in batch:
+                command.done.set()
+    
+    def __execute(self, command: Command) -> None:
+        request = command.request
+        stdout, stderr = io.StringIO(), io.StringIO()
+        code = 0
+        try:
+            os.chdir(request.get('cwd') or self.__cwd)
+            cli.console = cli.Deferred(partial(
+                Console,
+                force_terminal=request.get('terminal') or None,
+                width=request.get('width')
+            ))
+            with redirect_stdout(stdout), redirect_stderr(stderr):
+                cli.main.main(args=list(request.get('argv') or []), prog_name='changelogger')
+        except SystemExit as e:
+            code = e.code if isinstance(e.code, int) else int(e.code is not None)
+        except Exception as e:
+            stderr.write(f'{e.__class__.__name__}: {e}\n')
+            code = 1
+        command.response.update(code=code, stdout=stdout.getvalue(), stderr=stderr.getvalue())
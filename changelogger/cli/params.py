@@ -1,5 +1,4 @@
 import re
-import validators
 from click import ParamType
 from click.core import Context, Parameter
 from typing import Optional, Any
@@ -37,6 +36,7 @@ class URL(ParamType):
     name = 'url'
     
     def convert(self, value: Any, param: Optional[Parameter], ctx: Optional[Context]) -> str:
+        import validators
         if validators.url(str(value)):
             return str(value)
         self.fail("This value is not a link.", param, ctx)
@@ -46,4 +46,72 @@ class ChangeTypeEmojiNotCorrectError(MessageError):
         self.emoji = emoji
     
     def __message__(self, emoji: str, *args, **kwargs):
-        yield f"Incorrect emoji: {repr(emoji)}."
\ No newline at end of file
+        yield f"Incorrect emoji: {repr(emoji)}."
+
+# ! Transaction Error
+class TransactionNotStartedError(MessageError):
+    def __message__(self, *args, **kwargs):
+        yield "There is no active transaction."
+
+# ! Merge Error
+class MergeConflictError(MessageError):
+    def __attributes__(self, filepath: str, version: str, description: str, *args, **kwargs):
+        self.filepath = filepath
+        self.version = version
+        self.description = description
+    
+    def __message__(self, filepath: str, version: str, description: str, *args, **kwargs):
+        yield f"Another writer changed {repr(filepath)}, the change {repr(description)} of version {repr(version)} is gone."
+
+# ! Template Error
+class TemplateError(MessageError):
+    def __attributes__(self, template: str, reason: str, *args, **kwargs):
+        self.template = template
+        self.reason = reason
+    
+    def __message__(self, template: str, reason: str, *args, **kwargs):
+        yield f"Incorrect template {repr(template)}:"
+        yield reason
+
+# ! Record Error
+class RecordFormatError(MessageError):
+    def __attributes__(self, reason: str, *args, **kwargs):
+        self.reason = reason
+    
+    def __message__(self, reason: str, *args, **kwargs):
+        yield f"Incorrect record: {reason}"
+
+# ! Journal Error
+class JournalCorruptedError(MessageError):
+    def __attributes__(self, filepath: str, offset: int, *args, **kwargs):
+        self.filepath = filepath
+        self.offset = offset
+    
+    def __message__(self, filepath: str, offset: int, *args, **kwargs):
+        yield f"The journal {repr(filepath)} has a damaged record at byte {offset} with valid records after it."
+
+# ! Git Error
+class GitError(MessageError):
+    def __attributes__(self, stderr: str, *args, **kwargs):
+        self.stderr = stderr
+    
+    def __message__(self, stderr: str, *args, **kwargs):
+        yield "Git failed:"
+        yield stderr
+
+# ! Lock Error
+class LockTimeoutError(MessageError):
+    def __attributes__(self, filepath: str, timeout: float, *args, **kwargs):
+        self.filepath = filepath
+        self.timeout = timeout
+    
+    def __message__(self, filepath: str, timeout: float, *args, **kwargs):
+        yield f"Could not lock {repr(filepath)} within {timeout} seconds."
+
+# ! Daemon Error
+class DaemonRunningError(MessageError):
+    def __attributes__(self, socket_path: str, *args, **kwargs):
+        self.socket_path = socket_path
+    
+    def __message__(self, socket_path: str, *args, **kwargs):
+        yield f"A daemon is already listening on {repr(socket_path)}."
\ No newline at end of file
@@ -1,39 +1,320 @@
+import os
+import re
+import json
+import time
+import hashlib
+import filecmp
 from string import Formatter
 from datetime import datetime
+from contextlib import contextmanager
 from pydantic import BaseModel
-from typing import Optional, List, Any
-from .models import ChangeLog
+from typing import NamedTuple, Optional, Union, Callable, Iterator, TextIO, Tuple, Dict, List, Any
+from .models import ChangeLog, Version
+from .exceptions import TemplateError
+from .profiling import Instrumented
+from .locking import temp_path
+from .cache import cache_disabled
+from .search import changes_signature
+
+# ! Type Alias
+ExportTarget = Union[str, os.PathLike, TextIO]
+TemplateArgs = Tuple[Any, ...]
+TemplateKwargs = Dict[str, Any]
+TemplatePart = Callable[[TemplateArgs, TemplateKwargs], str]
+FieldKey = Union[int, str]
+
+# ! Constants
+DEFAULT_BUFFERING = 64 * 1024
+RENDER_CACHE_FORMAT_VERSION = 1
+FIELD_FIRST_PATTERN = re.compile(r'[^.\[]*')
+FIELD_REST_PATTERN = re.compile(r'\.(?P<attr>[^.\[]*)|\[(?P<key>[^\]]*)\]')
+
+# ! Export Result
+class ExportResult(NamedTuple):
+    target: 'ExportTarget'
+    format: str
+    error: Optional[BaseException] = None
+    
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+# ! Conversions
+EXTENDED_CONVERSIONS: Dict[str, Callable[[Any], Any]] = {
+    'U': lambda value: str(value).upper(),
+    'L': lambda value: str(value).lower(),
+    'T': lambda value: str(value).title(),
+    'H': lambda value: str(value).capitalize(),
+    'C': lambda value: str(value).casefold(),
+    'R': lambda value: str(value).swapcase(),
+    'S': lambda value: str(value).strip(),
+    'r': repr,
+    's': str,
+    'a': ascii
+}
+
+# ! Methods
+def render_cache_path(filepath: str) -> str:
+    dirpath, filename = os.path.split(filepath)
+    return os.path.join(dirpath, f'.{filename}.render')
+
+def field_key(name: str) -> FieldKey:
+    return int(name) if name.isdecimal() else name
+
+def split_field_name(field_name: str) -> Tuple[FieldKey, List[Tuple[bool, FieldKey]]]:
+    # * Same split as str.format: "a.b[0]" is "a", then the attribute "b" and the item 0
+    first = FIELD_FIRST_PATTERN.match(field_name).group()
+    getters: List[Tuple[bool, FieldKey]] = []
+    idx = len(first)
+    while idx < len(field_name):
+        match = FIELD_REST_PATTERN.match(field_name, idx)
+        if match is None:
+            if field_name[idx] == '[':
+                raise ValueError("Missing ']' in format string")
+            raise ValueError("Only '.' or '[' may follow ']' in format field specifier")
+        if match.group('attr') is not None:
+            if len(match.group('attr')) == 0:
+                raise ValueError('Empty attribute in format string')
+            getters.append((True, match.group('attr')))
+        else:
+            getters.append((False, field_key(match.group('key'))))
+        idx = match.end()
+    return field_key(first), getters
+
+# ! Compiled Template
+class CompiledTemplate:
+    def __init__(self, template: str) -> None:
+        self.template = template
+        self.parts: List[TemplatePart] = []
+        try:
+            self.__compile(template)
+        except TemplateError:
+            raise
+        except (ValueError, KeyError) as e:
+            raise TemplateError(template, ' '.join([str(arg) for arg in e.args]))
+    
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({repr(self.template)})'
+    
+    def __call__(self, *args: Any, **kwargs: Any) -> str:
+        return ''.join([part(args, kwargs) for part in self.parts])
+    
+    def __reduce__(self):
+        return self.__class__, (self.template, )
+    
+    # ! Private Methods
+    def __compile(self, template: str) -> None:
+        auto_index = 0
+        for literal, field_name, format_spec, conversion in Formatter().parse(template):
+            if len(literal) > 0:
+                self.parts.append(lambda args, kwargs, literal=literal: literal)
+            if field_name is None:
+                continue
+            if field_name == '':
+                field_name = str(auto_index)
+                auto_index += 1
+            if (conversion is not None) and (conversion not in EXTENDED_CONVERSIONS):
+                raise TemplateError(self.template, f"Unknown conversion specifier: {repr(conversion)}.")
+            self.parts.append(self.__field(field_name, format_spec, conversion))
+    
+    def __field(self, field_name: str, format_spec: str, conversion: Optional[str]) -> TemplatePart:
+        first, getters = split_field_name(field_name)
+        convert = EXTENDED_CONVERSIONS.get(conversion) if conversion is not None else None
+        spec = CompiledTemplate(format_spec) if ('{' in format_spec) else None
+        
+        def part(args: TemplateArgs, kwargs: TemplateKwargs) -> str:
+            value = args[first] if isinstance(first, int) else kwargs[first]
+            for is_attr, key in getters:
+                value = getattr(value, key) if is_attr else value[key]
+            if convert is not None:
+                value = convert(value)
+            return format(value, format_spec if spec is None else spec(*args, **kwargs))
+        
+        return part
 
 # ! Formatter
 class ExtendedFormatter(Formatter):
     def convert_field(self, value: Any, conversion: Optional[str]) -> str:
-        string_value = str(value)
-        if conversion == 'U':
-            return string_value.upper()
-        elif conversion == 'L':
-            return string_value.lower()
-        elif conversion == 'T':
-            return string_value.title()
-        elif conversion == 'H':
-            return string_value.capitalize()
-        elif conversion == 'C':
-            return string_value.casefold()
-        elif conversion == 'R':
-            return string_value.swapcase()
-        elif conversion == 'S':
-            return string_value.strip()
+        if (conversion is not None) and (conversion in EXTENDED_CONVERSIONS):
+            return EXTENDED_CONVERSIONS[conversion](value)
         return super().convert_field(value, conversion)
+    
+    def compile(self, template: str) -> CompiledTemplate:
+        return CompiledTemplate(template)
+
+# ! Render Cache
+class RenderCache:
+    def __init__(self, filepath: str, context: str) -> None:
+        self.filepath = filepath
+        self.cachepath = render_cache_path(filepath)
+        self.context = context
+        self.hits = 0
+        self.__temppath = temp_path(self.cachepath)
+        self.__skipped: Dict[str, List[Any]] = {}
+        self.__reader = self.__open()
+        self.__writer: Optional[TextIO] = None
+        self.__failed = False
+    
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({repr(self.filepath)}, {self.hits} hits)'
+    
+    # ! Main Methods
+    def row(self, version: str, signature: List[Any], render: Callable[[], str]) -> str:
+        entry = self.__find(version)
+        if (entry is not None) and (entry[0] == signature):
+            self.hits += 1
+            rendered = entry[1]
+        else:
+            rendered = render()
+        self.__keep([version, signature, rendered])
+        return rendered
+    
+    def save(self) -> None:
+        # * Rows of versions that were not exported this time are left behind in the old file
+        self.__close()
+        if (self.__writer is None) or self.__failed:
+            self.discard()
+            return
+        try:
+            self.__writer.close()
+            os.replace(self.__temppath, self.cachepath)
+        except OSError:
+            self.discard()
+    
+    def discard(self) -> None:
+        self.__close()
+        if self.__writer is not None:
+            self.__writer.close()
+        try:
+            os.remove(self.__temppath)
+        except OSError:
+            pass
+    
+    # ! Private Methods
+    def __open(self) -> Optional[TextIO]:
+        # * Plain JSON lines in the order of the last export, read along with the next one
+        try:
+            file = open(self.cachepath, 'r', encoding='utf-8')
+        except OSError:
+            return None
+        try:
+            if json.loads(file.readline()) == [RENDER_CACHE_FORMAT_VERSION, self.context]:
+                return file
+        except ValueError:
+            pass
+        file.close()
+        return None
+    
+    def __close(self) -> None:
+        if self.__reader is not None:
+            self.__reader.close()
+            self.__reader = None
+        self.__skipped.clear()
+    
+    def __find(self, version: str) -> Optional[List[Any]]:
+        # * A row is dropped once it is used, only the rows of versions that moved wait for their turn
+        entry = self.__skipped.pop(version, None)
+        while (entry is None) and (self.__reader is not None):
+            try:
+                key, *entry = json.loads(self.__reader.readline())
+            except (ValueError, TypeError):
+                self.__close()
+                return None
+            if key != version:
+                self.__skipped[key] = entry
+                entry = None
+        return entry
+    
+    def __keep(self, entry: List[Any]) -> None:
+        if self.__failed:
+            return
+        try:
+            if self.__writer is None:
+                self.__writer = open(self.__temppath, 'w', encoding='utf-8')
+                self.__writer.write(json.dumps([RENDER_CACHE_FORMAT_VERSION, self.context]) + '\n')
+            self.__writer.write(json.dumps(entry, ensure_ascii=False, separators=(',', ':')) + '\n')
+        except OSError:
+            self.__failed = True
 
 # ! Exporter Base
-class ExporterBase:
+class ExporterBase(Instrumented):
     def __init__(self, **extra: Any) -> None:
         self.extra = extra
     
     def __repr__(self) -> str:
         return f'{self.__class__.__name__}({self.extra})'
     
-    def export(self, filepath: str, data: ChangeLog) -> None:
+    def iter_export(self, data: ChangeLog) -> Iterator[str]:
         raise NotImplementedError
+    
+    def open(self, filepath: Union[str, os.PathLike]) -> TextIO:
+        return open(filepath, 'w', encoding='utf-8', buffering=DEFAULT_BUFFERING)
+    
+    def render_cache(self, filepath: str, data: ChangeLog) -> Optional[RenderCache]:
+        return None
+    
+    @contextmanager
+    def cached(self, target: Optional[ExportTarget], data: ChangeLog) -> Iterator[Optional[RenderCache]]:
+        # * Rows are only kept for a file target, in a sidecar next to it
+        if isinstance(target, (str, os.PathLike)) and not cache_disabled():
+            cache = self.render_cache(os.path.abspath(target), data)
+        else:
+            cache = None
+        if cache is None:
+            yield None
+            return
+        try:
+            yield cache
+        except BaseException:
+            cache.discard()
+            raise
+        with self.phase('export.cache') as phase:
+            cache.save()
+            phase.count = cache.hits
+    
+    def write(self, stream: TextIO, data: ChangeLog, cache: Optional[RenderCache]=None) -> None:
+        with self.phase('export.render') as phase:
+            for chunk in self.__chunks(data, cache):
+                phase.bytes += stream.write(chunk) or 0
+            phase.count = len(data.versions)
+    
+    def render(self, data: ChangeLog, cache: Optional[RenderCache]=None) -> str:
+        with self.phase('export.render') as phase:
+            text = ''.join(self.__chunks(data, cache))
+            phase.bytes = len(text)
+            phase.count = len(data.versions)
+        return text
+    
+    def save(self, target: ExportTarget, text: str) -> None:
+        with self.phase('export.write') as phase:
+            self.__output(target, lambda stream: stream.write(text))
+            phase.bytes = len(text)
+    
+    def export(self, target: ExportTarget, data: ChangeLog) -> None:
+        with self.cached(target, data) as cache:
+            self.__output(target, lambda stream: self.write(stream, data, cache))
+    
+    # ! Private Methods
+    def __chunks(self, data: ChangeLog, cache: Optional[RenderCache]) -> Iterator[str]:
+        # * Exporters without a render cache keep their one-argument iter_export
+        return self.iter_export(data) if cache is None else self.iter_export(data, cache)
+    
+    def __output(self, target: ExportTarget, writer: Callable[[TextIO], Any]) -> None:
+        if isinstance(target, (str, os.PathLike)):
+            temppath = temp_path(os.fspath(target))
+            try:
+                with self.open(temppath) as file:
+                    writer(file)
+                if os.path.isfile(target) and filecmp.cmp(temppath, target, shallow=False):
+                    os.remove(temppath)
+                else:
+                    os.replace(temppath, target)
+            except BaseException:
+                if os.path.exists(temppath):
+                    os.remove(temppath)
+                raise
+        else:
+            writer(target)
 
 # ! Markdown Version
 class MarkdownTableExporterExtra(BaseModel):
@@ -55,41 +336,78 @@ class MarkdownTableExporter(ExporterBase):
     def __init__(self, **extra) -> None:
         self.extra = MarkdownTableExporterExtra(**extra)
         self.formatter = ExtendedFormatter()
+        self.date_template = self.formatter.compile(self.extra.date_format)
+        self.change_template = self.formatter.compile(self.extra.change_format)
+        self.version_template = self.formatter.compile(self.extra.version_format)
     
-    def export(self, filepath: str, data: ChangeLog) -> None:
-        versions_data_lines = [ *self.extra.start ]
-        for version in data.versions.values():
-            changes_data_lines = []
-            for change in version.changes:
-                changes_data_lines.append(
-                    self.formatter.format(
-                        self.extra.change_format,
-                        key=data.change_types[change.type],
-                        emoji=data.change_types[change.type],
-                        description=change.description
-                    )
-                )
-            versions_data_lines.append(
-                self.formatter.format(
-                    self.extra.version_format,
-                    version=version.version,
-                    url=version.url,
-                    date=self.formatter.format(
-                        self.extra.date_format,
-                        date=datetime.fromtimestamp(version.date)
-                    ),
-                    tag=version.tag,
-                    changes=self.extra.change_sep.join(changes_data_lines)
-                )
-            )
-        versions_data_lines += self.extra.end
-        with open(
+    def open(self, filepath: Union[str, os.PathLike]) -> TextIO:
+        return open(
             filepath, 'w',
             encoding=self.extra.encoding,
-            errors=self.extra.errors
-        ) as file:
-            file.write(self.extra.version_sep.join(versions_data_lines))
+            errors=self.extra.errors,
+            buffering=DEFAULT_BUFFERING
+        )
+    
+    def format_date(self, date: float) -> str:
+        return self.date_template(date=datetime.fromtimestamp(date))
+    
+    def render_cache(self, filepath: str, data: ChangeLog) -> RenderCache:
+        return RenderCache(filepath, self.context_digest())
+    
+    def context_digest(self) -> str:
+        # * What every row depends on besides its own version: the templates and the timezone of the dates
+        context = [self.__class__.__qualname__, self.extra.model_dump(mode='json'), time.tzname, time.timezone]
+        return hashlib.sha1(json.dumps(context).encode('utf-8')).hexdigest()
+    
+    def row_signature(self, version: Version, change_types: Dict[str, str]) -> List[Any]:
+        # * A list, as the signatures of a saved cache come back from JSON
+        return [
+            changes_signature(version.changes), version.date, version.url, version.tag,
+            [change_types.get(change.type) for change in version.changes]
+        ]
+    
+    def render_row(self, version: Version, change_types: Dict[str, str]) -> str:
+        changes_data_lines = []
+        for change in version.changes:
+            changes_data_lines.append(
+                self.change_template(
+                    key=change_types[change.type],
+                    emoji=change_types[change.type],
+                    description=change.description
+                )
+            )
+        return self.version_template(
+            version=version.version,
+            url=version.url,
+            date=self.format_date(version.date),
+            tag=version.tag,
+            changes=self.extra.change_sep.join(changes_data_lines)
+        )
+    
+    def iter_lines(self, data: ChangeLog, cache: Optional[RenderCache]=None) -> Iterator[str]:
+        yield from self.extra.start
+        for version in data.versions.values():
+            if cache is None:
+                yield self.render_row(version, data.change_types)
+            else:
+                yield cache.row(
+                    version.version,
+                    self.row_signature(version, data.change_types),
+                    lambda version=version: self.render_row(version, data.change_types)
+                )
+        yield from self.extra.end
+    
+    def iter_export(self, data: ChangeLog, cache: Optional[RenderCache]=None) -> Iterator[str]:
+        sep = ''
+        for line in self.iter_lines(data, cache):
+            yield sep + line
+            sep = self.extra.version_sep
 
 # ! Vars
 
 DEFAULT_MARKDOWN_EXTRA = MarkdownTableExporterExtra().model_dump(warnings=False)
+
+# ! Methods
+def render_export(exporter: ExporterBase, data: ChangeLog, target: Optional[ExportTarget]=None) -> str:
+    with exporter.cached(target, data) as cache:
+        return exporter.render(data, cache)
\ No newline at end of file
@@ -0,0 +1,175 @@
+import os
+import re
+import json
+import subprocess
+# > Typing
+from typing import NamedTuple, Optional, Iterator, Tuple, Dict, List, Any
+# > Local Imports
+from .units import VERSION_PATTERN
+from .bulk import BulkRecord
+from .exceptions import GitError
+
+# ! Constants
+GIT_FORMAT = '%H%x1f%ct%x1f%D%x1f%s%x1e'
+GIT_RECORD_SEP = b'\x1e'
+GIT_FIELD_SEP = '\x1f'
+GIT_READ_SIZE = 64 * 1024
+CONVENTIONAL_COMMIT_REGEX = re.compile(r'^(?P<type>[A-Za-z]+)(?:\((?P<scope>[^)]*)\))?(?P<breaking>!)?:\s*(?P<description>.+)$')
+TAG_VERSION_REGEX = re.compile(VERSION_PATTERN, re.IGNORECASE)
+DEFAULT_COMMIT_TYPES = {
+    'feat': 'add',
+    'add': 'add',
+    'remove': 'remove',
+    'revert': 'remove',
+    'fix': 'fix',
+    'perf': 'update',
+    'update': 'update',
+    'deprecate': 'deprecate',
+    'refactor': 'refactor'
+}
+
+# ! Commit
+class Commit(NamedTuple):
+    sha: str
+    timestamp: float
+    tags: List[str]
+    subject: str
+
+# ! Methods
+def git_state_path(filepath: str) -> str:
+    dirpath, filename = os.path.split(filepath)
+    return os.path.join(dirpath, f'.{filename}.git-state')
+
+def tag_version(tag: str) -> Optional[str]:
+    if TAG_VERSION_REGEX.fullmatch(tag) is None:
+        return None
+    return tag[1:] if tag[:1] in ('v', 'V') else tag
+
+def parse_subject(subject: str, commit_types: Dict[str, str]) -> Optional[Tuple[str, str]]:
+    match = CONVENTIONAL_COMMIT_REGEX.match(subject)
+    if match is None:
+        return None
+    change_type = commit_types.get(match.group('type').lower())
+    if change_type is None:
+        return None
+    return change_type, match.group('description').strip()
+
+def iter_commits(rev_range: List[str], repo: str='.') -> Iterator[Commit]:
+    process = subprocess.Popen(
+        ['git', '-C', repo, 'log', f'--format={GIT_FORMAT}', '--decorate=full', *rev_range, '--'],
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE
+    )
+    finished = False
+    try:
+        buffer = b''
+        while True:
+            chunk = process.stdout.read(GIT_READ_SIZE)
+            if len(chunk) == 0:
+                break
+            buffer += chunk
+            *records, buffer = buffer.split(GIT_RECORD_SEP)
+            for record in records:
+                yield parse_commit(record)
+        if len(buffer.strip()) > 0:
+            yield parse_commit(buffer)
+        finished = True
+    finally:
+        if not finished:
+            process.kill()
+        process.stdout.close()
+        stderr = process.stderr.read()
+        process.stderr.close()
+        returncode = process.wait()
+    if returncode != 0:
+        raise GitError(stderr.decode('utf-8', errors='replace').strip())
+
+def parse_commit(record: bytes) -> Commit:
+    sha, timestamp, decorations, subject = record.decode('utf-8', errors='replace').strip().split(GIT_FIELD_SEP, 3)
+    tags = [
+        decoration.strip()[len('tag: refs/tags/'):]
+        for decoration in decorations.split(',')
+        if decoration.strip().startswith('tag: refs/tags/')
+    ]
+    return Commit(sha, float(timestamp), tags, subject)
+
+# ! Git State
+class GitState:
+    def __init__(self, filepath: str) -> None:
+        self.filepath = git_state_path(filepath)
+    
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({repr(self.filepath)})'
+    
+    def load(self) -> Dict[str, Any]:
+        try:
+            with open(self.filepath, 'r', encoding='utf-8') as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+    
+    def last_commit(self, repo: str) -> Optional[str]:
+        return self.load().get(os.path.abspath(repo))
+    
+    def save(self, repo: str, sha: str) -> None:
+        state = self.load()
+        state[os.path.abspath(repo)] = sha
+        temppath = self.filepath + '.tmp'
+        with open(temppath, 'w', encoding='utf-8') as file:
+            json.dump(state, file, indent=2)
+        os.replace(temppath, self.filepath)
+
+# ! Ingest Records
+class GitIngest:
+    def __init__(
+        self,
+        commits: Iterator[Commit],
+        exist_version: Any,
+        change_types: Dict[str, str],
+        commit_types: Dict[str, str]=DEFAULT_COMMIT_TYPES,
+        unreleased: Optional[str]=None,
+        url: str='',
+        tag: str='release'
+    ) -> None:
+        self.commits = commits
+        self.exist_version = exist_version
+        self.commit_types = {key: value for key, value in commit_types.items() if value in change_types}
+        self.unreleased = unreleased
+        self.url = url
+        self.tag = tag
+        self.head: Optional[str] = None
+    
+    def __iter__(self) -> Iterator[BulkRecord]:
+        version = self.unreleased
+        created = set()
+        for commit in self.commits:
+            for tag in commit.tags:
+                tagged_version = tag_version(tag)
+                if tagged_version is not None:
+                    version = tagged_version
+                    if (version not in created) and not self.exist_version(version):
+                        created.add(version)
+                        yield {
+                            'kind': 'version',
+                            'version': version,
+                            'date': commit.timestamp,
+                            'url': self.url.format(version=version, tag=tag),
+                            'tag': self.tag
+                        }
+                    break
+            if version is None:
+                continue
+            # * Commits newer than the last tag have no version yet, so the next run has to see them again
+            if self.head is None:
+                self.head = commit.sha
+            if (version == self.unreleased) and (version not in created) and not self.exist_version(version):
+                created.add(version)
+                yield {
+                    'kind': 'version',
+                    'version': version,
+                    'date': commit.timestamp,
+                    'url': self.url.format(version=version, tag='HEAD'),
+                    'tag': 'unreleased'
+                }
+            change = parse_subject(commit.subject, self.commit_types)
+            if change is not None:
+                yield {'kind': 'change', 'version': version, 'type': change[0], 'description': change[1]}
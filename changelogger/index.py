@@ -0,0 +1,175 @@
+import re
+from functools import lru_cache
+from bisect import bisect_left, bisect_right
+# > Typing
+from typing import Optional, Iterable, Iterator, Tuple, Dict, List, Any
+# > Local Imports
+from .models import Change, Version, ChangeOrder
+from .units import VERSION_PATTERN
+
+VersionKey = Tuple[Any, ...]
+
+# ! Constants
+CHANGE_ORDERS: Tuple[str, ...] = ('type-text', 'type-index', 'insertion')
+VERSION_REGEX = re.compile(VERSION_PATTERN, re.IGNORECASE)
+PRE_RELEASE_RANKS = {
+    'a': 0, 'alpha': 0,
+    'b': 1, 'beta': 1,
+    'c': 2, 'rc': 2, 'pre': 2, 'preview': 2
+}
+
+# ! Methods
+@lru_cache(maxsize=65536)
+def version_key(version: str) -> VersionKey:
+    match = VERSION_REGEX.fullmatch(version.strip())
+    if match is None:
+        return 0, version
+    release = [int(part) for part in match.group('release').split('.')]
+    while (len(release) > 1) and (release[-1] == 0):
+        release.pop()
+    if match.group('pre') is not None:
+        pre = (0, PRE_RELEASE_RANKS[match.group('pre_l').lower()], int(match.group('pre_n') or 0))
+    elif (match.group('post') is None) and (match.group('dev') is not None):
+        pre = (-1, )
+    else:
+        pre = (1, )
+    if match.group('post') is not None:
+        post = (0, int(match.group('post_n1') or match.group('post_n2') or 0))
+    else:
+        post = (-1, )
+    if match.group('dev') is not None:
+        dev = (0, int(match.group('dev_n') or 0))
+    else:
+        dev = (1, )
+    local = ()
+    if match.group('local') is not None:
+        local = tuple(
+            (1, int(part)) if part.isdigit() else (0, part.lower())
+            for part in re.split(r'[-_\.]', match.group('local'))
+        )
+    return 1, int(match.group('epoch') or 0), tuple(release), pre, post, dev, local
+
+# ! Change Index Class
+class ChangeIndex:
+    def __init__(self, changes: List[Change], order: ChangeOrder, change_types: Dict[str, str]) -> None:
+        if order not in CHANGE_ORDERS:
+            raise ValueError(order)
+        self.changes = changes
+        self.order = order
+        self.ranks = {change_type: idx for idx, change_type in enumerate(change_types)}
+        self.changes.sort(key=self.key)
+        self.keys = [self.key(change) for change in self.changes]
+        self.types: Dict[str, List[Change]] = {}
+        for change in self.changes:
+            self.types.setdefault(change.type, []).append(change)
+    
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self.order}, {len(self.changes)} changes)'
+    
+    def __len__(self) -> int:
+        return len(self.changes)
+    
+    @classmethod
+    def of(cls, version: Version, order: ChangeOrder, change_types: Dict[str, str]) -> 'ChangeIndex':
+        index: Optional[ChangeIndex] = version._index
+        if (index is None) or not index.valid(version.changes, order, change_types):
+            index = version._index = cls(version.changes, order, change_types)
+        return index
+    
+    # ! Main Methods
+    def valid(self, changes: List[Change], order: ChangeOrder, change_types: Dict[str, str]) -> bool:
+        if (self.changes is not changes) or (self.order != order) or (len(self.keys) != len(changes)):
+            return False
+        return (order != 'type-index') or (list(self.ranks) == list(change_types))
+    
+    def key(self, change: Change) -> Any:
+        if self.order == 'type-text':
+            return change.type
+        elif self.order == 'type-index':
+            return self.ranks.get(change.type, len(self.ranks))
+        return 0
+    
+    def insert(self, change: Change) -> int:
+        key = self.key(change)
+        idx = bisect_right(self.keys, key)
+        self.keys.insert(idx, key)
+        self.changes.insert(idx, change)
+        self.types.setdefault(change.type, []).append(change)
+        return idx
+    
+    def pop(self, idx: int) -> Change:
+        change = self.changes.pop(idx)
+        self.keys.pop(idx)
+        same_type = self.types[change.type]
+        for type_idx, other in enumerate(same_type):
+            if other is change:
+                same_type.pop(type_idx)
+                break
+        if len(same_type) == 0:
+            self.types.pop(change.type)
+        return change
+    
+    def of_type(self, change_type: str) -> List[Change]:
+        return self.types.get(change_type, [])
+
+# ! Version Index Class
+class VersionIndex:
+    def __init__(self, versions: Iterable[str]=()) -> None:
+        entries = sorted((version_key(version), version) for version in versions)
+        self.keys: List[VersionKey] = [key for key, _ in entries]
+        self.versions: List[str] = [version for _, version in entries]
+    
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self.versions})'
+    
+    def __len__(self) -> int:
+        return len(self.versions)
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.versions)
+    
+    def __contains__(self, version: object) -> bool:
+        if not isinstance(version, str):
+            return False
+        key = version_key(version)
+        idx = bisect_left(self.keys, key)
+        while (idx < len(self.keys)) and (self.keys[idx] == key):
+            if self.versions[idx] == version:
+                return True
+            idx += 1
+        return False
+    
+    # ! Main Methods
+    def add(self, version: str) -> int:
+        key = version_key(version)
+        idx = bisect_right(self.keys, key)
+        self.keys.insert(idx, key)
+        self.versions.insert(idx, version)
+        return idx
+    
+    def remove(self, version: str) -> None:
+        key = version_key(version)
+        idx = bisect_left(self.keys, key)
+        while (idx < len(self.keys)) and (self.keys[idx] == key):
+            if self.versions[idx] == version:
+                self.keys.pop(idx)
+                self.versions.pop(idx)
+                return
+            idx += 1
+        raise KeyError(version)
+    
+    def latest(self) -> Optional[str]:
+        return self.versions[-1] if len(self.versions) > 0 else None
+    
+    def between(self, start: Optional[str]=None, end: Optional[str]=None, after: Optional[str]=None) -> List[str]:
+        start_idx = 0 if start is None else bisect_left(self.keys, version_key(start))
+        if after is not None:
+            start_idx = max(start_idx, bisect_right(self.keys, version_key(after)))
+        end_idx = len(self.keys) if end is None else bisect_right(self.keys, version_key(end))
+        return self.versions[start_idx:end_idx]
+    
+    def since(self, version: str) -> List[str]:
+        return self.versions[bisect_right(self.keys, version_key(version)):]
+    
+    def last(self, count: int) -> List[str]:
+        return self.versions[max(len(self.versions) - count, 0):]
\ No newline at end of file
@@ -0,0 +1,153 @@
+import os
+import re
+import json
+import zlib
+# > Typing
+from typing import Optional, Iterator, Tuple, List, Dict, Any
+# > Local Imports
+from .exceptions import JournalCorruptedError
+
+# ! Type Alias
+JournalRecord = Dict[str, Any]
+
+# ! Constants
+JOURNAL_SUFFIX = '.journal'
+JOURNAL_TAIL_CHUNK = 4096
+JOURNAL_SEQ_COMMENT = '# changelogger-journal-seq: {seq}\n'
+JOURNAL_SEQ_PATTERN = re.compile(rb'^# changelogger-journal-seq: (?P<seq>[0-9]+)\s*$', re.MULTILINE)
+
+# ! Methods
+def journal_path(filepath: str) -> str:
+    return filepath + JOURNAL_SUFFIX
+
+def snapshot_seq(content: bytes) -> int:
+    match = JOURNAL_SEQ_PATTERN.search(content[-256:])
+    if match is not None:
+        return int(match.group('seq'))
+    return 0
+
+def encode_record(record: JournalRecord) -> bytes:
+    body = json.dumps(record, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    return b'%08x\t' % zlib.crc32(body) + body + b'\n'
+
+def decode_record(line: bytes) -> Optional[JournalRecord]:
+    if not line.endswith(b'\n'):
+        return None
+    checksum, sep, body = line[:-1].partition(b'\t')
+    if (len(sep) == 0) or (len(checksum) != 8):
+        return None
+    try:
+        if int(checksum, 16) != zlib.crc32(body):
+            return None
+        return json.loads(body)
+    except ValueError:
+        return None
+
+# ! Journal Class
+class Journal:
+    def __init__(self, filepath: str) -> None:
+        self.filepath = filepath
+        self.seq = 0
+    
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({repr(self.filepath)})'
+    
+    # ! Main Methods
+    def exists(self) -> bool:
+        return os.path.exists(self.filepath)
+    
+    def size(self) -> int:
+        try:
+            return os.path.getsize(self.filepath)
+        except OSError:
+            return 0
+    
+    def read(self, after: int=0) -> Iterator[JournalRecord]:
+        for record, _ in self.__scan():
+            if record['seq'] > after:
+                yield record
+    
+    def recover(self) -> int:
+        # * Cuts off a half-written tail left by a crash, so that new records are appended after the last valid one
+        offset = 0
+        for record, offset in self.__scan():
+            self.seq = max(self.seq, record['seq'])
+        if self.exists() and (offset != self.size()):
+            with open(self.filepath, 'r+b') as file:
+                file.truncate(offset)
+                file.flush()
+                os.fsync(file.fileno())
+        return self.seq
+    
+    def trim(self) -> int:
+        # * Reads only the end of the file: the seq another writer stopped at, without a torn record it left behind
+        try:
+            file = open(self.filepath, 'r+b')
+        except FileNotFoundError:
+            return 0
+        with file:
+            size = file.seek(0, os.SEEK_END)
+            chunk = JOURNAL_TAIL_CHUNK
+            while True:
+                start = max(0, size - chunk)
+                file.seek(start)
+                parts = file.read(size - start).split(b'\n')
+                lines = [part + b'\n' for part in parts[:-1]] + [parts[-1]]
+                if start > 0:
+                    lines = lines[1:]
+                end, record = size, None
+                for line in reversed(lines):
+                    record = decode_record(line)
+                    if record is not None:
+                        break
+                    end -= len(line)
+                if (record is not None) or (start == 0):
+                    break
+                chunk *= 2
+            if end != size:
+                file.truncate(end)
+                file.flush()
+                os.fsync(file.fileno())
+        return record['seq'] if record is not None else 0
+    
+    def append(self, records: List[JournalRecord]) -> None:
+        # * The caller holds the file lock, so the records continue from whatever another writer appended last
+        self.seq = max(self.seq, self.trim())
+        with open(self.filepath, 'ab') as file:
+            for record in records:
+                self.seq += 1
+                record['seq'] = self.seq
+                file.write(encode_record(record))
+            file.flush()
+            os.fsync(file.fileno())
+    
+    def discard(self, until: int) -> None:
+        records = [encode_record(record) for record in self.read(until)]
+        if len(records) == 0:
+            try:
+                os.remove(self.filepath)
+            except FileNotFoundError:
+                pass
+            return
+        temppath = self.filepath + '.tmp'
+        with open(temppath, 'wb') as file:
+            file.writelines(records)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temppath, self.filepath)
+    
+    # ! Private Methods
+    def __scan(self) -> Iterator[Tuple[JournalRecord, int]]:
+        if not self.exists():
+            return
+        offset = 0
+        with open(self.filepath, 'rb') as file:
+            for line in file:
+                record = decode_record(line)
+                if record is None:
+                    # * A crash can only tear the tail, a damaged record with valid ones after it is never cut off
+                    if any(decode_record(rest) is not None for rest in file):
+                        raise JournalCorruptedError(self.filepath, offset)
+                    return
+                offset += len(line)
+                yield record, offset
@@ -0,0 +1,127 @@
+import os
+import time
+import threading
+# > Typing
+from typing import Optional, Dict
+# > Local Imports
+from .exceptions import LockTimeoutError
+
+try:
+    import fcntl
+    msvcrt = None
+except ImportError:
+    import msvcrt
+    fcntl = None
+
+# ! Constants
+LOCK_POLL_INTERVAL = 0.01
+
+# ! Methods
+def lock_path(filepath: str) -> str:
+    dirpath, filename = os.path.split(filepath)
+    return os.path.join(dirpath, f'.{filename}.lock')
+
+def temp_path(filepath: str) -> str:
+    # * Unique per process and thread, so concurrent writers of one file never share a temporary file
+    return f'{filepath}.{os.getpid()}.{threading.get_ident()}.tmp'
+
+def try_lock(fd: int, blocking: bool=False) -> bool:
+    if fcntl is not None:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX if blocking else (fcntl.LOCK_EX | fcntl.LOCK_NB))
+            return True
+        except BlockingIOError:
+            return False
+    os.lseek(fd, 0, os.SEEK_SET)
+    try:
+        msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        return True
+    except OSError:
+        return False
+
+def unlock(fd: int) -> None:
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+    else:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+# ! File Lock Class
+class FileLock:
+    # * flock() locks belong to an open file, so one process must share a single lock per path
+    __locks: Dict[str, 'FileLock'] = {}
+    __locks_lock = threading.Lock()
+    
+    def __init__(self, filepath: str, timeout: Optional[float]=None) -> None:
+        self.filepath = os.path.abspath(filepath)
+        self.timeout = timeout
+        self.__lock = threading.RLock()
+        self.__depth = 0
+        self.__fd: Optional[int] = None
+    
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({repr(self.filepath)}, {"locked" if self.locked else "unlocked"})'
+    
+    def __enter__(self) -> 'FileLock':
+        self.acquire()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.release()
+    
+    @classmethod
+    def of(cls, filepath: str, timeout: Optional[float]=None) -> 'FileLock':
+        filepath = lock_path(os.path.abspath(filepath))
+        with cls.__locks_lock:
+            lock = cls.__locks.get(filepath)
+            if lock is None:
+                lock = cls.__locks[filepath] = cls(filepath, timeout)
+            return lock
+    
+    @property
+    def locked(self) -> bool:
+        return self.__depth > 0
+    
+    # ! Main Methods
+    def acquire(self, timeout: Optional[float]=None) -> None:
+        timeout = self.timeout if timeout is None else timeout
+        if not self.__lock.acquire(timeout=-1 if timeout is None else timeout):
+            raise LockTimeoutError(self.filepath, timeout)
+        if self.__depth > 0:
+            self.__depth += 1
+            return
+        try:
+            fd = os.open(self.filepath, os.O_RDWR | os.O_CREAT, 0o666)
+            try:
+                self.__wait(fd, timeout)
+            except BaseException:
+                os.close(fd)
+                raise
+        except BaseException:
+            self.__lock.release()
+            raise
+        self.__fd = fd
+        self.__depth = 1
+    
+    def release(self) -> None:
+        if self.__depth == 0:
+            raise RuntimeError('The lock is not acquired.')
+        self.__depth -= 1
+        if self.__depth == 0:
+            fd, self.__fd = self.__fd, None
+            try:
+                unlock(fd)
+            finally:
+                os.close(fd)
+        self.__lock.release()
+    
+    # ! Private Methods
+    def __wait(self, fd: int, timeout: Optional[float]) -> None:
+        if (timeout is None) and (fcntl is not None):
+            try_lock(fd, blocking=True)
+            return
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not try_lock(fd):
+            if (deadline is not None) and (time.monotonic() >= deadline):
+                raise LockTimeoutError(self.filepath, timeout)
+            time.sleep(LOCK_POLL_INTERVAL)
@@ -1,5 +1,8 @@
-from pydantic import BaseModel
-from typing import List, Dict, Any
+from pydantic import BaseModel, PrivateAttr
+from typing import NamedTuple, MutableMapping, Callable, Mapping, Iterable, Iterator, Literal, Optional, Tuple, List, Dict, Any
+
+# ! Type Alias
+ChangeOrder = Literal['type-text', 'type-index', 'insertion']
 
 # ! ChangelogFile Models
 class Change(BaseModel):
@@ -12,10 +15,96 @@ class Version(BaseModel):
     url: str
     tag: str
     changes: List[Change]=[]
+    _index: Any = PrivateAttr(default=None)
 
 class ChangeLog(BaseModel):
     exporters_extra: Dict[str, Dict[str, Any]] = {}
     change_types: Dict[str, str] = {}
+    change_order: ChangeOrder = 'type-text'
     versions: Dict[str, Version] = {}
 
+# ! Shard Reference
+class Shard(NamedTuple):
+    version: str
+    date: Optional[float]=None
+    tag: Optional[str]=None
+
+# ! Lazy Versions Mapping
+class LazyVersions(MutableMapping[str, Version]):
+    def __init__(
+        self,
+        raw: Dict[str, Any]={},
+        factory: Callable[[Dict[str, Any]], Any]=Version.model_validate
+    ) -> None:
+        self.__items: Dict[str, Any] = dict(raw)
+        self.__factory = factory
+    
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({len(self.__items)} versions, {self.materialized} materialized)'
+    
+    def __getitem__(self, __key: str) -> Version:
+        value = self.__items[__key]
+        if isinstance(value, (dict, Shard)):
+            value = self.__factory(value)
+            self.__items[__key] = value
+        return value
+    
+    def __setitem__(self, __key: str, __value: Version) -> None:
+        self.__items[__key] = __value
+    
+    def __delitem__(self, __key: str) -> None:
+        del self.__items[__key]
+    
+    def __contains__(self, __key: object) -> bool:
+        return __key in self.__items
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__items)
+    
+    def __len__(self) -> int:
+        return len(self.__items)
+    
+    @property
+    def materialized(self) -> int:
+        return len(self.materialized_keys())
+    
+    def materialized_keys(self) -> List[str]:
+        return [key for key, value in self.__items.items() if not isinstance(value, (dict, Shard))]
+    
+    def header(self, __key: str) -> Tuple[float, str]:
+        # * Date and tag of a version, read without materializing it whenever they are known
+        value = self.__items[__key]
+        if isinstance(value, dict):
+            return float(value['date']), value['tag']
+        if isinstance(value, Shard) and (value.date is not None) and (value.tag is not None):
+            return value.date, value.tag
+        value = self[__key]
+        return value.date, value.tag
+    
+    def change_pairs(self, __key: str) -> List[Tuple[str, str]]:
+        # * Type and description of every change, read without materializing the version whenever it is raw
+        value = self.__items[__key]
+        if isinstance(value, dict):
+            return [(change['type'], change['description']) for change in value.get('changes') or []]
+        return [(change.type, change.description) for change in self[__key].changes]
+    
+    def reorder(self, __keys: Iterable[str]) -> None:
+        self.__items = {key: self.__items[key] for key in __keys}
+    
+    def materialize(self) -> Dict[str, Version]:
+        return {key: self[key] for key in self.__items}
+    
+    def dump(self) -> Dict[str, Any]:
+        return {
+            key: (value if isinstance(value, dict) else self[key].model_dump(warnings=False))
+            for key, value in self.__items.items()
+        }
+
+# ! Methods
+def version_header(versions: Mapping[str, Any], version: str) -> Tuple[float, str]:
+    if isinstance(versions, LazyVersions):
+        return versions.header(version)
+    return versions[version].date, versions[version].tag
+
+# ! Vars
 DEFAULT_CHANGELOG_DATA = ChangeLog().model_dump(warnings=False)
\ No newline at end of file
@@ -0,0 +1,122 @@
+import os
+import json
+import time
+import threading
+from contextlib import contextmanager
+# > Typing
+from typing import NamedTuple, Callable, Iterator, Tuple, Dict, List, Any
+
+# ! Phase Event
+class PhaseEvent(NamedTuple):
+    name: str
+    start: float
+    duration: float
+    bytes: int=0
+    count: int=0
+    thread: int=0
+
+# ! Type Alias
+PhaseCallback = Callable[[PhaseEvent], None]
+
+# ! Phase
+class Phase:
+    __slots__ = ('name', 'bytes', 'count')
+    
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.bytes = 0
+        self.count = 0
+
+# ! Instrumented Class
+class Instrumented:
+    listeners: Tuple[PhaseCallback, ...] = ()
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        # * Listeners stay in the process they were added in
+        state = self.__dict__.copy()
+        state.pop('listeners', None)
+        return state
+    
+    def add_listener(self, __listener: PhaseCallback) -> None:
+        self.listeners = self.listeners + (__listener, )
+    
+    def remove_listener(self, __listener: PhaseCallback) -> None:
+        self.listeners = tuple(listener for listener in self.listeners if listener != __listener)
+    
+    @contextmanager
+    def phase(self, __name: str) -> Iterator[Phase]:
+        phase = Phase(__name)
+        listeners = self.listeners
+        if len(listeners) == 0:
+            yield phase
+            return
+        start = time.perf_counter()
+        try:
+            yield phase
+        finally:
+            event = PhaseEvent(
+                __name, start, time.perf_counter() - start,
+                phase.bytes, phase.count, threading.get_ident()
+            )
+            for listener in listeners:
+                listener(event)
+
+# ! Phase Summary
+class PhaseSummary(NamedTuple):
+    name: str
+    calls: int
+    duration: float
+    bytes: int
+    count: int
+
+# ! Profiler Class
+class Profiler:
+    def __init__(self) -> None:
+        self.events: List[PhaseEvent] = []
+        self.started = time.perf_counter()
+        self.__lock = threading.Lock()
+    
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({len(self.events)} events)'
+    
+    def __call__(self, event: PhaseEvent) -> None:
+        with self.__lock:
+            self.events.append(event)
+    
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+    
+    # ! Main Methods
+    def summary(self) -> List[PhaseSummary]:
+        phases: Dict[str, List[Any]] = {}
+        for event in self.events:
+            phase = phases.setdefault(event.name, [0, 0.0, 0, 0])
+            phase[0] += 1
+            phase[1] += event.duration
+            phase[2] += event.bytes
+            phase[3] += event.count
+        return [PhaseSummary(name, *values) for name, values in phases.items()]
+    
+    def chrome_trace(self) -> Dict[str, Any]:
+        pid = os.getpid()
+        return {
+            'traceEvents': [
+                {
+                    'name': event.name,
+                    'cat': event.name.split('.', 1)[0],
+                    'ph': 'X',
+                    'ts': (event.start - self.started) * 1e6,
+                    'dur': event.duration * 1e6,
+                    'pid': pid,
+                    'tid': event.thread,
+                    'args': {'bytes': event.bytes, 'count': event.count}
+                }
+                for event in self.events
+            ],
+            'displayTimeUnit': 'ms'
+        }
+    
+    def dump_chrome_trace(self, filepath: str) -> None:
+        with open(filepath, 'w', encoding='utf-8') as file:
+            json.dump(self.chrome_trace(), file)
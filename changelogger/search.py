@@ -0,0 +1,237 @@
+import os
+import re
+import sys
+import json
+import zlib
+from array import array
+from bisect import bisect_left
+from itertools import accumulate, count
+# > Typing
+from typing import NamedTuple, Optional, Iterable, Tuple, Set, Dict, List, Any
+
+# ! Constants
+SEARCH_FORMAT_VERSION = 2
+SEARCH_LOG_LIMIT = 1024 * 1024
+TOKEN_PATTERN = re.compile(r'\w+')
+PROBE_RATIO = 16
+
+# ! Search Hit
+class SearchHit(NamedTuple):
+    version: str
+    index: int
+    change: Any
+
+# ! Methods
+def search_path(filepath: str) -> str:
+    dirpath, filename = os.path.split(filepath)
+    return os.path.join(dirpath, f'.{filename}.search')
+
+def search_log_path(filepath: str) -> str:
+    return search_path(filepath) + '.log'
+
+def tokenize(text: str) -> List[str]:
+    return TOKEN_PATTERN.findall(text.lower())
+
+def changes_tokens(changes: Iterable[Any]) -> List[str]:
+    return list({token for change in changes for token in tokenize(change.description)})
+
+def pairs_signature(pairs: Iterable[Tuple[str, str]]) -> int:
+    # * Cheap enough to tell which versions of a rewritten file still match the index
+    return zlib.crc32('\x1e'.join(f'{type}\x1f{description}' for type, description in pairs).encode('utf-8'))
+
+def changes_signature(changes: Iterable[Any]) -> int:
+    return pairs_signature((change.type, change.description) for change in changes)
+
+def matches(change: Any, tokens: Set[str]) -> bool:
+    return tokens.issubset(tokenize(change.description))
+
+def flatten(arrays: Iterable[array]) -> Tuple[array, array]:
+    arrays = list(arrays)
+    return array('I', map(len, arrays)), array('I', b''.join(values.tobytes() for values in arrays))
+
+def unflatten(lengths: array, values: array) -> List[array]:
+    return [values[end - length:end] for length, end in zip(lengths, accumulate(lengths))]
+
+def contains(posting: array, value: int) -> bool:
+    idx = bisect_left(posting, value)
+    return (idx < len(posting)) and (posting[idx] == value)
+
+def append_search_log(filepath: str, before: str, after: str, versions: Dict[str, Optional[Tuple[Any, List[str]]]]) -> None:
+    line = json.dumps({'before': before, 'after': after, 'versions': versions}, ensure_ascii=False, separators=(',', ':'))
+    try:
+        with open(filepath, 'a', encoding='utf-8') as file:
+            file.write(line + '\n')
+    except OSError:
+        pass
+
+# ! Search Index Class
+class SearchIndex:
+    # * Postings point to versions rather than single changes, since change positions shift on every insert
+    def __init__(self) -> None:
+        self.tokens: Dict[str, int] = {}
+        self.postings: List[array] = []
+        self.versions: List[Optional[str]] = []
+        self.ids: Dict[str, int] = {}
+        self.forward: Dict[int, array] = {}
+        self.signatures: Dict[str, Any] = {}
+        self.digest: Optional[str] = None
+    
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({len(self.ids)} versions, {len(self.tokens)} tokens)'
+    
+    def __len__(self) -> int:
+        return len(self.ids)
+    
+    def __contains__(self, version: object) -> bool:
+        return version in self.ids
+    
+    # ! Main Methods
+    def index_version(self, version: str, changes: Iterable[Any], signature: Any=None) -> None:
+        self.index_tokens(version, (token for change in changes for token in tokenize(change.description)), signature)
+    
+    def index_tokens(self, version: str, tokens: Iterable[str], signature: Any=None) -> None:
+        self.remove_version(version)
+        # * A new id is always the largest one, so appending keeps every posting sorted
+        vid = self.ids[version] = len(self.versions)
+        self.versions.append(version)
+        token_ids = array('I', sorted({self.__token_id(token) for token in tokens}))
+        for tid in token_ids:
+            self.postings[tid].append(vid)
+        self.forward[vid] = token_ids
+        self.signatures[version] = signature
+    
+    def remove_version(self, version: str) -> None:
+        vid = self.ids.pop(version, None)
+        if vid is None:
+            return
+        self.versions[vid] = None
+        for tid in self.forward.pop(vid):
+            posting = self.postings[tid]
+            posting.pop(bisect_left(posting, vid))
+        self.signatures.pop(version, None)
+    
+    def candidates(self, tokens: Iterable[str]) -> Set[str]:
+        postings: List[array] = []
+        for token in set(tokens):
+            tid = self.tokens.get(token)
+            if tid is None:
+                return set()
+            postings.append(self.postings[tid])
+        if len(postings) == 0:
+            return set(self.ids)
+        # * Starts from the shortest posting, probing much longer ones instead of walking them
+        postings.sort(key=len)
+        vids = set(postings[0])
+        for posting in postings[1:]:
+            if len(vids) * PROBE_RATIO < len(posting):
+                vids = {vid for vid in vids if contains(posting, vid)}
+            else:
+                vids.intersection_update(posting)
+        return {self.versions[vid] for vid in vids}
+    
+    def compact(self) -> None:
+        # * Drops the ids of removed and reindexed versions, which only grow until then
+        if len(self.versions) <= 2 * len(self.ids):
+            return
+        remap = {vid: idx for idx, vid in enumerate(sorted(self.ids.values()))}
+        self.versions = [self.versions[vid] for vid in sorted(self.ids.values())]
+        self.ids = {version: remap[vid] for version, vid in self.ids.items()}
+        self.forward = {remap[vid]: token_ids for vid, token_ids in self.forward.items()}
+        self.postings = [array('I', (remap[vid] for vid in posting)) for posting in self.postings]
+    
+    def follow(self, filepath: str) -> int:
+        # * Applies the versions writers logged since the digest of this index, in the order they were written
+        applied = 0
+        try:
+            with open(filepath, 'r', encoding='utf-8') as file:
+                for line in file:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        break
+                    if (self.digest is None) or (entry['before'] != self.digest):
+                        continue
+                    for version, indexed in entry['versions'].items():
+                        if indexed is None:
+                            self.remove_version(version)
+                        else:
+                            self.index_tokens(version, indexed[1], indexed[0])
+                    self.digest = entry['after']
+                    applied += 1
+        except OSError:
+            pass
+        return applied
+    
+    # ! Persistence Methods
+    @classmethod
+    def load(cls, filepath: str) -> Optional['SearchIndex']:
+        # * A JSON header and the raw postings, a few large arrays load much faster than one per token and one per version
+        try:
+            with open(filepath, 'rb') as file:
+                header = json.loads(file.readline())
+                body = file.read()
+            if (
+                (header['format'] != SEARCH_FORMAT_VERSION) or \
+                (header['itemsize'] != array('I').itemsize) or \
+                (header['byteorder'] != sys.byteorder)
+            ):
+                return None
+            sections: List[array] = []
+            offset = 0
+            for length in header['sections']:
+                section = array('I')
+                section.frombytes(body[offset:offset + length * section.itemsize])
+                offset += length * section.itemsize
+                sections.append(section)
+            if (offset != len(body)) or (len(sections) != 5):
+                return None
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        posting_lengths, posting_values, forward_vids, forward_lengths, forward_values = sections
+        index = cls()
+        index.tokens = dict(zip(header['tokens'], count()))
+        index.postings = unflatten(posting_lengths, posting_values)
+        index.versions = header['versions']
+        # * The slots of removed versions are None, so they all collapse into one key
+        index.ids = dict(zip(index.versions, count()))
+        index.ids.pop(None, None)
+        index.forward = dict(zip(forward_vids, unflatten(forward_lengths, forward_values)))
+        index.signatures = dict(zip(index.versions, header['signatures']))
+        index.signatures.pop(None, None)
+        index.digest = header['digest']
+        return index
+    
+    def save(self, filepath: str) -> None:
+        self.compact()
+        sections = [
+            *flatten(self.postings),
+            array('I', self.forward),
+            *flatten(self.forward.values())
+        ]
+        header = {
+            'format': SEARCH_FORMAT_VERSION,
+            'itemsize': array('I').itemsize,
+            'byteorder': sys.byteorder,
+            'sections': [len(section) for section in sections],
+            'tokens': list(self.tokens),
+            'versions': self.versions,
+            'signatures': [self.signatures.get(version) for version in self.versions],
+            'digest': self.digest
+        }
+        temppath = filepath + '.tmp'
+        try:
+            with open(temppath, 'wb') as file:
+                file.write(json.dumps(header, ensure_ascii=False, separators=(',', ':')).encode('utf-8') + b'\n')
+                for section in sections:
+                    section.tofile(file)
+            os.replace(temppath, filepath)
+        except OSError:
+            pass
+    
+    # ! Private Methods
+    def __token_id(self, token: str) -> int:
+        tid = self.tokens.get(token)
+        if tid is None:
+            tid = self.tokens[token] = len(self.postings)
+            self.postings.append(array('I'))
+        return tid
@@ -0,0 +1,70 @@
+from datetime import datetime
+# > Typing
+from typing import NamedTuple, Optional, Union, Mapping, Iterable, Tuple, Set, List, Any
+# > Local Imports
+from .models import ChangeLog, Version, version_header
+from .index import VersionIndex
+
+# ! Type Alias
+DateType = Union[int, float, datetime]
+
+# ! Version Filter
+class VersionFilter(NamedTuple):
+    start: Optional[str]=None
+    end: Optional[str]=None
+    after: Optional[str]=None
+    since_date: Optional[DateType]=None
+    tags: Tuple[str, ...]=()
+    last: Optional[int]=None
+    types: Tuple[str, ...]=()
+    exclude_types: Tuple[str, ...]=()
+    
+    @property
+    def filters_versions(self) -> bool:
+        bounds = (self.start, self.end, self.after, self.since_date, self.last)
+        return any(bound is not None for bound in bounds) or (len(self.tags) > 0)
+    
+    @property
+    def filters_changes(self) -> bool:
+        return (len(self.types) > 0) or (len(self.exclude_types) > 0)
+
+# ! Methods
+def timestamp(date: DateType) -> float:
+    return date.timestamp() if isinstance(date, datetime) else float(date)
+
+def select_versions(versions: Mapping[str, Any], index: VersionIndex, selection: VersionFilter) -> List[str]:
+    # * Works on the version index and on the date and tag of each candidate, so excluded versions are never materialized
+    candidates = index.between(selection.start, selection.end, selection.after)
+    since = None if selection.since_date is None else timestamp(selection.since_date)
+    tags = set(selection.tags)
+    if (since is None) and (len(tags) == 0):
+        return candidates if selection.last is None else candidates[max(len(candidates) - selection.last, 0):]
+    selected: List[str] = []
+    for version in reversed(candidates):
+        if (selection.last is not None) and (len(selected) >= selection.last):
+            break
+        date, tag = version_header(versions, version)
+        if ((since is None) or (date >= since)) and ((len(tags) == 0) or (tag in tags)):
+            selected.append(version)
+    selected.reverse()
+    return selected
+
+def change_selected(change: Any, types: Set[str], exclude_types: Set[str]) -> bool:
+    return ((len(types) == 0) or (change.type in types)) and (change.type not in exclude_types)
+
+def select_changes(version: Version, types: Iterable[str], exclude_types: Iterable[str]) -> Version:
+    types, exclude_types = set(types), set(exclude_types)
+    changes = [change for change in version.changes if change_selected(change, types, exclude_types)]
+    return version.model_copy(update={'changes': changes})
+
+def select(data: ChangeLog, index: VersionIndex, selection: VersionFilter) -> ChangeLog:
+    selected = set(select_versions(data.versions, index, selection))
+    versions = {}
+    # * Walks only the keys, to keep the order of the changelog
+    for key in data.versions:
+        if key in selected:
+            version = data.versions[key]
+            if selection.filters_changes:
+                version = select_changes(version, selection.types, selection.exclude_types)
+            versions[key] = version
+    return data.model_copy(update={'versions': versions})
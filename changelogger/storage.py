@@ -0,0 +1,179 @@
+import os
+from urllib.parse import quote
+# > PyYAML
+import yaml
+try:
+    from yaml import CLoader as Loader, CDumper as Dumper
+except:
+    from yaml import Loader, Dumper
+# > Typing
+from typing import Optional, Iterable, Tuple, Dict, List, Any
+# > Local Imports
+from .models import ChangeLog, Version, LazyVersions, Shard, version_header, DEFAULT_CHANGELOG_DATA
+from .locking import temp_path
+
+# ! Type Alias
+FileStat = Tuple[int, int]
+
+# ! Constants
+SHARDED_SUFFIX = '.d'
+INDEX_FILENAME = 'index.yaml'
+VERSIONS_DIRNAME = 'versions'
+SHARD_SUFFIX = '.yaml'
+# * Methods whose first argument is the only version they touch
+VERSION_METHODS = ('add_version', 'remove_version', 'add_change', 'remove_change', 'edit_change', 'sort_changes')
+# * Methods that only change the index
+INDEX_METHODS = ('sort_versions', 'add_change_type', 'remove_change_type', 'set_change_types', 'set_exporter_extra')
+
+# ! Methods
+def is_sharded(filepath: str) -> bool:
+    return os.path.isdir(filepath) or filepath.endswith(SHARDED_SUFFIX)
+
+def file_stat(filepath: str) -> Optional[FileStat]:
+    try:
+        stat = os.stat(filepath)
+    except FileNotFoundError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+def write_atomic(filepath: str, content: str, fsync: bool=False) -> os.stat_result:
+    temppath = temp_path(filepath)
+    try:
+        with open(temppath, 'w') as file:
+            file.write(content)
+            file.flush()
+            if fsync:
+                os.fsync(file.fileno())
+            stat = os.fstat(file.fileno())
+        os.replace(temppath, filepath)
+    except BaseException:
+        if os.path.exists(temppath):
+            os.remove(temppath)
+        raise
+    return stat
+
+def header_of(date: float, tag: str) -> str:
+    # * A single scalar per version, which parses much faster than a nested mapping
+    return f'{float(date)!r} {tag}'
+
+def shard_of(version: str, header: Any) -> Shard:
+    date, _, tag = str(header).partition(' ')
+    try:
+        return Shard(version, float(date), tag)
+    except ValueError:
+        return Shard(version)
+
+def affected_versions(records: Iterable[Dict[str, Any]]) -> Tuple[List[str], bool, bool]:
+    # * Returns the versions to rewrite, whether the index changes and whether every loaded version may have changed
+    versions: Dict[str, None] = {}
+    index = full = False
+    for record in records:
+        method = record['method']
+        if method in VERSION_METHODS:
+            versions[record['args'][0]] = None
+            index = index or (method in ('add_version', 'remove_version'))
+        elif method in INDEX_METHODS:
+            index = True
+        else:
+            index = full = True
+    return list(versions), index, full
+
+# ! Sharded Storage Class
+class ShardedStorage:
+    def __init__(self, dirpath: str) -> None:
+        self.dirpath = dirpath
+        self.indexpath = os.path.join(dirpath, INDEX_FILENAME)
+        self.versionspath = os.path.join(dirpath, VERSIONS_DIRNAME)
+        self.stats: Dict[str, Optional[FileStat]] = {}
+    
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({repr(self.dirpath)})'
+    
+    def __deepcopy__(self, memo: Dict[int, Any]) -> 'ShardedStorage':
+        # * Copies of lazy versions keep reading from the same directory
+        return self
+    
+    # ! Main Methods
+    def exists(self) -> bool:
+        return os.path.isfile(self.indexpath)
+    
+    def shard_path(self, version: str) -> str:
+        return os.path.join(self.versionspath, quote(version, safe='.-_+') + SHARD_SUFFIX)
+    
+    def read(self, filepath: str) -> Any:
+        with open(filepath, 'rb') as file:
+            content = file.read()
+            stat = os.fstat(file.fileno())
+        self.stats[filepath] = (stat.st_size, stat.st_mtime_ns)
+        data = yaml.load(content.decode('utf-8', errors='ignore'), Loader=Loader)
+        return data
+    
+    def write(self, filepath: str, data: Any) -> None:
+        stat = write_atomic(filepath, yaml.dump(data, Dumper=Dumper, sort_keys=False))
+        self.stats[filepath] = (stat.st_size, stat.st_mtime_ns)
+    
+    def remove(self, filepath: str) -> None:
+        try:
+            os.remove(filepath)
+        except FileNotFoundError:
+            pass
+        self.stats[filepath] = None
+    
+    def load_version(self, shard: Shard) -> Version:
+        return Version.model_validate(self.read(self.shard_path(shard.version)))
+    
+    def load(self, previous: Optional[ChangeLog]=None) -> ChangeLog:
+        if not self.exists():
+            self.save(ChangeLog.model_validate(DEFAULT_CHANGELOG_DATA))
+        index = self.read(self.indexpath)
+        versions = index.pop('versions', None) or []
+        if isinstance(versions, dict):
+            shards = {version: shard_of(version, header) for version, header in versions.items()}
+        else:
+            shards = {version: Shard(version) for version in versions}
+        if previous is not None:
+            # * Versions read earlier are reused while their shards did not change
+            for version in self.materialized(previous):
+                filepath = self.shard_path(version)
+                if (version in shards) and (self.stats.get(filepath) is not None) and (file_stat(filepath) == self.stats[filepath]):
+                    shards[version] = previous.versions[version]
+        changelog = ChangeLog.model_validate({**index, 'versions': {}})
+        changelog.versions = LazyVersions(shards, self.load_version)
+        return changelog
+    
+    def save_index(self, data: ChangeLog) -> None:
+        # * Dates and tags are kept in the index, so that versions can be filtered without reading their shards
+        index = data.model_dump(exclude={'versions'}, warnings=False)
+        index['versions'] = {version: header_of(*version_header(data.versions, version)) for version in data.versions}
+        self.write(self.indexpath, index)
+    
+    def save_versions(self, data: ChangeLog, versions: Iterable[str]) -> int:
+        os.makedirs(self.versionspath, exist_ok=True)
+        count = 0
+        for version in versions:
+            if version in data.versions:
+                self.write(self.shard_path(version), data.versions[version].model_dump(warnings=False))
+            else:
+                self.remove(self.shard_path(version))
+            count += 1
+        return count
+    
+    def materialized(self, data: ChangeLog) -> List[str]:
+        if isinstance(data.versions, LazyVersions):
+            return data.versions.materialized_keys()
+        return list(data.versions)
+    
+    def save(self, data: ChangeLog) -> None:
+        os.makedirs(self.versionspath, exist_ok=True)
+        self.save_versions(data, list(data.versions))
+        shards = {self.shard_path(version) for version in data.versions}
+        for filename in os.listdir(self.versionspath):
+            filepath = os.path.join(self.versionspath, filename)
+            if filename.endswith(SHARD_SUFFIX) and (filepath not in shards):
+                self.remove(filepath)
+        self.save_index(data)
+    
+    def stale(self, versions: Iterable[str]=()) -> bool:
+        # * A file that was never read counts as unchanged only while it does not exist
+        filepaths = [self.indexpath, *(self.shard_path(version) for version in versions)]
+        return any(file_stat(filepath) != self.stats.get(filepath) for filepath in filepaths)
@@ -1,4 +1,4 @@
-from .exporter import MarkdownTableExporter, DEFAULT_MARKDOWN_EXTRA
+from typing import Any
 
 # ! Defaults
 DEFAULT_CHANGE_TYPES = {
@@ -9,7 +9,17 @@ DEFAULT_CHANGE_TYPES = {
     'deprecate': '💀',
     'refactor': '🔁'
 }
-DEFAULT_EXPORTERS = [
-    ('markdown-table', MarkdownTableExporter, DEFAULT_MARKDOWN_EXTRA)
-]
-DEFAULT_EXPORTER = 'markdown-table'
\ No newline at end of file
+DEFAULT_EXPORTER = 'markdown-table'
+DEFAULT_JOURNAL_LIMIT = 1024 * 1024
+VERSION_PATTERN = r'v?(?:(?:(?P<epoch>[0-9]+)!)?(?P<release>[0-9]+(?:\.[0-9]+)*)(?P<pre>[-_\.]?(?P<pre_l>alpha|a|beta|b|preview|pre|c|rc)[-_\.]?(?P<pre_n>[0-9]+)?)?(?P<post>(?:-(?P<post_n1>[0-9]+))|(?:[-_\.]?(?P<post_l>post|rev|r)[-_\.]?(?P<post_n2>[0-9]+)?))?(?P<dev>[-_\.]?(?P<dev_l>dev)[-_\.]?(?P<dev_n>[0-9]+)?)?)(?:\+(?P<local>[a-z0-9]+(?:[-_\.][a-z0-9]+)*))?'
+
+# ! Lazy Defaults
+def __getattr__(name: str) -> Any:
+    # * The exporter module pulls in pydantic, so it is imported only when these are used
+    if name == 'DEFAULT_MARKDOWN_EXTRA':
+        from .exporter import DEFAULT_MARKDOWN_EXTRA
+        return DEFAULT_MARKDOWN_EXTRA
+    elif name == 'DEFAULT_EXPORTERS':
+        from .exporter import MarkdownTableExporter, DEFAULT_MARKDOWN_EXTRA
+        return [('markdown-table', MarkdownTableExporter, DEFAULT_MARKDOWN_EXTRA)]
+    raise AttributeError(f"module {repr(__name__)} has no attribute {repr(name)}")
\ No newline at end of file
@@ -0,0 +1,228 @@
+import os
+import sys
+import time
+import errno
+import ctypes
+import ctypes.util
+import select
+import struct
+import threading
+# > Typing
+from typing import Callable, Optional, Union, Iterator, Iterable, Tuple, Dict, List, Any
+# > Local Imports
+from .changelog import ChangelogFile
+from .storage import is_sharded, INDEX_FILENAME, VERSIONS_DIRNAME, SHARD_SUFFIX
+from .exporter import ExportTarget
+from .selection import VersionFilter
+
+# ! Type Alias
+# * A watched directory and the file name to react to, or a suffix when the name starts with "*"
+WatchEntry = Tuple[str, str]
+ExportCallback = Callable[[List[Tuple[ExportTarget, str]], float], None]
+ErrorCallback = Callable[[Exception], None]
+
+# ! Constants
+DEFAULT_DEBOUNCE = 0.2
+DEFAULT_POLL_INTERVAL = 0.5
+STOP_CHECK_INTERVAL = 0.5
+IN_CLOSE_WRITE = 0x008
+IN_MOVED_FROM = 0x040
+IN_MOVED_TO = 0x080
+IN_CREATE = 0x100
+IN_DELETE = 0x200
+IN_DELETE_SELF = 0x400
+IN_MOVE_SELF = 0x800
+IN_IGNORED = 0x8000
+# * Writes are seen once the file is closed or renamed into place, not on every partial write
+IN_WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF
+INOTIFY_EVENT = struct.Struct('iIII')
+INOTIFY_BUFFER_SIZE = 64 * 1024
+
+# ! Methods
+def watch_entries(filepath: str) -> List[WatchEntry]:
+    if is_sharded(filepath):
+        return [(filepath, INDEX_FILENAME), (os.path.join(filepath, VERSIONS_DIRNAME), '*' + SHARD_SUFFIX)]
+    return [os.path.split(filepath)]
+
+def matches(pattern: str, name: str) -> bool:
+    return name.endswith(pattern[1:]) if pattern.startswith('*') else (name == pattern)
+
+def dir_stat(dirpath: str, pattern: str) -> Any:
+    # * A directory's mtime changes whenever a file is renamed into it, which covers atomic writes of any shard
+    target = dirpath if pattern.startswith('*') else os.path.join(dirpath, pattern)
+    try:
+        stat = os.stat(target)
+    except FileNotFoundError:
+        return None
+    return stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+# ! Polling Watcher
+class PollingWatcher:
+    def __init__(self, entries: Iterable[WatchEntry], interval: float=DEFAULT_POLL_INTERVAL) -> None:
+        self.entries = list(entries)
+        self.interval = interval
+        self.__stats = self.__snapshot()
+    
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self.entries}, {self.interval})'
+    
+    def __enter__(self) -> 'PollingWatcher':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
+    # ! Main Methods
+    def wait(self, timeout: Optional[float]=None) -> bool:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            stats = self.__snapshot()
+            if stats != self.__stats:
+                self.__stats = stats
+                return True
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                time.sleep(min(self.interval, remaining))
+            else:
+                time.sleep(self.interval)
+    
+    def close(self) -> None:
+        pass
+    
+    # ! Private Methods
+    def __snapshot(self) -> List[Any]:
+        return [dir_stat(dirpath, pattern) for dirpath, pattern in self.entries]
+
+# ! Inotify Watcher
+class InotifyWatcher:
+    def __init__(self, entries: Iterable[WatchEntry]) -> None:
+        self.entries = list(entries)
+        libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        self.__add_watch = libc.inotify_add_watch
+        self.__add_watch.argtypes = (ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32)
+        self.__fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.__fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+        self.__watches: Dict[int, str] = {}
+        try:
+            for dirpath, pattern in self.entries:
+                self.__watch(dirpath, pattern)
+        except BaseException:
+            self.close()
+            raise
+    
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self.entries})'
+    
+    def __enter__(self) -> 'InotifyWatcher':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
+    # ! Main Methods
+    def wait(self, timeout: Optional[float]=None) -> bool:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = None if deadline is None else max(deadline - time.monotonic(), 0.0)
+            readable, _, _ = select.select([self.__fd], [], [], remaining)
+            if len(readable) == 0:
+                return False
+            if self.__read():
+                return True
+    
+    def close(self) -> None:
+        if self.__fd >= 0:
+            os.close(self.__fd)
+            self.__fd = -1
+    
+    # ! Private Methods
+    def __watch(self, dirpath: str, pattern: str) -> None:
+        wd = self.__add_watch(self.__fd, os.fsencode(dirpath), IN_WATCH_MASK)
+        if wd < 0:
+            error = ctypes.get_errno()
+            raise OSError(error, os.strerror(error), dirpath)
+        self.__watches[wd] = pattern
+    
+    def __read(self) -> bool:
+        try:
+            buffer = os.read(self.__fd, INOTIFY_BUFFER_SIZE)
+        except BlockingIOError:
+            return False
+        changed = False
+        offset = 0
+        while offset < len(buffer):
+            wd, mask, _, length = INOTIFY_EVENT.unpack_from(buffer, offset)
+            offset += INOTIFY_EVENT.size
+            name = os.fsdecode(buffer[offset:offset + length].rstrip(b'\0'))
+            offset += length
+            pattern = self.__watches.get(wd)
+            if mask & (IN_DELETE_SELF | IN_MOVE_SELF | IN_IGNORED):
+                # * The watched directory itself is gone, so nothing can be seen through it anymore
+                raise FileNotFoundError(errno.ENOENT, 'The watched directory was removed.')
+            if (pattern is not None) and matches(pattern, name):
+                changed = True
+        return changed
+
+def open_watcher(filepath: str, interval: float=DEFAULT_POLL_INTERVAL, polling: bool=False) -> Union[InotifyWatcher, PollingWatcher]:
+    entries = watch_entries(os.path.abspath(filepath))
+    if (not polling) and sys.platform.startswith('linux'):
+        try:
+            return InotifyWatcher(entries)
+        except (OSError, AttributeError, TypeError):
+            pass
+    return PollingWatcher(entries, interval)
+
+def watch_changes(
+    filepath: str,
+    debounce: float=DEFAULT_DEBOUNCE,
+    interval: float=DEFAULT_POLL_INTERVAL,
+    stop: Optional[threading.Event]=None,
+    polling: bool=False
+) -> Iterator[None]:
+    # * Yields once per burst of writes, after no write was seen for the debounce time
+    with open_watcher(filepath, interval, polling) as watcher:
+        while (stop is None) or not stop.is_set():
+            if not watcher.wait(STOP_CHECK_INTERVAL if stop is not None else None):
+                continue
+            while watcher.wait(debounce):
+                pass
+            yield
+
+def watch_export(
+    changelog: ChangelogFile,
+    targets: Iterable[Tuple[ExportTarget, str]],
+    selection: Optional[VersionFilter]=None,
+    debounce: float=DEFAULT_DEBOUNCE,
+    interval: float=DEFAULT_POLL_INTERVAL,
+    stop: Optional[threading.Event]=None,
+    polling: bool=False,
+    on_export: Optional[ExportCallback]=None,
+    on_error: Optional[ErrorCallback]=None
+) -> None:
+    targets = list(targets)
+    
+    def export() -> None:
+        start = time.perf_counter()
+        for target, format in targets:
+            changelog.export(target, format, selection)
+        if on_export is not None:
+            on_export(targets, time.perf_counter() - start)
+    
+    export()
+    for _ in watch_changes(changelog.filepath, debounce, interval, stop, polling):
+        try:
+            if not changelog.changed():
+                continue
+            digest = changelog.digest
+            changelog.reload()
+            # * Touched or rewritten with the same content
+            if (digest is not None) and (changelog.digest == digest):
+                continue
+            export()
+        except Exception as e:
+            if on_error is None:
+                raise
+            on_error(e)
@@ -0,0 +1,39 @@
+import os
+import pytest
+# > Typing
+from typing import List
+# > Local Imports
+from changelogger import ChangelogFile
+
+# ! Constants
+WRITE_PHASES = ('dump.write', 'dump.shards', 'journal.append')
+
+# ! Tests
+@pytest.mark.parametrize('filename,options', [
+    ('changelog.yaml', {}),
+    ('changelog.yaml', {'journal': True}),
+    ('changelog.d', {})
+])
+def test_new_changelog_is_written_once(tmp_path, filename, options):
+    filepath = str(tmp_path / filename)
+    writes: List[str] = []
+    listener = lambda event: writes.append(event.name) if event.name in WRITE_PHASES else None
+    ChangelogFile(filepath, listeners=[listener], **options)
+    assert len(writes) == 1
+    assert os.path.exists(filepath)
+    writes.clear()
+    ChangelogFile(filepath, listeners=[listener], **options)
+    assert writes == []
+
+def test_lazy_search_materializes_only_hits(tmp_path):
+    filepath = str(tmp_path / 'changelog.yaml')
+    changelog = ChangelogFile(filepath)
+    with changelog.deferred():
+        for version in range(50):
+            changelog.add_version(f'1.{version}.0', 0.0, '', 'release')
+            changelog.add_change(f'1.{version}.0', 'add', 'needle' if version == 7 else f'change of 1.{version}.0')
+    for _ in range(2):
+        # * Once with a new index and once with the saved one
+        lazy = ChangelogFile(filepath, lazy=True)
+        assert [hit.version for hit in lazy.search('needle')] == ['1.7.0']
+        assert lazy.data.versions.materialized == 1
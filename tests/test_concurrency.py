@@ -0,0 +1,69 @@
+import os
+import multiprocessing
+import pytest
+# > Typing
+from typing import Any, Dict
+# > Local Imports
+from changelogger import ChangelogFile
+from changelogger.journal import Journal, journal_path
+
+# ! Constants
+VERSION = '1.0.0'
+WORKERS = 4
+COUNT = 15
+
+# ! Methods
+def description(worker: int, idx: int) -> str:
+    return f'worker {worker} change {idx}'
+
+def worker(filepath: str, options: Dict[str, Any], locked: bool, worker_idx: int, barrier) -> None:
+    barrier.wait()
+    # * One long-lived instance per worker, so that most writes start from a stale state
+    changelog = ChangelogFile(filepath, **options)
+    for idx in range(COUNT):
+        if locked:
+            with changelog.locked():
+                changelog.add_change(VERSION, 'add', description(worker_idx, idx))
+        else:
+            changelog.add_change(VERSION, 'add', description(worker_idx, idx))
+
+def run_writers(filepath: str, options: Dict[str, Any], locked: bool=False) -> None:
+    ChangelogFile(filepath).add_version(VERSION, 0.0, '', 'release')
+    barrier = multiprocessing.Barrier(WORKERS)
+    processes = [
+        multiprocessing.Process(target=worker, args=(filepath, options, locked, idx, barrier))
+        for idx in range(WORKERS)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+    assert [process.exitcode for process in processes] == [0] * WORKERS
+
+def kept_changes(filepath: str, **options: Any) -> int:
+    changes = ChangelogFile(filepath, cache=False, strict=True, **options).data.versions[VERSION].changes
+    expected = {description(worker_idx, idx) for worker_idx in range(WORKERS) for idx in range(COUNT)}
+    found = [change.description for change in changes]
+    assert len(found) == len(set(found))
+    return len(expected & set(found))
+
+# ! Tests
+@pytest.mark.parametrize('locked', [False, True])
+def test_concurrent_writers_keep_every_change(tmp_path, locked):
+    filepath = str(tmp_path / 'changelog.yaml')
+    run_writers(filepath, {}, locked)
+    assert kept_changes(filepath) == WORKERS * COUNT
+
+def test_concurrent_journal_writers(tmp_path):
+    filepath = str(tmp_path / 'changelog.yaml')
+    run_writers(filepath, {'journal': True})
+    seqs = [record['seq'] for record in Journal(journal_path(filepath)).read()]
+    assert seqs == sorted(set(seqs))
+    assert kept_changes(filepath, journal=True) == WORKERS * COUNT
+
+def test_concurrent_journal_writers_with_compaction(tmp_path):
+    filepath = str(tmp_path / 'changelog.yaml')
+    # * A tiny limit makes every writer compact while the others keep appending
+    run_writers(filepath, {'journal': True, 'journal_limit': 512})
+    assert kept_changes(filepath, journal=True) == WORKERS * COUNT
+    assert os.path.getsize(filepath) > 0
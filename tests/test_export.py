@@ -0,0 +1,81 @@
+import os
+import threading
+# > Typing
+from typing import List
+# > Local Imports
+from changelogger import ChangelogFile, DEFAULT_EXPORTER
+from changelogger.exporter import render_cache_path
+
+# ! Methods
+def filled_changelog(filepath: str, versions: int=3, changes: int=5) -> ChangelogFile:
+    changelog = ChangelogFile(filepath)
+    with changelog.deferred():
+        for version in range(versions):
+            changelog.add_version(f'1.{version}.0', 0.0, '', 'release')
+            for idx in range(changes):
+                changelog.add_change(f'1.{version}.0', 'add', f'change {idx} of 1.{version}.0')
+    return changelog
+
+# ! Tests
+def test_concurrent_exports_to_one_target(tmp_path):
+    changelog = filled_changelog(str(tmp_path / 'changelog.yaml'))
+    target = str(tmp_path / 'CHANGELOG.md')
+    errors = []
+    
+    def export() -> None:
+        try:
+            for _ in range(20):
+                changelog.export(target)
+        except Exception as e:
+            errors.append(e)
+    
+    threads = [threading.Thread(target=export) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+    assert [filename for filename in os.listdir(tmp_path) if filename.endswith('.tmp')] == []
+    with open(target, encoding='utf-8') as file:
+        assert file.read().count('change 4 of 1.2.0') == 1
+
+def test_export_many_writes_a_file_once(tmp_path):
+    changelog = filled_changelog(str(tmp_path / 'changelog.yaml'))
+    target = tmp_path / 'CHANGELOG.md'
+    relative = os.path.relpath(target)
+    results = changelog.export_many([(str(target), DEFAULT_EXPORTER), (relative, DEFAULT_EXPORTER), (target, 'other')], processes=False)
+    assert [result.target for result in results] == [str(target), relative, target]
+    assert results[0].ok and results[1].ok
+    assert isinstance(results[2].error, ValueError)
+    with open(target, encoding='utf-8') as file:
+        assert file.read().count('change 4 of 1.2.0') == 1
+
+def test_render_cache_reuses_unchanged_rows(tmp_path):
+    hits: List[int] = []
+    listener = lambda event: hits.append(event.count) if event.name == 'export.cache' else None
+    changelog = ChangelogFile(str(tmp_path / 'changelog.yaml'), listeners=[listener])
+    with changelog.deferred():
+        for version in range(4):
+            changelog.add_version(f'1.{version}.0', 0.0, '', 'release')
+            changelog.add_change(f'1.{version}.0', 'fix' if version == 0 else 'add', f'change of 1.{version}.0')
+    target = str(tmp_path / 'CHANGELOG.md')
+    exporter = changelog.exporters[DEFAULT_EXPORTER]
+    
+    def export() -> int:
+        changelog.export(target)
+        with open(target, encoding='utf-8') as file:
+            assert file.read() == exporter.render(changelog.data)
+        return hits[-1]
+    
+    assert export() == 0
+    assert export() == 4
+    changelog.edit_change('1.2.0', 0, None, 'edited change')
+    assert export() == 3
+    changelog.set_change_types({**changelog.data.change_types, 'fix': '*'})
+    assert export() == 3
+    changelog.remove_version('1.3.0')
+    assert export() == 3
+    with open(render_cache_path(target), encoding='utf-8') as file:
+        assert len(file.readlines()) == 1 + 3
+    changelog.set_exporter_extra(DEFAULT_EXPORTER, {'change_sep': ', '}, reinit=True)
+    assert export() == 0
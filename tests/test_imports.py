@@ -0,0 +1,26 @@
+import sys
+import json
+import subprocess
+# > Typing
+from typing import List
+
+# ! Constants
+HEAVY_MODULES = ('yaml', 'pydantic', 'concurrent.futures', 'rich', 'rich_click', 'click', 'asyncio', 'multiprocessing')
+
+# ! Methods
+def imported_after(statement: str) -> List[str]:
+    # * A fresh interpreter, the test process itself has already imported everything
+    probe = f'import sys, json; {statement}; print(json.dumps(sorted(sys.modules)))'
+    output = subprocess.run([sys.executable, '-c', probe], check=True, capture_output=True, text=True).stdout
+    return json.loads(output)
+
+# ! Tests
+def test_cli_import_is_light():
+    modules = set(imported_after('import changelogger.cli'))
+    eager = [module for module in HEAVY_MODULES if module in modules]
+    assert eager == [], f'changelogger.cli imports {", ".join(eager)} eagerly'
+
+def test_package_import_is_light():
+    modules = set(imported_after('import changelogger'))
+    eager = [module for module in HEAVY_MODULES if module in modules]
+    assert eager == [], f'changelogger imports {", ".join(eager)} eagerly'
@@ -0,0 +1,38 @@
+import os
+import pytest
+# > Typing
+from typing import List
+# > Local Imports
+from changelogger import ChangelogFile, JournalCorruptedError
+from changelogger.journal import journal_path
+
+# ! Methods
+def written_journal(filepath: str, count: int) -> List[bytes]:
+    changelog = ChangelogFile(filepath, journal=True)
+    changelog.add_version('1.0.0', 0.0, '', 'release')
+    for idx in range(count):
+        changelog.add_change('1.0.0', 'add', f'change {idx}')
+    with open(journal_path(filepath), 'rb') as file:
+        return file.readlines()
+
+# ! Tests
+def test_recover_drops_torn_tail(tmp_path):
+    filepath = str(tmp_path / 'changelog.yaml')
+    lines = written_journal(filepath, 3)
+    with open(journal_path(filepath), 'ab') as file:
+        file.write(lines[-1][:10])
+    changelog = ChangelogFile(filepath, journal=True)
+    assert [change.description for change in changelog.data.versions['1.0.0'].changes] == ['change 0', 'change 1', 'change 2']
+    assert os.path.getsize(journal_path(filepath)) == sum(map(len, lines))
+
+def test_recover_keeps_damaged_journal(tmp_path):
+    filepath = str(tmp_path / 'changelog.yaml')
+    lines = written_journal(filepath, 3)
+    damaged = b''.join([lines[0], b'00000000\t{}\n', *lines[2:]])
+    with open(journal_path(filepath), 'wb') as file:
+        file.write(damaged)
+    with pytest.raises(JournalCorruptedError) as error:
+        ChangelogFile(filepath, journal=True)
+    assert error.value.offset == len(lines[0])
+    with open(journal_path(filepath), 'rb') as file:
+        assert file.read() == damaged